@@ -0,0 +1,113 @@
+"""
+Columnar Parse Benchmark Script
+
+This script compares the two ways PDFProcessor parses equipment candidates:
+one at a time with parse_equipment_item (one EquipmentItem per candidate)
+and in one batch with parse_equipment_items (one DataFrame for all of them,
+built with vectorized string operations).
+
+The candidates are those found in the bundled corpus (or the given files),
+repeated --copies times to simulate a larger corpus with recurring
+boilerplate. The per-item path is timed with and without its parse cache;
+the batch path parses each distinct candidate once. The script checks that
+all of them give the same items (exiting with status 1 otherwise) and
+reports the time and peak memory of each.
+
+Usage: python benchmarks/columnar_parse_benchmark.py [--copies N] [FILE ...]
+
+FILE can be a PDF or an extracted_text.txt file; by default every
+data/*/extracted_text.txt file is used.
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import pandas as pd
+
+# Add the repository root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from pdf_processor import PDFProcessor
+from pdf_text import extract_page_texts
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+def load_pages(path):
+    """Load the page texts of a PDF, or a text file as a single page."""
+    if path.suffix.lower() == ".pdf":
+        return extract_page_texts(path)
+    return [path.read_text(encoding='utf-8')]
+
+def collect_candidates(processor, paths):
+    """Return the (text, quantity, equipment_type) candidates of every document."""
+    candidates = []
+    for path in paths:
+        for equipment_type, section in processor.iter_typed_sections(load_pages(path)):
+            if processor.prefilter and not processor.is_relevant_section(section):
+                continue
+            for text, quantity in processor.iter_section_candidates(section):
+                candidates.append((text, quantity, equipment_type))
+    return candidates
+
+def measure(function):
+    """Run function, returning (result, seconds, peak MB allocated).
+    
+    The memory is measured on a first run, which also compiles the patterns
+    involved, and the time on a second one, as tracing slows it down.
+    """
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    start_time = time.perf_counter()
+    result = function()
+    seconds = time.perf_counter() - start_time
+    return result, seconds, peak / 1024 / 1024
+
+def main():
+    """Run the columnar parse benchmark."""
+    parser = argparse.ArgumentParser(description="Compare per-item and batch parsing of equipment candidates.")
+    parser.add_argument("files", nargs="*", type=Path,
+                        help="PDF or text files (default: data/*/extracted_text.txt)")
+    parser.add_argument("--copies", type=int, default=20,
+                        help="times the candidates are repeated (default: 20)")
+    args = parser.parse_args()
+    
+    paths = args.files or sorted(DATA_DIR.glob("*/extracted_text.txt"))
+    candidates = collect_candidates(PDFProcessor(), paths) * args.copies
+    texts, quantities, equipment_types = (list(column) for column in zip(*candidates))
+    print(f"{len(candidates)} candidates from {len(paths)} documents x {args.copies}")
+    
+    def parse_each(parse_cache_size):
+        processor = PDFProcessor(parse_cache_size=parse_cache_size)
+        items = [processor.parse_equipment_item(*candidate) for candidate in candidates]
+        return [item for item in items if item]
+    
+    def parse_batch():
+        return PDFProcessor().parse_equipment_items(texts, quantities, equipment_types)
+    
+    items, item_seconds, item_peak = measure(lambda: parse_each(0))
+    cached, cached_seconds, cached_peak = measure(lambda: parse_each(4096))
+    frame, frame_seconds, frame_peak = measure(parse_batch)
+    
+    print(f"\n{'path':<34} {'items':>8} {'time':>10} {'peak memory':>12}")
+    for name, count, seconds, peak in [
+        ("parse_equipment_item", len(items), item_seconds, item_peak),
+        ("parse_equipment_item (cached)", len(cached), cached_seconds, cached_peak),
+        ("parse_equipment_items", len(frame), frame_seconds, frame_peak),
+    ]:
+        print(f"{name:<34} {count:>8} {seconds * 1000:>8.1f}ms {peak:>10.1f}MB")
+    print(f"Speedup: {item_seconds / frame_seconds:.2f}x uncached, {cached_seconds / frame_seconds:.2f}x cached")
+    
+    rows = [{field: value for field, value in record.items() if not pd.isna(value)}
+            for record in frame.to_dict('records')]
+    items = [item.to_dict() for item in items]
+    cached = [item.to_dict() for item in cached]
+    if not rows == items == cached:
+        print("MISMATCH: the batch parse differs from the per-item parse")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Equipment Item Benchmark Script
+
+This script measures the memory taken by each equipment item as it moves
+through the pipeline, comparing the item dicts used before with
+EquipmentItem (see equipment_item.py), at two stages: as parsed by
+PDFProcessor.iter_equipment_items and as standardized by
+DataStandardizer.standardize_venue_data.
+
+The items of the bundled corpus are copied up to --items items in each
+layout and the memory allocated for the copies is traced with tracemalloc.
+The copies share their field values, so this is the cost of the container
+per item; the values (the same strings in both layouts) are reported apart.
+Every item must convert to a dict and back unchanged (the script exits
+with status 1 otherwise).
+
+Usage: python benchmarks/equipment_item_benchmark.py [--items N]
+"""
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+
+# Add the repository root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from data_standardizer import DataStandardizer
+from equipment_item import EquipmentItem
+from pdf_processor import PDFProcessor
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+def load_items():
+    """Return the parsed and the standardized EquipmentItems of the corpus."""
+    processor = PDFProcessor()
+    standardizer = DataStandardizer()
+    parsed, standardized = [], []
+    for path in sorted(DATA_DIR.glob("*/extracted_text.txt")):
+        items = list(processor.iter_equipment_items([path.read_text(encoding='utf-8')]))
+        venue = standardizer.standardize_venue_data({
+            'venue_name': path.parent.name, 'pdf_source': str(path), 'equipment': items
+        })
+        parsed.extend(items)
+        standardized.extend(venue['equipment'])
+    return parsed, standardized
+
+def bytes_per_item(items, count, build):
+    """Return the bytes allocated per item for count copies made with build."""
+    gc.collect()
+    tracemalloc.start()
+    copies = [build(items[index % len(items)]) for index in range(count)]
+    allocated = tracemalloc.get_traced_memory()[0] - sys.getsizeof(copies)
+    tracemalloc.stop()
+    return allocated / count
+
+def value_bytes_per_item(items):
+    """Return the average size of the field values of an item."""
+    return sum(sys.getsizeof(value) for item in items for _, value in item.items()) / len(items)
+
+def main():
+    """Run the equipment item benchmark."""
+    parser = argparse.ArgumentParser(description="Measure the memory per equipment item, as dict and as EquipmentItem.")
+    parser.add_argument("--items", type=int, default=1_000_000,
+                        help="items to build in each layout (default: 1000000)")
+    args = parser.parse_args()
+    
+    parsed, standardized = load_items()
+    print(f"{len(parsed)} parsed and {len(standardized)} standardized corpus items, copied to {args.items}")
+    
+    print(f"\n{'stage':<14} {'dict':>9} {'EquipmentItem':>14} {'saved':>7} {'values':>9}")
+    for stage, items in [("parsed", parsed), ("standardized", standardized)]:
+        if any(EquipmentItem.from_dict(item.to_dict()) != item for item in items):
+            print(f"MISMATCH: the {stage} items differ between the two layouts")
+            sys.exit(1)
+        dict_bytes = bytes_per_item(items, args.items, lambda item: item.to_dict())
+        slot_bytes = bytes_per_item(items, args.items, lambda item: item.copy())
+        print(f"{stage:<14} {dict_bytes:>7.0f} B {slot_bytes:>12.0f} B {1 - slot_bytes / dict_bytes:>6.0%} "
+              f"{value_bytes_per_item(items):>7.0f} B")
+    print("(dict and EquipmentItem: bytes per item for the container; values: the field strings, shared by both)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+Equipment Lists Benchmark Script
+
+This script times extract_venue_info.extract_equipment_lists against the
+regex scan it replaced (a DOTALL section pattern per keyword, then list and
+table patterns that could backtrack over the whole document).
+
+Each bundled extracted_text.txt file is timed once with both, then both are
+run on generated pathological inputs of growing size:
+
+- prose: long paragraphs without any heading
+- numbered: thousands of numbered lines under a lighting heading
+- spaces: table-like lines padded with long runs of whitespace
+
+For linear-time code the time per KB stays flat as the input grows. The
+legacy scan is skipped above --legacy-max-kb.
+
+Before timing, iter_table_rows is checked on a table of contents followed by
+an equipment table (as in the SOH Concert Hall spec): the contents entries
+must give no rows and the table the rows listed in CONTENTS_AND_TABLE_ROWS.
+The script exits with status 1 otherwise.
+
+Usage: python benchmarks/equipment_lists_benchmark.py [--max-kb N] [FILE ...]
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add the repository root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from extract_venue_info import extract_equipment_lists, iter_table_rows
+
+# The patterns previously used by extract_equipment_lists
+LEGACY_SECTION_KEYWORDS = [
+    "lighting equipment", "lighting inventory", "lighting fixtures", "dimmer", "lantern",
+    "sound equipment", "audio equipment", "audio inventory", "sound system", "microphone", "console", "mixing desk",
+    "video equipment", "projection", "screen", "display", "visual equipment",
+]
+LEGACY_BOUNDARY_WORDS = ["lighting", "sound", "audio", "video", "power", "rigging", "staging", "dimensions", "specifications"]
+LEGACY_LIST_PATTERNS = [
+    r"(\d+)[\.|\)](.*?)(?=(?:\d+)[\.|\)]|\Z)",
+    r"[\•|\-|\*|\–](.*?)(?=[\•|\-|\*|\–]|\Z)",
+    r"([A-Za-z\s]+):\s*(\d+)[x|\s]([A-Za-z0-9\s\-\(\)]+)",
+]
+LEGACY_QUANTITY_MODEL_PATTERNS = [
+    r"(\d+)\s*[x|×]\s*([A-Za-z0-9\s\-\(\)\'\"\.]+)",
+    r"([A-Za-z0-9\s\-\(\)\'\"\.]+)\s*:\s*(\d+)",
+    r"([A-Za-z0-9\s\-\(\)\'\"\.]+)\s*[-|–]\s*(\d+)",
+]
+LEGACY_TABLE_PATTERNS = [
+    r"([A-Za-z0-9\s\-\(\)\'\"\.]+)\s+(\d+)\s+([A-Za-z0-9\s\-\(\)\'\"\.]+)",
+    r"(\d+)\s+([A-Za-z0-9\s\-\(\)\'\"\.]+)\s+([A-Za-z0-9\s\-\(\)\'\"\.]+)",
+]
+
+# A table of contents and a lamp table, and the (model, quantity, description)
+# rows iter_table_rows must find in them: the lamp table's only
+CONTENTS_AND_TABLE = """Contents
+5 Staging 11
+6 Lighting 18
+6.1 Base Lighting Equipment 18
+6.2 Additional Lighting Equipment 20
+7 Sound & Audio Visual 21
+7.2.4 Video Replay 24
+10 Back-stage Facilities 27
+Page 18     Technical and Production Information for the Concert Hall
+Lamp Type Allocation
+ Martin Mac Viper Performance 8
+ Martin Quantum Wash 18
+FOH Bridge 2 Robert Juliat ZEP2 661SX profile spots
+"""
+CONTENTS_AND_TABLE_ROWS = [
+    ("Martin Mac Viper Performance", "8", ""),
+    ("Martin Quantum Wash", "18", ""),
+    ("FOH Bridge", "2", "Robert Juliat ZEP2 661SX profile spots"),
+]
+
+def check_table_rows():
+    """Return whether iter_table_rows finds exactly the expected rows in CONTENTS_AND_TABLE."""
+    rows = list(iter_table_rows(CONTENTS_AND_TABLE))
+    if rows == CONTENTS_AND_TABLE_ROWS:
+        print("✅ Table of contents entries give no table rows")
+        return True
+    print("❌ Unexpected table rows:")
+    for row in rows:
+        print(f"   {row}")
+    return False
+
+def legacy_scan(text):
+    """Run the legacy regex work over text and return the number of matches."""
+    count = 0
+    for keyword in LEGACY_SECTION_KEYWORDS:
+        keyword_pattern = re.compile(r"(?i)(?:^|\n).*?" + keyword + r".*?(?:\n|$)(.*?)(?=(?:^|\n).*?(?:"
+                                     + "|".join(LEGACY_BOUNDARY_WORDS) + r").*?(?:\n|$)|\Z)", re.DOTALL)
+        for section in keyword_pattern.findall(text):
+            for pattern in LEGACY_LIST_PATTERNS:
+                for match in re.findall(pattern, section, re.MULTILINE):
+                    item = match[1] if isinstance(match, tuple) else match
+                    for qm_pattern in LEGACY_QUANTITY_MODEL_PATTERNS:
+                        if re.search(qm_pattern, item.strip()):
+                            break
+                    count += 1
+    for pattern in LEGACY_TABLE_PATTERNS:
+        count += len(re.findall(pattern, text, re.MULTILINE))
+    return count
+
+def generate_input(kind, size_kb):
+    """Return a pathological input of about size_kb kilobytes."""
+    if kind == "prose":
+        sentence = ("The venue offers lighting and sound support on request and the crew of 12 "
+                    "will assist with 3 loading docks, power, rigging and staging enquiries. ")
+        line = sentence * 8 + "\n"
+    elif kind == "numbered":
+        line = "17. 24x Source Four 750W profile - 19 degree lens with iris and shutters\n"
+    else:
+        line = "Profile spot " + " " * 400 + "12" + " " * 400 + "\n"
+    lines = max(1, size_kb * 1024 // len(line))
+    header = "6.1 Base Lighting Equipment\n" if kind == "numbered" else ""
+    return header + line * lines
+
+def time_call(function, text):
+    """Return the seconds taken by function(text)."""
+    start_time = time.perf_counter()
+    function(text)
+    return time.perf_counter() - start_time
+
+def count_items(equipment_data):
+    """Return the number of extracted items per equipment type."""
+    return {eq_type: len(items) for eq_type, items in equipment_data.items()}
+
+def benchmark_document(path):
+    """Print both timings and the new item counts for one document."""
+    text = path.read_text(encoding='utf-8')
+    legacy_seconds = time_call(legacy_scan, text)
+    new_seconds = time_call(extract_equipment_lists, text)
+    print(f"\n{path} ({len(text) / 1024:.0f} KB)")
+    print(f"  Legacy regex scan: {legacy_seconds * 1000:9.1f} ms")
+    print(f"  Linear scan:       {new_seconds * 1000:9.1f} ms  {count_items(extract_equipment_lists(text))}")
+
+def benchmark_pathological(kind, max_kb, legacy_max_kb):
+    """Print timings for one kind of generated input at doubling sizes."""
+    print(f"\nPathological input: {kind}")
+    print(f"  {'size':>7}  {'legacy':>10}  {'linear':>10}  {'linear us/KB':>12}")
+    size_kb = 16
+    while size_kb <= max_kb:
+        text = generate_input(kind, size_kb)
+        if size_kb <= legacy_max_kb:
+            legacy = f"{time_call(legacy_scan, text) * 1000:>8.1f}ms"
+        else:
+            legacy = f"{'skipped':>10}"
+        new_seconds = time_call(extract_equipment_lists, text)
+        print(f"  {size_kb:>5}KB  {legacy}  {new_seconds * 1000:>8.1f}ms  {new_seconds * 1e6 / size_kb:>12.1f}")
+        size_kb *= 2
+
+def main():
+    """Run the equipment lists benchmark."""
+    parser = argparse.ArgumentParser(description="Compare extract_equipment_lists with the legacy regex scan.")
+    parser.add_argument("files", nargs="*", type=Path,
+                        help="extracted text files (default: data/*/extracted_text.txt)")
+    parser.add_argument("--max-kb", type=int, default=1024,
+                        help="largest generated input in KB (default: 1024)")
+    parser.add_argument("--legacy-max-kb", type=int, default=64,
+                        help="largest generated input the legacy scan is run on (default: 64)")
+    args = parser.parse_args()
+    
+    if not check_table_rows():
+        sys.exit(1)
+    
+    files = args.files or sorted((Path(__file__).parent.parent / "data").glob("*/extracted_text.txt"))
+    for path in files:
+        benchmark_document(path)
+    for kind in ("prose", "numbered", "spaces"):
+        benchmark_pathological(kind, args.max_kb, args.legacy_max_kb)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+Export Benchmark Script
+
+This script measures DataStandardizer.export_to_csv and export_to_json on a
+large standardized corpus, comparing them with the exports as they were
+when every item carried the name and source of its venue and the CSV was
+written from an object DataFrame built from a dict per item.
+
+The standardized items of the bundled corpus are copied into venues of
+their own (with numbered venue names) up to --items items. The previous
+exports get their item dicts ready-made, with the venue fields, so only the
+export itself is compared. Both must write the same files (the script exits
+with status 1 otherwise); the time and the peak memory traced by
+tracemalloc are reported for each.
+
+Usage: python benchmarks/export_benchmark.py [--items N]
+"""
+
+import argparse
+import filecmp
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import pandas as pd
+
+# Add the repository root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from data_standardizer import DataStandardizer
+from pdf_processor import PDFProcessor
+from schema.validator import get_schema_validator
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+def load_venues(standardizer, count):
+    """Return standardized venues holding about count items, copied from the corpus."""
+    processor = PDFProcessor()
+    corpus = []
+    for path in sorted(DATA_DIR.glob("*/extracted_text.txt")):
+        corpus.append(standardizer.standardize_venue_data({
+            'venue_name': path.parent.name,
+            'pdf_source': str(path),
+            'equipment': list(processor.iter_equipment_items([path.read_text(encoding='utf-8')]))
+        }))
+    
+    venues = []
+    items = 0
+    while items < count:
+        for venue in corpus:
+            venues.append(dict(venue, venue_name=f"{venue['venue_name']} {len(venues)}",
+                               equipment=[item.copy() for item in venue['equipment']]))
+            items += venue['total_items']
+    return venues
+
+def with_item_dicts(venues):
+    """Return the venues with their items as dicts carrying the venue fields, as they used to."""
+    return [dict(venue, equipment=[
+        {**item.to_dict(), 'venue_name': venue['venue_name'], 'pdf_source': venue['pdf_source']}
+        for item in venue['equipment']
+    ]) for venue in venues]
+
+def previous_export_to_csv(standardized_data, output_file):
+    """Export to CSV as DataStandardizer used to, from a DataFrame of item dicts."""
+    all_equipment = []
+    for venue in standardized_data:
+        all_equipment.extend(venue['equipment'])
+    df = pd.DataFrame(all_equipment)
+    standard_columns = [
+        'venue_name', 'equipment_type', 'model', 'manufacturer', 'quantity',
+        'power', 'dmx_channels', 'frequency_response', 'max_spl', 'resolution',
+        'input_types', 'beam_angle', 'color', 'notes', 'pdf_source'
+    ]
+    existing_columns = [col for col in standard_columns if col in df.columns]
+    other_columns = [col for col in df.columns if col not in standard_columns]
+    df = df[existing_columns + other_columns]
+    df = df.sort_values(['venue_name', 'equipment_type', 'model'])
+    df.to_csv(output_file, index=False, encoding='utf-8')
+
+def previous_export_to_json(standardized_data, output_file):
+    """Export to JSON as DataStandardizer used to, from item dicts with the venue fields."""
+    json_data = {
+        'metadata': {
+            'total_venues': len(standardized_data),
+            'total_equipment': sum(len(venue['equipment']) for venue in standardized_data),
+            'equipment_types': list(set(
+                item['equipment_type'] for venue in standardized_data for item in venue['equipment']
+            )),
+            'schema_version': get_schema_validator().version
+        },
+        'venues': []
+    }
+    for venue in standardized_data:
+        equipment_by_type = {}
+        for item in venue['equipment']:
+            equipment_by_type.setdefault(item['equipment_type'], []).append(item)
+        json_data['venues'].append({
+            'venue_name': venue['venue_name'],
+            'pdf_source': venue.get('pdf_source', ''),
+            'total_equipment': venue['total_items'],
+            'equipment_by_type': equipment_by_type,
+            'all_equipment': venue['equipment']
+        })
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(json_data, f, indent=2, ensure_ascii=False)
+
+def measure(function):
+    """Run function, returning (seconds, peak MB allocated).
+    
+    The memory is measured on a first run and the time on a second one, as
+    tracing slows it down.
+    """
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    start_time = time.perf_counter()
+    function()
+    return time.perf_counter() - start_time, peak / 1024 / 1024
+
+def main():
+    """Run the export benchmark."""
+    parser = argparse.ArgumentParser(description="Compare the CSV and JSON exports with the previous ones.")
+    parser.add_argument("--items", type=int, default=1_000_000,
+                        help="standardized items to export (default: 1000000)")
+    args = parser.parse_args()
+    
+    standardizer = DataStandardizer()
+    venues = load_venues(standardizer, args.items)
+    previous_venues = with_item_dicts(venues)
+    print(f"{sum(venue['total_items'] for venue in venues)} items in {len(venues)} venues")
+    
+    failed = False
+    with tempfile.TemporaryDirectory() as output_dir:
+        output_dir = Path(output_dir)
+        print(f"\n{'export':<8} {'previous':>10} {'peak':>9} {'now':>10} {'peak':>9} {'speedup':>8}")
+        for name, export, previous_export in [
+            ("CSV", standardizer.export_to_csv, previous_export_to_csv),
+            ("JSON", standardizer.export_to_json, previous_export_to_json),
+        ]:
+            previous_file = output_dir / f"previous.{name.lower()}"
+            current_file = output_dir / f"current.{name.lower()}"
+            previous_seconds, previous_peak = measure(lambda: previous_export(previous_venues, previous_file))
+            seconds, peak = measure(lambda: export(venues, current_file))
+            print(f"{name:<8} {previous_seconds * 1000:>8.0f}ms {previous_peak:>7.0f}MB "
+                  f"{seconds * 1000:>8.0f}ms {peak:>7.0f}MB {previous_seconds / seconds:>7.2f}x")
+            if not filecmp.cmp(previous_file, current_file, shallow=False):
+                print(f"MISMATCH: the {name} export differs from the previous one")
+                failed = True
+    
+    if failed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Line Lexer Benchmark Script
+
+This script compares the line lexer used to find numbered and bulleted list
+items (line_lexer.py) with the DOTALL list regexes it replaced.
+
+For each bundled extracted_text.txt file it reports the number of list item
+candidates and the time taken by each approach, then times both on a single
+section made by repeating the text to show how they scale with input size.
+Finally both are run on a list item followed by a long run of digits (as in
+an extracted barcode or serial table), on which the regex path is quadratic.
+
+Usage: python benchmarks/line_lexer_benchmark.py [--max-scale N] [FILE ...]
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add the repository root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from line_lexer import iter_list_items, tokenize
+
+# The list patterns previously used by PDFProcessor.extract_equipment_from_section
+LEGACY_LIST_PATTERNS = [
+    r"(\d+)[\.|\)](.*?)(?=(?:\d+)[\.|\)]|\Z)",  # Numbered lists: 1. Item 1, 2. Item 2
+    r"[\•|\-|\*|\–](.*?)(?=[\•|\-|\*|\–]|\Z)",  # Bulleted lists: • Item 1, • Item 2
+]
+
+def legacy_list_items(section):
+    """Return list item candidates the way the regex path found them."""
+    items = []
+    for pattern in LEGACY_LIST_PATTERNS:
+        for match in re.findall(pattern, section, re.MULTILINE | re.DOTALL):
+            item_text = match[1].strip() if isinstance(match, tuple) else match.strip()
+            if len(item_text) > 5 and len(item_text) < 200:
+                items.append(item_text)
+    return items
+
+def lexer_list_items(section):
+    """Return list item candidates found by the line lexer."""
+    return [item_text for item_text in iter_list_items(tokenize(section))
+            if len(item_text) > 5 and len(item_text) < 200]
+
+def time_call(function, sections, repeat=3):
+    """Return (result count, best seconds) for running function over every section."""
+    best = float('inf')
+    count = 0
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        count = sum(len(function(section)) for section in sections)
+        best = min(best, time.perf_counter() - start_time)
+    return count, best
+
+def benchmark_document(path, max_scale):
+    """Print the comparison for one document."""
+    text = path.read_text(encoding='utf-8')
+    sections = re.split(r'\n\s*\n', text)
+    
+    legacy_count, legacy_seconds = time_call(legacy_list_items, sections)
+    lexer_count, lexer_seconds = time_call(lexer_list_items, sections)
+    
+    print(f"\n{path} ({len(text) / 1024:.0f} KB, {len(sections)} sections)")
+    print(f"  Regex path: {legacy_count:>5} candidates in {legacy_seconds * 1000:8.2f} ms")
+    print(f"  Line lexer: {lexer_count:>5} candidates in {lexer_seconds * 1000:8.2f} ms")
+    
+    # Scaling on one long section, as produced by PDFs without blank lines
+    section = "\n".join(line for line in text.split("\n") if line.strip())
+    print(f"  {'scale':>5}  {'size':>8}  {'regex':>10}  {'lexer':>10}  {'lexer us/KB':>11}")
+    scale = 1
+    while scale <= max_scale:
+        long_section = "\n".join([section] * scale)
+        size_kb = len(long_section) / 1024
+        _, legacy_seconds = time_call(legacy_list_items, [long_section], repeat=1)
+        _, lexer_seconds = time_call(lexer_list_items, [long_section], repeat=1)
+        print(f"  {scale:>5}  {size_kb:>6.0f}KB  {legacy_seconds * 1000:>8.1f}ms  "
+              f"{lexer_seconds * 1000:>8.1f}ms  {lexer_seconds * 1e6 / size_kb:>11.1f}")
+        scale *= 2
+
+def benchmark_pathological(max_digits):
+    """Print timings for a numbered item followed by a long digit run."""
+    print("\nNumbered item followed by a run of digits")
+    print(f"  {'digits':>7}  {'regex':>10}  {'lexer':>10}")
+    digits = 1000
+    while digits <= max_digits:
+        section = "1. Item " + "0" * digits
+        _, legacy_seconds = time_call(legacy_list_items, [section], repeat=1)
+        _, lexer_seconds = time_call(lexer_list_items, [section], repeat=1)
+        print(f"  {digits:>7}  {legacy_seconds * 1000:>8.1f}ms  {lexer_seconds * 1000:>8.3f}ms")
+        digits *= 2
+
+def main():
+    """Run the line lexer benchmark."""
+    parser = argparse.ArgumentParser(description="Compare the line lexer with the legacy list regexes.")
+    parser.add_argument("files", nargs="*", type=Path,
+                        help="extracted text files (default: data/*/extracted_text.txt)")
+    parser.add_argument("--max-scale", type=int, default=16,
+                        help="largest number of copies of the text in the scaling test (default: 16)")
+    parser.add_argument("--max-digits", type=int, default=8000,
+                        help="longest digit run in the pathological test (default: 8000)")
+    args = parser.parse_args()
+    
+    files = args.files or sorted((Path(__file__).parent.parent / "data").glob("*/extracted_text.txt"))
+    if not files:
+        print("❌ No input files found")
+        return
+    
+    for path in files:
+        benchmark_document(path, args.max_scale)
+    benchmark_pathological(args.max_digits)
+
+if __name__ == "__main__":
+    main()
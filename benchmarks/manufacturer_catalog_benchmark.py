@@ -0,0 +1,80 @@
+"""
+Manufacturer Catalog Benchmark Script
+
+This script measures manufacturer lookup cost as the catalog grows. The real
+catalog from schema/manufacturers.json is padded with synthetic brand names
+and each size is timed with the compiled automaton (ManufacturerCatalog) and
+with the per-manufacturer regex loop it replaced.
+
+Usage: python benchmarks/manufacturer_catalog_benchmark.py [--sizes N ...]
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add the repository root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from schema.manufacturer_catalog import MANUFACTURERS_PATH, ManufacturerCatalog
+
+SAMPLE_MODELS = [
+    "ETC Source Four 750W", "Martin MAC Aura XB", "d&b audiotechnik V8", "Shure SM58",
+    "Robert Juliat Arthur LT", "Allen & Heath dLive S7000", "Barco UDX-4K32",
+    "Generic 1.2m truss", "Stage weights 20kg", "Unknown Brand X100",
+]
+
+def build_manufacturers(size):
+    """Return the real catalog entries padded with synthetic brands up to size."""
+    with open(MANUFACTURERS_PATH, 'r', encoding='utf-8') as f:
+        manufacturers = json.load(f)["manufacturers"]
+    types = ["lighting", "sound", "video"]
+    index = 0
+    while len(manufacturers) < size:
+        manufacturers.append({"name": f"Brand{index:05d} Pro", "type": types[index % 3], "aliases": []})
+        index += 1
+    return manufacturers
+
+def regex_lookup(model_text, names):
+    """The per-manufacturer regex loop previously used by PDFProcessor.extract_manufacturer."""
+    for manufacturer in names:
+        pattern = r'^' + re.escape(manufacturer) + r'\b'
+        if re.search(pattern, model_text, re.IGNORECASE):
+            return manufacturer
+    return ""
+
+def time_lookups(function, repeat):
+    """Return the mean microseconds per lookup over the sample models."""
+    start_time = time.perf_counter()
+    for _ in range(repeat):
+        for model_text in SAMPLE_MODELS:
+            function(model_text)
+    return (time.perf_counter() - start_time) * 1e6 / (repeat * len(SAMPLE_MODELS))
+
+def main():
+    """Run the manufacturer catalog benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark manufacturer lookup against catalog size.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 500, 5000],
+                        help="catalog sizes to time (default: 50 500 5000)")
+    parser.add_argument("--repeat", type=int, default=20,
+                        help="passes over the sample models per size (default: 20)")
+    args = parser.parse_args()
+    
+    print(f"{'brands':>7}  {'compile':>9}  {'automaton':>11}  {'regex loop':>11}")
+    for size in args.sizes:
+        manufacturers = build_manufacturers(size)
+        
+        start_time = time.perf_counter()
+        catalog = ManufacturerCatalog(manufacturers)
+        compile_ms = (time.perf_counter() - start_time) * 1000
+        
+        names = catalog.names()
+        automaton_us = time_lookups(catalog.match_prefix, args.repeat)
+        regex_us = time_lookups(lambda text: regex_lookup(text, names), args.repeat)
+        
+        print(f"{len(manufacturers):>7}  {compile_ms:>7.1f}ms  {automaton_us:>9.2f}us  {regex_us:>9.1f}us")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Pre-filter Benchmark Script
+
+This script measures the section relevance pre-filter of PDFProcessor against
+the full scan, which runs every equipment parser on every text section.
+
+A section counts as relevant when the full scan extracts at least one
+equipment item from it. For each document the script reports the pre-filter's
+section precision and recall, the share of the full scan's items that are
+still found with the pre-filter enabled, and the time spent parsing.
+
+Usage: python benchmarks/prefilter_benchmark.py [--min-hits N ...] [FILE ...]
+
+FILE can be a PDF or an extracted_text.txt file; by default every
+data/*/extracted_text.txt file is used.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add the repository root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from pdf_processor import PDFProcessor
+from pdf_text import extract_page_texts
+
+def load_pages(path):
+    """Load the page texts of a PDF, or a text file as a single page."""
+    if path.suffix.lower() == ".pdf":
+        return extract_page_texts(path)
+    return [path.read_text(encoding='utf-8')]
+
+def item_keys(items):
+    """Return the deduplication keys of a list of equipment items."""
+    return {(item['model'].lower(), item.get('quantity', '')) for item in items}
+
+def time_parse(processor, page_texts):
+    """Parse page texts, returning (items, seconds)."""
+    start_time = time.perf_counter()
+    items = list(processor.iter_equipment_items(page_texts))
+    return items, time.perf_counter() - start_time
+
+def benchmark_document(path, min_hits_values):
+    """Print the pre-filter results for one document at each min_hits value."""
+    page_texts = load_pages(path)
+    full_processor = PDFProcessor()
+    
+    # Ground truth: which sections the full scan finds equipment in
+    sections = list(full_processor.iter_typed_sections(page_texts))
+    truth = [
+        any(item and item.get('model') for item in full_processor.extract_equipment_from_section(section, equipment_type))
+        for equipment_type, section in sections
+    ]
+    full_items, full_seconds = time_parse(full_processor, page_texts)
+    full_keys = item_keys(full_items)
+    
+    print(f"\n{path}")
+    print(f"  Sections: {len(sections)} ({sum(truth)} with equipment in the full scan)")
+    print(f"  Full scan: {len(full_items)} items in {full_seconds * 1000:.1f} ms")
+    print(f"  {'min hits':>8}  {'kept':>5}  {'precision':>9}  {'recall':>6}  "
+          f"{'item recall':>11}  {'time':>9}  {'speedup':>7}")
+    
+    for min_hits in min_hits_values:
+        processor = PDFProcessor(prefilter=True, relevance_min_hits=min_hits)
+        predicted = [processor.is_relevant_section(section) for _, section in sections]
+        
+        true_positives = sum(1 for p, t in zip(predicted, truth) if p and t)
+        precision = true_positives / sum(predicted) if any(predicted) else 1.0
+        recall = true_positives / sum(truth) if any(truth) else 1.0
+        
+        items, seconds = time_parse(processor, page_texts)
+        item_recall = len(item_keys(items) & full_keys) / len(full_keys) if full_keys else 1.0
+        speedup = full_seconds / seconds if seconds else float('inf')
+        
+        print(f"  {min_hits:>8}  {sum(predicted):>5}  {precision:>9.1%}  {recall:>6.1%}  "
+              f"{item_recall:>11.1%}  {seconds * 1000:>7.1f}ms  {speedup:>6.1f}x")
+
+def main():
+    """Run the pre-filter benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark the section relevance pre-filter.")
+    parser.add_argument("files", nargs="*", type=Path,
+                        help="PDF or extracted text files (default: data/*/extracted_text.txt)")
+    parser.add_argument("--min-hits", type=int, nargs="+", default=[1, 2, 3, 5],
+                        help="relevance_min_hits values to compare (default: 1 2 3 5)")
+    args = parser.parse_args()
+    
+    files = args.files or sorted((Path(__file__).parent.parent / "data").glob("*/extracted_text.txt"))
+    if not files:
+        print("❌ No input files found")
+        return
+    
+    for path in files:
+        benchmark_document(path, args.min_hits)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Raw Text Benchmark Script
+
+This script times the raw text scanner used by
+fixed_final_output.extract_equipment_from_raw_text (raw_text_scanner.py)
+against the regexes it replaced, on adversarial raw_text strings of growing
+length:
+
+- words: capitalized words and spaces with no quantity anywhere
+- spaced: a brand followed by a long run of whitespace and a trailing dash
+- models: a brand followed by many model-like words ending in a lone digit
+  glued to a non-model character
+
+On every size where the legacy regexes are run, both must find the same
+matches (the inputs only name manufacturers that are both in the legacy
+list and in the manufacturer catalog the scanner uses instead). As a timing guard, the scanner must handle each input within
+--budget seconds per MB; the script exits with status 1 if it does not.
+
+Usage: python benchmarks/raw_text_benchmark.py [--max-kb N] [--legacy-max-chars N] [--budget S]
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add the repository root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from raw_text_scanner import scan_raw_texts
+
+# The patterns previously used by fixed_final_output.extract_equipment_from_raw_text
+LEGACY_PATTERNS = [
+    r'([A-Z][a-zA-Z\s&]+)\s+([A-Za-z0-9\-\s]+)\s+[-–]\s+(\d+)',
+    r'([A-Z][a-zA-Z\s&]+)\s+([A-Za-z0-9\-\s]+)\s+(\d+)',
+    r'(\d+)\s*[xX]\s*([A-Z][a-zA-Z\s&]+)\s+([A-Za-z0-9\-\s]+)',
+    r'(Martin|ETC|Shure|Sennheiser|Yamaha|DPA|Robert Juliat|MAC)\s+([A-Za-z0-9\-\s]+)'
+]
+
+def legacy_scan(texts):
+    """Return the (index, manufacturer, model, quantity) matches found by the legacy regexes."""
+    found = []
+    for index, text in enumerate(texts):
+        for pattern in LEGACY_PATTERNS:
+            for match in re.finditer(pattern, text):
+                parts = match.groups()
+                if len(parts) == 2:
+                    manufacturer, model, quantity = parts[0], parts[1], ""
+                elif parts[0].isdigit():
+                    quantity, manufacturer, model = parts
+                elif parts[2].isdigit():
+                    manufacturer, model, quantity = parts
+                else:
+                    continue
+                found.append((index, manufacturer.strip(), model.strip(), quantity))
+    return found
+
+def generate_text(kind, size):
+    """Return an adversarial raw_text string of about size characters."""
+    if kind == "words":
+        return ("Stage Lighting Rig " * (size // 19 + 1))[:size]
+    if kind == "spaced":
+        return "Martin Mac" + " " * size + "-"
+    return "Shure " + "SM58 Beta " * (size // 10 + 1) + "(7"
+
+def time_call(function, texts):
+    """Return (result, seconds) for function(texts)."""
+    start_time = time.perf_counter()
+    result = function(texts)
+    return result, time.perf_counter() - start_time
+
+def benchmark_kind(kind, max_kb, legacy_max_chars, budget):
+    """Print timings for one kind of input; return False if the guard fails."""
+    print(f"\nAdversarial raw_text: {kind}")
+    print(f"  {'chars':>8}  {'legacy':>10}  {'scanner':>10}  {'scanner s/MB':>12}")
+    passed = True
+    size = 64
+    while size <= max_kb * 1024:
+        texts = [generate_text(kind, size)]
+        found, seconds = time_call(scan_raw_texts, texts)
+        
+        legacy = f"{'skipped':>10}"
+        if size <= legacy_max_chars:
+            legacy_found, legacy_seconds = time_call(legacy_scan, texts)
+            legacy = f"{legacy_seconds * 1000:>8.1f}ms"
+            if legacy_found != [tuple(match) for match in found]:
+                print(f"  ❌ Matches differ from the legacy regexes at {size} characters")
+                passed = False
+        
+        seconds_per_mb = seconds * 1024 * 1024 / len(texts[0])
+        print(f"  {size:>8}  {legacy}  {seconds * 1000:>8.2f}ms  {seconds_per_mb:>12.3f}")
+        # Small inputs are dominated by fixed costs; guard from 64 KB up
+        if size >= 64 * 1024 and seconds_per_mb > budget:
+            print(f"  ❌ Over the budget of {budget} s/MB")
+            passed = False
+        size *= 4
+    return passed
+
+def main():
+    """Run the raw text benchmark."""
+    parser = argparse.ArgumentParser(description="Time the raw text scanner on adversarial input.")
+    parser.add_argument("--max-kb", type=int, default=1024,
+                        help="largest input in KB (default: 1024)")
+    parser.add_argument("--legacy-max-chars", type=int, default=128,
+                        help="largest input the legacy regexes are run on (default: 128)")
+    parser.add_argument("--budget", type=float, default=2.0,
+                        help="maximum scanner time in seconds per MB of input (default: 2.0)")
+    args = parser.parse_args()
+    
+    results = [benchmark_kind(kind, args.max_kb, args.legacy_max_chars, args.budget)
+               for kind in ("words", "spaced", "models")]
+    if not all(results):
+        sys.exit(1)
+    print("\n✅ Scanner within budget on all inputs")
+
+if __name__ == "__main__":
+    main()
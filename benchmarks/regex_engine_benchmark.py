@@ -0,0 +1,172 @@
+"""
+Regex Engine Benchmark Script
+
+This script compares the regex engines behind regex_engine.py (the standard
+library re and, when google-re2 is installed, RE2) on the bundled corpus in
+data/. For every engine the extraction modules are reloaded, so that their
+patterns are compiled for it, and timed on:
+
+- parse: PDFProcessor.iter_equipment_items over each extracted_text.txt
+- lists: extract_venue_info.extract_equipment_lists over the same texts
+- standardize: DataStandardizer.standardize_venue_data over the parsed items
+- raw text: fixed_final_output.extract_equipment_from_raw_text over the CSVs
+
+Every engine must produce the same results as re (the script exits with
+status 1 otherwise). A hostile case then runs a backtracking pattern of the
+kind the extraction code used to contain on a brand followed by a growing run
+of whitespace, which takes quartic time on re and linear time on RE2.
+
+Usage: python benchmarks/regex_engine_benchmark.py [--repeat N] [--hostile-max-chars N] [--re-max-chars N]
+"""
+
+import argparse
+import importlib
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+# Add the repository root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import pattern_registry
+import regex_engine
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+# Modules compiling patterns through regex_engine, in dependency order
+MODULES = [
+    "section_index", "equipment_classifier", "raw_text_scanner", "pdf_processor",
+    "extract_venue_info", "data_standardizer", "fixed_final_output",
+]
+
+# Brand, model, dash and quantity with overlapping whitespace runs: on text
+# without a quantity, a backtracking engine retries every split of every run
+HOSTILE_PATTERN = r'([A-Z][a-zA-Z\s&]+)\s+([A-Za-z0-9\-\s]+)\s+[-–]\s+(\d+)'
+
+def load_corpus():
+    """Return the bundled extracted texts and equipment CSV frames."""
+    texts = [path.read_text(encoding='utf-8') for path in sorted(DATA_DIR.glob("*/extracted_text.txt"))]
+    frames = [pd.read_csv(path) for path in sorted(DATA_DIR.glob("*/*_equipment.csv"))]
+    return texts, frames
+
+def load_modules(engine):
+    """Switch to engine and (re)import the extraction modules; return them by name."""
+    regex_engine.set_engine(engine)
+    pattern_registry.recompile()
+    modules = {}
+    for name in MODULES:
+        module = sys.modules.get(name)
+        modules[name] = importlib.reload(module) if module else importlib.import_module(name)
+    return modules
+
+def run_workloads(modules, texts, frames, repeat):
+    """Return {workload: (best seconds, result)} for the corpus workloads."""
+    pdf_processor = modules["pdf_processor"]
+    extract_venue_info = modules["extract_venue_info"]
+    data_standardizer = modules["data_standardizer"]
+    fixed_final_output = modules["fixed_final_output"]
+    
+    def parse():
+        processor = pdf_processor.PDFProcessor(parse_cache_size=0)
+        return [list(processor.iter_equipment_items([text])) for text in texts]
+    
+    def lists():
+        return [extract_venue_info.extract_equipment_lists(text) for text in texts]
+    
+    parsed = parse()
+    
+    def standardize():
+        standardizer = data_standardizer.DataStandardizer()
+        return [standardizer.standardize_venue_data({'venue_name': "Benchmark", 'equipment': items})
+                for items in parsed]
+    
+    def raw_text():
+        return [fixed_final_output.extract_equipment_from_raw_text(frame).to_dict('records') for frame in frames]
+    
+    results = {}
+    for name, workload in [("parse", parse), ("lists", lists), ("standardize", standardize), ("raw text", raw_text)]:
+        best = None
+        for _ in range(repeat):
+            start_time = time.perf_counter()
+            result = workload()
+            elapsed = time.perf_counter() - start_time
+            best = elapsed if best is None else min(best, elapsed)
+        results[name] = (best, result)
+    return results
+
+def time_hostile(engine, sizes):
+    """Return [(size, seconds)] for the hostile pattern on each size."""
+    regex_engine.set_engine(engine)
+    pattern = regex_engine.compile(HOSTILE_PATTERN)
+    timings = []
+    for size in sizes:
+        text = "Martin Mac" + " " * size + "-"
+        start_time = time.perf_counter()
+        pattern.findall(text)
+        timings.append((size, time.perf_counter() - start_time))
+    return timings
+
+def main():
+    """Run the regex engine benchmark."""
+    parser = argparse.ArgumentParser(description="Compare the regex engines on the bundled corpus.")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="runs per workload; the best is reported (default: 3)")
+    parser.add_argument("--hostile-max-chars", type=int, default=65536,
+                        help="largest hostile input, in characters (default: 65536)")
+    parser.add_argument("--re-max-chars", type=int, default=128,
+                        help="largest hostile input run on re, which is quartic (default: 128)")
+    args = parser.parse_args()
+    
+    engines = regex_engine.available_engines()
+    if "re2" not in engines:
+        print("google-re2 is not installed (pip install google-re2); timing re only")
+    
+    texts, frames = load_corpus()
+    print(f"Corpus: {len(texts)} texts ({sum(len(text) for text in texts) // 1024} KB), "
+          f"{sum(len(frame) for frame in frames)} CSV rows")
+    
+    timings = {}
+    reference = None
+    failed = False
+    for engine in engines:
+        results = run_workloads(load_modules(engine), texts, frames, args.repeat)
+        timings[engine] = {name: seconds for name, (seconds, _) in results.items()}
+        outputs = {name: result for name, (_, result) in results.items()}
+        if reference is None:
+            reference = outputs
+        for name, result in outputs.items():
+            if result != reference[name]:
+                print(f"MISMATCH: {name} differs between {engines[0]} and {engine}")
+                failed = True
+    
+    print(f"\n{'workload':<12}" + "".join(f"{engine:>12}" for engine in engines))
+    for name in reference:
+        print(f"{name:<12}" + "".join(f"{timings[engine][name] * 1000:>10.1f}ms" for engine in engines))
+    
+    if "re2" in engines:
+        fallbacks = regex_engine.fallback_patterns()
+        print(f"\n{len(fallbacks)} patterns fell back to re on RE2:")
+        for pattern, _ in fallbacks:
+            print(f"  {pattern}")
+    
+    sizes = []
+    size = 32
+    while size <= args.hostile_max_chars:
+        sizes.append(size)
+        size *= 2
+    print(f"\nHostile pattern {HOSTILE_PATTERN}")
+    print(f"{'chars':>8}" + "".join(f"{engine:>12}" for engine in engines))
+    hostile = {engine: dict(time_hostile(engine, [size for size in sizes if engine != "re" or size <= args.re_max_chars]))
+               for engine in engines}
+    for size in sizes:
+        cells = [f"{hostile[engine][size] * 1000:>10.2f}ms" if size in hostile[engine] else f"{'-':>12}"
+                 for engine in engines]
+        print(f"{size:>8}" + "".join(cells))
+    
+    regex_engine.set_engine("auto")
+    if failed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Schema Validator Benchmark Script
+
+This script measures how fast standardized equipment records are checked
+for the required fields of their type, with a check of the required fields
+one by one against the schema (as DataStandardizer used to do) and with the
+compiled SchemaValidator (see schema/validator.py): from the record dict
+(has_required_fields) and from the fields mask accumulated while the record
+was cleaned (is_valid_mask, as DataStandardizer does now).
+
+The records are the cleaned (not yet validated) equipment items of the
+bundled corpus, repeated up to --records records. All checks must agree on
+every record (the script exits with status 1 otherwise).
+
+Usage: python benchmarks/schema_validator_benchmark.py [--records N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add the repository root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from data_standardizer import DataStandardizer
+from pdf_processor import PDFProcessor
+from schema.validator import DEFAULT_EQUIPMENT_TYPE, get_schema_validator
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+def load_records(standardizer, count):
+    """Return (record, equipment_type, fields mask) for cleaned corpus items, repeated up to count."""
+    processor = PDFProcessor()
+    field_bits = standardizer.validator.field_bits
+    records = []
+    for path in sorted(DATA_DIR.glob("*/extracted_text.txt")):
+        for item in processor.iter_equipment_items([path.read_text(encoding='utf-8')]):
+            record = {}
+            fields_mask = 0
+            for field_name, value in item.items():
+                standard_field = standardizer.standardize_field_name(field_name)
+                cleaned_value = standardizer._clean_field_value(standard_field, value)
+                if cleaned_value:
+                    record[standard_field] = cleaned_value
+                    fields_mask |= field_bits.get(standard_field, 0)
+            records.append((record, item['equipment_type'], fields_mask))
+    copies = -(-count // len(records))
+    return (records * copies)[:count]
+
+def validate_per_field(record, equipment_type, schema):
+    """Check the required fields one by one, as DataStandardizer used to."""
+    required_fields = schema.get(equipment_type, schema[DEFAULT_EQUIPMENT_TYPE])
+    for field in required_fields:
+        if field not in record or not record[field]:
+            return False
+    return True
+
+def main():
+    """Run the schema validator benchmark."""
+    parser = argparse.ArgumentParser(description="Measure the throughput of required-field validation.")
+    parser.add_argument("--records", type=int, default=1_000_000,
+                        help="records to validate (default: 1000000)")
+    args = parser.parse_args()
+    
+    validator = get_schema_validator()
+    records = load_records(DataStandardizer(), args.records)
+    print(f"{len(records)} records")
+    
+    checks = [
+        ("per field", lambda record, equipment_type, fields_mask:
+            validate_per_field(record, equipment_type, validator.required_fields)),
+        ("has_required_fields", lambda record, equipment_type, fields_mask:
+            validator.has_required_fields(record, equipment_type)),
+        ("is_valid_mask", lambda record, equipment_type, fields_mask:
+            validator.is_valid_mask(fields_mask, equipment_type)),
+    ]
+    results = {}
+    timings = {}
+    for name, check in checks:
+        start_time = time.perf_counter()
+        results[name] = [check(*record) for record in records]
+        timings[name] = time.perf_counter() - start_time
+    
+    print(f"Valid: {sum(results['per field'])} of {len(records)}")
+    print(f"\n{'check':<22} {'time':>10} {'records/s':>12} {'speedup':>8}")
+    for name, seconds in timings.items():
+        print(f"{name:<22} {seconds * 1000:>8.0f}ms {len(records) / seconds:>12.0f} "
+              f"{timings['per field'] / seconds:>7.2f}x")
+    
+    reference = results['per field']
+    if any(result != reference for result in results.values()):
+        print("MISMATCH: the compiled validator disagrees with the per-field check")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Standardize Frame Benchmark Script
+
+This script compares the two ways DataStandardizer cleans and validates
+equipment: item by item with clean_and_validate_data, as
+standardize_venue_data does for a list of items, and column by column with
+standardize_frame, as it does for a DataFrame.
+
+The equipment parsed from the bundled corpus is repeated up to --rows rows
+(1,000,000 by default). standardize_frame cleans each distinct value of a
+column once, which the repetition favours; with --distinct the row number is
+appended to every model and raw text, so those columns have no repeats.
+Both paths get the same rows, as dicts and as a DataFrame, and must give the
+same items (the script exits with status 1 otherwise).
+
+Usage: python benchmarks/standardize_frame_benchmark.py [--rows N] [--distinct]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+# Add the repository root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from data_standardizer import DataStandardizer
+from pdf_processor import PDFProcessor
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+def load_equipment(rows, distinct=False):
+    """Return the corpus equipment repeated to the given number of rows, as a DataFrame."""
+    processor = PDFProcessor()
+    frames = [processor.extract_equipment_frame([path.read_text(encoding='utf-8')])
+              for path in sorted(DATA_DIR.glob("*/extracted_text.txt"))]
+    equipment = pd.concat(frames, ignore_index=True)
+    copies = -(-rows // len(equipment))
+    equipment = pd.concat([equipment] * copies, ignore_index=True).iloc[:rows]
+    if distinct:
+        suffixes = " " + pd.Series(range(len(equipment)), index=equipment.index).astype(str)
+        equipment['model'] = equipment['model'] + suffixes
+        equipment['raw_text'] = equipment['raw_text'] + suffixes
+    return equipment
+
+def frame_items(frame):
+    """Return the rows of a DataFrame as dicts without their missing values."""
+    return [{field: value for field, value in record.items() if not pd.isna(value)}
+            for record in frame.to_dict('records')]
+
+def main():
+    """Run the standardize frame benchmark."""
+    parser = argparse.ArgumentParser(description="Compare per-item and DataFrame standardization.")
+    parser.add_argument("--rows", type=int, default=1_000_000,
+                        help="equipment rows to standardize (default: 1000000)")
+    parser.add_argument("--distinct", action="store_true",
+                        help="make every model and raw text distinct")
+    args = parser.parse_args()
+    
+    standardizer = DataStandardizer()
+    equipment = load_equipment(args.rows, args.distinct)
+    items = frame_items(equipment)
+    print(f"{len(equipment)} rows, {len(equipment.columns)} columns")
+    
+    start_time = time.perf_counter()
+    standardized_items = []
+    for item in items:
+        standardized_item = standardizer.clean_and_validate_data(item, item.get('equipment_type', 'other'))
+        if standardized_item:
+            standardized_items.append(standardized_item)
+    item_seconds = time.perf_counter() - start_time
+    
+    start_time = time.perf_counter()
+    standardized_frame = standardizer.standardize_frame(equipment)
+    frame_seconds = time.perf_counter() - start_time
+    
+    print(f"\n{'path':<26} {'valid rows':>10} {'time':>11} {'rows/s':>11}")
+    for name, valid_rows, seconds in [
+        ("clean_and_validate_data", len(standardized_items), item_seconds),
+        ("standardize_frame", len(standardized_frame), frame_seconds),
+    ]:
+        print(f"{name:<26} {valid_rows:>10} {seconds * 1000:>9.0f}ms {len(equipment) / seconds:>11.0f}")
+    print(f"Speedup: {item_seconds / frame_seconds:.2f}x")
+    
+    if frame_items(standardized_frame) != [item.to_dict() for item in standardized_items]:
+        print("MISMATCH: standardize_frame differs from clean_and_validate_data")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -8,10 +8,11 @@ focusing on the actual equipment items for each venue.
 import os
 import sys
 import json
-import re
 import pandas as pd
 from pathlib import Path
 
+import regex_engine as re
+
 def clean_equipment_data(df):
     """Clean the standardized equipment data to focus on actual equipment items."""
     # Drop rows with very long model text (likely not equipment)
@@ -6,102 +6,86 @@ It maps various field names to standardized schema and ensures consistent output
 """
 
 import json
-import re
+import sys
+import numpy as np
 import pandas as pd
-from pathlib import Path
+
+from equipment_item import EquipmentItem, to_frame
+from pattern_registry import extract_column, register, replace_column
+import regex_engine as re
+from schema.validator import get_schema_validator
+from spec_scanner import SpecValue
+
+# Named patterns (see pattern_registry.py)
+WHITESPACE_PATTERN = register("text.whitespace", r'\s+')
+MODEL_PREFIX_PATTERN = register("model.prefix", r'^(Type|Model|Name|Description|Item)\s*[:;-]\s*', re.IGNORECASE)
+MODEL_QUANTITY_PATTERN = register("model.quantity", r'\d+\s*[x×]\s*')
+MANUFACTURER_PREFIX_PATTERN = register("manufacturer.prefix", r'^(Brand|Make|Manufacturer|Company|Mfg)\s*[:;-]\s*', re.IGNORECASE)
+NUMBER_PATTERN = register("value.number", r'(\d+)')
+NUMBER_WITH_UNIT_PATTERN = register("value.number_with_unit", r'(\d+(?:\.\d+)?)\s*([A-Za-z]*)')
+FREQUENCY_RANGE_PATTERN = register("value.frequency_range", r'(\d+(?:\.\d+)?)\s*(?:Hz|kHz)?\s*[-–]\s*(\d+(?:\.\d+)?)\s*(?:Hz|kHz)?', re.IGNORECASE)
+RESOLUTION_PATTERN = register("spec.resolution", r'(\d+)\s*[x×]\s*(\d+)')
+
+# Fields with few distinct values: interned in items, so that equal values
+# share one string, and category columns in DataFrames
+CATEGORY_FIELDS = frozenset(['equipment_type', 'manufacturer'])
+
+# Fields of the venue an item belongs to, held once per venue (see
+# build_venue_table) and only added to each item in the exports
+VENUE_FIELDS = ['venue_name', 'pdf_source']
+
+def _intern(value):
+    """Return the interned copy of a string (other values as they are)."""
+    return sys.intern(value) if type(value) is str else value
 
 class DataStandardizer:
     """Handles data standardization, field mapping, and output formatting."""
     
     def __init__(self):
         """Initialize the data standardizer with field mappings and schema."""
-        # Define the standardized equipment schema
-        self.equipment_schema = {
-            "lighting": {
-                "required_fields": ["model", "manufacturer", "quantity"],
-                "optional_fields": ["power", "dmx_channels", "beam_angle", "color", "notes"],
-                "field_aliases": {
-                    "model": ["model", "model_type", "name", "fixture_type", "type", "description"],
-                    "manufacturer": ["brand", "make", "manufacturer", "company", "mfg"],
-                    "quantity": ["qty", "count", "amount", "units", "quantity", "number"],
-                    "power": ["wattage", "power_consumption", "watts", "w", "power"],
-                    "dmx_channels": ["channels", "dmx", "channel_count", "ch", "dmx_channels"],
-                    "beam_angle": ["angle", "beam", "spread", "beam_angle"],
-                    "color": ["color_type", "color_mode", "colors", "colour"],
-                    "notes": ["comments", "additional_info", "description", "remarks", "notes"]
-                }
-            },
-            "sound": {
-                "required_fields": ["model", "manufacturer", "quantity"],
-                "optional_fields": ["power", "frequency_response", "max_spl", "notes"],
-                "field_aliases": {
-                    "model": ["model", "model_type", "name", "type", "description"],
-                    "manufacturer": ["brand", "make", "manufacturer", "company", "mfg"],
-                    "quantity": ["qty", "count", "amount", "units", "quantity", "number"],
-                    "power": ["wattage", "power_consumption", "watts", "w", "power"],
-                    "frequency_response": ["frequency", "response", "freq_range", "frequency_response"],
-                    "max_spl": ["spl", "max_volume", "output", "max_spl", "sound_pressure"],
-                    "notes": ["comments", "additional_info", "description", "remarks", "notes"]
-                }
-            },
-            "video": {
-                "required_fields": ["model", "manufacturer", "quantity"],
-                "optional_fields": ["resolution", "input_types", "notes"],
-                "field_aliases": {
-                    "model": ["model", "model_type", "name", "type", "description"],
-                    "manufacturer": ["brand", "make", "manufacturer", "company", "mfg"],
-                    "quantity": ["qty", "count", "amount", "units", "quantity", "number"],
-                    "resolution": ["res", "display_resolution", "output_resolution", "resolution"],
-                    "input_types": ["inputs", "connections", "input_connections", "connectors"],
-                    "notes": ["comments", "additional_info", "description", "remarks", "notes"]
-                }
-            },
-            "other": {
-                "required_fields": ["model", "quantity"],
-                "optional_fields": ["manufacturer", "notes"],
-                "field_aliases": {
-                    "model": ["model", "model_type", "name", "type", "description"],
-                    "manufacturer": ["brand", "make", "manufacturer", "company", "mfg"],
-                    "quantity": ["qty", "count", "amount", "units", "quantity", "number"],
-                    "notes": ["comments", "additional_info", "description", "remarks", "notes"]
-                }
-            }
-        }
-        
-        # Build reverse mapping for field standardization
-        self.field_mapping = self._build_field_mapping()
-    
-    def _build_field_mapping(self):
-        """Build a comprehensive field mapping dictionary."""
-        mapping = {}
-        
-        for equipment_type, schema in self.equipment_schema.items():
-            for standard_field, aliases in schema["field_aliases"].items():
-                for alias in aliases:
-                    # Normalize the alias (lowercase, replace special chars with underscores)
-                    normalized_alias = re.sub(r'[^a-zA-Z0-9]', '_', alias.lower())
-                    mapping[normalized_alias] = standard_field
-        
-        return mapping
+        # The standardized equipment schema (schema/equipment_schema.json),
+        # compiled into alias tables and required-field bitmasks
+        self.validator = get_schema_validator()
+        self.field_mapping = self.validator.field_mapping
+        
+        # Cleaning functions by field, from the cleaner kind of each field in
+        # the schema; other fields are cleaned as general text
+        self.field_cleaners = self.validator.compile_cleaners({
+            'model': self._clean_model_name,
+            'manufacturer': self._clean_manufacturer_name,
+            'quantity': self._clean_quantity,
+            'numeric': self._clean_numeric_field,
+            'frequency_response': self._clean_frequency_response,
+            'resolution': self._clean_resolution,
+        })
+        self.column_cleaners = self.validator.compile_cleaners({
+            'model': self._clean_model_column,
+            'manufacturer': self._clean_manufacturer_column,
+            'quantity': self._clean_quantity_column,
+            'numeric': self._clean_numeric_column,
+            'frequency_response': self._clean_frequency_response_column,
+            'resolution': self._clean_resolution_column,
+        })
     
     def standardize_field_name(self, raw_field_name):
         """Convert a raw field name to its standardized equivalent."""
         if not raw_field_name:
             return raw_field_name
         
-        # Normalize the input field name
-        normalized_name = re.sub(r'[^a-zA-Z0-9]', '_', raw_field_name.lower())
-        
-        # Return the standardized field name if found, otherwise return the original
-        return self.field_mapping.get(normalized_name, raw_field_name)
+        return self.validator.standardize_field_name(raw_field_name)
     
     def clean_and_validate_data(self, equipment_item, equipment_type):
-        """Clean and validate a single equipment item."""
+        """Clean and validate a single equipment item.
+        
+        equipment_item can be an EquipmentItem or an item dict; the result is
+        a new EquipmentItem, or None if a required field is missing.
+        """
         if not equipment_item:
             return None
         
-        schema = self.equipment_schema.get(equipment_type, self.equipment_schema["other"])
-        standardized_item = {}
+        standardized_item = EquipmentItem()
+        field_bits = self.validator.field_bits
+        fields_mask = 0
         
         # Process each field in the item
         for field_name, value in equipment_item.items():
@@ -115,14 +99,17 @@ class DataStandardizer:
             cleaned_value = self._clean_field_value(standard_field, value)
             
             if cleaned_value:
+                if standard_field in CATEGORY_FIELDS:
+                    cleaned_value = _intern(cleaned_value)
                 standardized_item[standard_field] = cleaned_value
+                fields_mask |= field_bits.get(standard_field, 0)
         
         # Ensure required fields are present
-        if not self._validate_required_fields(standardized_item, schema):
+        if not self.validator.is_valid_mask(fields_mask, equipment_type):
             return None
         
         # Add equipment type
-        standardized_item['equipment_type'] = equipment_type
+        standardized_item.equipment_type = _intern(equipment_type)
         
         return standardized_item
     
@@ -131,23 +118,13 @@ class DataStandardizer:
         if not value:
             return ""
         
+        # Specifications scanned by PDFProcessor are already in canonical form
+        if isinstance(value, SpecValue):
+            return str(value)
+        
         value = str(value).strip()
         
-        if field_name == 'model':
-            return self._clean_model_name(value)
-        elif field_name == 'manufacturer':
-            return self._clean_manufacturer_name(value)
-        elif field_name == 'quantity':
-            return self._clean_quantity(value)
-        elif field_name in ['power', 'dmx_channels', 'max_spl']:
-            return self._clean_numeric_field(value)
-        elif field_name == 'frequency_response':
-            return self._clean_frequency_response(value)
-        elif field_name == 'resolution':
-            return self._clean_resolution(value)
-        else:
-            # General text cleaning
-            return self._clean_text_field(value)
+        return self.field_cleaners.get(field_name, self._clean_text_field)(value)
     
     def _clean_model_name(self, value):
         """Clean model name field."""
@@ -155,14 +132,14 @@ class DataStandardizer:
             return ""
         
         # Remove common prefixes
-        value = re.sub(r'^(Type|Model|Name|Description|Item)\s*[:;-]\s*', '', value, flags=re.IGNORECASE)
+        value = MODEL_PREFIX_PATTERN.sub('', value)
         
         # Remove quantity indicators
-        value = re.sub(r'\d+\s*[x×]\s*', '', value)
+        value = MODEL_QUANTITY_PATTERN.sub('', value)
         
         # Clean up punctuation and whitespace
         value = value.strip('.,:;-')
-        value = re.sub(r'\s+', ' ', value).strip()
+        value = WHITESPACE_PATTERN.sub(' ', value).strip()
         
         # Validate length
         if len(value) < 2 or len(value) > 100:
@@ -176,11 +153,11 @@ class DataStandardizer:
             return ""
         
         # Remove common prefixes
-        value = re.sub(r'^(Brand|Make|Manufacturer|Company|Mfg)\s*[:;-]\s*', '', value, flags=re.IGNORECASE)
+        value = MANUFACTURER_PREFIX_PATTERN.sub('', value)
         
         # Clean up punctuation and whitespace
         value = value.strip('.,:;-')
-        value = re.sub(r'\s+', ' ', value).strip()
+        value = WHITESPACE_PATTERN.sub(' ', value).strip()
         
         # Validate length
         if len(value) < 2 or len(value) > 50:
@@ -194,7 +171,7 @@ class DataStandardizer:
             return ""
         
         # Extract numeric value
-        match = re.search(r'(\d+)', str(value))
+        match = NUMBER_PATTERN.search(str(value))
         if match:
             return match.group(1)
         
@@ -206,7 +183,7 @@ class DataStandardizer:
             return ""
         
         # Extract numeric value with optional unit
-        match = re.search(r'(\d+(?:\.\d+)?)\s*([A-Za-z]*)', str(value))
+        match = NUMBER_WITH_UNIT_PATTERN.search(str(value))
         if match:
             number = match.group(1)
             unit = match.group(2)
@@ -220,7 +197,7 @@ class DataStandardizer:
             return ""
         
         # Look for frequency range patterns
-        match = re.search(r'(\d+(?:\.\d+)?)\s*(?:Hz|kHz)?\s*[-–]\s*(\d+(?:\.\d+)?)\s*(?:Hz|kHz)?', str(value), re.IGNORECASE)
+        match = FREQUENCY_RANGE_PATTERN.search(str(value))
         if match:
             return f"{match.group(1)}-{match.group(2)} Hz"
         
@@ -232,7 +209,7 @@ class DataStandardizer:
             return ""
         
         # Look for resolution patterns
-        match = re.search(r'(\d+)\s*[x×]\s*(\d+)', str(value))
+        match = RESOLUTION_PATTERN.search(str(value))
         if match:
             width, height = int(match.group(1)), int(match.group(2))
             # Validate reasonable resolution values
@@ -247,7 +224,7 @@ class DataStandardizer:
             return ""
         
         # Clean up whitespace and punctuation
-        value = re.sub(r'\s+', ' ', str(value)).strip()
+        value = WHITESPACE_PATTERN.sub(' ', str(value)).strip()
         value = value.strip('.,:;-')
         
         # Validate length
@@ -256,46 +233,179 @@ class DataStandardizer:
         
         return value
     
-    def _validate_required_fields(self, item, schema):
-        """Validate that required fields are present and valid."""
-        required_fields = schema.get("required_fields", [])
-        
-        for field in required_fields:
-            if field not in item or not item[field]:
-                return False
-        
-        return True
+    def standardize_frame(self, frame):
+        """Clean and validate a DataFrame of equipment items, one column per raw field.
+        
+        The vectorized counterpart of clean_and_validate_data: columns are
+        renamed through the field mapping once and each is cleaned as a
+        whole (see _clean_column). The required fields are cleaned first, so
+        that rows missing one for their type are dropped with boolean masks
+        before the other columns are cleaned. Missing values (NaN) count as
+        absent fields, and of several columns mapping to the same field the
+        last non-empty one wins, as for the keys of an item dict.
+        
+        Returns the valid rows, keeping their index, with a column per
+        standard field (NaN where empty) and the equipment_type column;
+        the CATEGORY_FIELDS columns are categorical.
+        """
+        standard_fields = [self.standardize_field_name(column) for column in frame.columns]
+        required_fields = {field for fields in self.validator.required_fields.values() for field in fields}
+        
+        if 'equipment_type' in frame.columns:
+            equipment_types = frame['equipment_type'].fillna('other')
+        else:
+            equipment_types = pd.Series('other', index=frame.index, dtype=object)
+        
+        # Ensure required fields are present, using the schema of each row's type
+        required = self._clean_columns(frame, standard_fields, required_fields)
+        schema_types = equipment_types.map(self.validator.schema_type)
+        valid = pd.Series(True, index=frame.index)
+        for equipment_type, fields in self.validator.required_fields.items():
+            rows = schema_types == equipment_type
+            for field in fields:
+                present = required[field].notna() if field in required else False
+                valid &= ~rows | present
+        
+        frame = frame[valid]
+        optional_fields = set(standard_fields) - required_fields
+        optional = self._clean_columns(frame, standard_fields, optional_fields)
+        
+        cleaned = {
+            field: required[field][valid] if field in required else optional[field]
+            for field in dict.fromkeys(standard_fields)
+        }
+        standardized = pd.DataFrame(cleaned, index=frame.index)
+        standardized['equipment_type'] = equipment_types[valid]
+        for field in CATEGORY_FIELDS.intersection(standardized.columns):
+            standardized[field] = standardized[field].astype('category')
+        return standardized
+    
+    def _clean_columns(self, frame, standard_fields, fields):
+        """Return {field: cleaned values} for the columns of frame whose standard field is in fields."""
+        cleaned = {}
+        for column, standard_field in zip(frame.columns, standard_fields):
+            if standard_field not in fields:
+                continue
+            values = self._clean_column(standard_field, frame[column])
+            if standard_field in cleaned:
+                values = values.fillna(cleaned[standard_field])
+            cleaned[standard_field] = values
+        return cleaned
+    
+    def _clean_column(self, field_name, values):
+        """Clean a column of raw values as _clean_field_value cleans each, with NaN for empty results.
+        
+        Each distinct value is cleaned once and the results are spread back
+        over the rows, as columns of equipment data repeat a lot.
+        """
+        present = values.notna() & values.astype(bool)
+        codes, uniques = pd.factorize(values[present].astype(str))
+        text = pd.Series(uniques, dtype=object).str.strip()
+        text = text[text != '']
+        
+        text = self.column_cleaners.get(field_name, self._clean_text_column)(text)
+        
+        text = text[text != ''].reindex(range(len(uniques)))
+        cleaned = pd.Series(text.to_numpy()[codes], index=values.index[present], dtype=object)
+        return cleaned.reindex(values.index)
+    
+    def _clean_model_column(self, values):
+        """Clean model names as _clean_model_name does."""
+        values = replace_column(values, MODEL_PREFIX_PATTERN, '')
+        values = replace_column(values, MODEL_QUANTITY_PATTERN, '')
+        values = values.str.strip('.,:;-')
+        values = replace_column(values, WHITESPACE_PATTERN, ' ').str.strip()
+        lengths = values.str.len()
+        return values.where((lengths >= 2) & (lengths <= 100), '')
+    
+    def _clean_manufacturer_column(self, values):
+        """Clean manufacturer names as _clean_manufacturer_name does."""
+        values = replace_column(values, MANUFACTURER_PREFIX_PATTERN, '')
+        values = values.str.strip('.,:;-')
+        values = replace_column(values, WHITESPACE_PATTERN, ' ').str.strip()
+        lengths = values.str.len()
+        return values.where((lengths >= 2) & (lengths <= 50), '')
+    
+    def _clean_quantity_column(self, values):
+        """Clean quantities as _clean_quantity does."""
+        return extract_column(values, NUMBER_PATTERN)
+    
+    def _clean_numeric_column(self, values):
+        """Clean numeric fields as _clean_numeric_field does."""
+        parts = values.str.extract(NUMBER_WITH_UNIT_PATTERN.pattern, NUMBER_WITH_UNIT_PATTERN.flags)
+        return parts[0] + parts[1].fillna('')
+    
+    def _clean_frequency_response_column(self, values):
+        """Clean frequency responses as _clean_frequency_response does."""
+        parts = values.str.extract(FREQUENCY_RANGE_PATTERN.pattern, FREQUENCY_RANGE_PATTERN.flags)
+        return (parts[0] + '-' + parts[1] + ' Hz').fillna(values)
+    
+    def _clean_resolution_column(self, values):
+        """Clean resolutions as _clean_resolution does."""
+        parts = values.str.extract(RESOLUTION_PATTERN.pattern, RESOLUTION_PATTERN.flags).dropna()
+        width, height = parts[0].map(int), parts[1].map(int)
+        # Validate reasonable resolution values
+        valid = width.between(100, 10000) & height.between(100, 10000)
+        values = values.copy()
+        values[valid[valid].index] = width[valid].astype(str) + 'x' + height[valid].astype(str)
+        return values
+    
+    def _clean_text_column(self, values):
+        """Clean general text fields as _clean_text_field does."""
+        values = replace_column(values, WHITESPACE_PATTERN, ' ').str.strip()
+        values = values.str.strip('.,:;-')
+        
+        # Truncate very long text
+        long = values.str.len() > 500
+        values[long] = values[long].str[:500] + "..."
+        return values
     
     def standardize_venue_data(self, venue_data):
-        """Standardize all equipment data for a single venue."""
+        """Standardize all equipment data for a single venue.
+        
+        The equipment can be a list of EquipmentItems (or item dicts) or a
+        DataFrame with a column per field (e.g. from
+        PDFProcessor.extract_equipment_frame), which is standardized in one go
+        by standardize_frame. Either way the standardized equipment is a list
+        of EquipmentItems. The venue name and source are held once, in the
+        returned venue dict, rather than on every item; the exports add them
+        to each item.
+        """
         if not venue_data or 'equipment' not in venue_data:
             return None
         
-        standardized_equipment = []
-        
-        for equipment_item in venue_data['equipment']:
-            equipment_type = equipment_item.get('equipment_type', 'other')
-            
-            # Clean and validate the equipment item
-            standardized_item = self.clean_and_validate_data(equipment_item, equipment_type)
+        equipment = venue_data['equipment']
+        if isinstance(equipment, pd.DataFrame):
+            frame = self.standardize_frame(equipment)
+            standardized_equipment = list(self._iter_frame_items(frame))
+        else:
+            standardized_equipment = []
             
-            if standardized_item:
-                # Add venue information
-                standardized_item['venue_name'] = venue_data['venue_name']
-                standardized_item['pdf_source'] = venue_data.get('pdf_source', '')
+            for equipment_item in equipment:
+                equipment_type = equipment_item.get('equipment_type', 'other')
+                
+                # Clean and validate the equipment item
+                standardized_item = self.clean_and_validate_data(equipment_item, equipment_type)
                 
-                standardized_equipment.append(standardized_item)
+                if standardized_item:
+                    standardized_equipment.append(standardized_item)
         
         # Remove duplicates
         standardized_equipment = self._remove_duplicates(standardized_equipment)
         
         return {
-            'venue_name': venue_data['venue_name'],
-            'pdf_source': venue_data.get('pdf_source', ''),
+            'venue_name': _intern(venue_data['venue_name']),
+            'pdf_source': _intern(venue_data.get('pdf_source', '')),
             'equipment': standardized_equipment,
             'total_items': len(standardized_equipment)
         }
     
+    @staticmethod
+    def _iter_frame_items(frame):
+        """Yield the rows of an equipment DataFrame as EquipmentItems, leaving out missing values."""
+        for record in frame.to_dict('records'):
+            yield EquipmentItem.from_dict({field: value for field, value in record.items() if not pd.isna(value)})
+    
     def _remove_duplicates(self, equipment_list):
         """Remove duplicate equipment items."""
         unique_items = []
@@ -327,20 +437,47 @@ class DataStandardizer:
         
         return standardized_venues
     
+    def build_venue_table(self, standardized_data):
+        """Return a DataFrame with the metadata of each standardized venue, one row per venue.
+        
+        The row number of a venue is its position in standardized_data, and
+        is the venue code of its items in build_equipment_frame.
+        """
+        return pd.DataFrame({
+            'venue_name': [venue['venue_name'] for venue in standardized_data],
+            'pdf_source': [venue.get('pdf_source', '') for venue in standardized_data],
+            'total_items': [len(venue['equipment']) for venue in standardized_data],
+        }, columns=VENUE_FIELDS + ['total_items'])
+    
+    def build_equipment_frame(self, standardized_data):
+        """Return the equipment of all standardized venues as one DataFrame.
+        
+        A row per item, with a column per field (see equipment_item.to_frame)
+        and the VENUE_FIELDS of its venue. Each item only gets the code of its
+        venue; the venue fields are category columns with the venue table as
+        categories, and so are the CATEGORY_FIELDS columns, so that the
+        repeated strings are held once.
+        """
+        frame = to_frame([item for venue in standardized_data for item in venue['equipment']])
+        
+        venues = self.build_venue_table(standardized_data)
+        venue_codes = np.repeat(np.arange(len(venues)), venues['total_items'])
+        for field in VENUE_FIELDS:
+            values = pd.Categorical(venues[field])
+            frame[field] = pd.Categorical.from_codes(values.codes[venue_codes], dtype=values.dtype)
+        
+        for field in CATEGORY_FIELDS.intersection(frame.columns):
+            frame[field] = frame[field].astype('category')
+        return frame
+    
     def export_to_csv(self, standardized_data, output_file):
         """Export standardized data to CSV format."""
-        all_equipment = []
-        
-        # Flatten all equipment from all venues
-        for venue in standardized_data:
-            all_equipment.extend(venue['equipment'])
-        
-        if not all_equipment:
+        if not any(venue['equipment'] for venue in standardized_data):
             print("No equipment data to export")
             return
         
         # Create DataFrame
-        df = pd.DataFrame(all_equipment)
+        df = self.build_equipment_frame(standardized_data)
         
         # Ensure consistent column order
         standard_columns = [
@@ -365,43 +502,58 @@ class DataStandardizer:
         print(f"  📊 Exported {len(df)} equipment items to CSV")
     
     def export_to_json(self, standardized_data, output_file):
-        """Export standardized data to JSON format."""
+        """Export standardized data to JSON format.
+        
+        The file is written one venue at a time, so only the item dicts of
+        the venue being written exist at once (each item gets the fields of
+        its venue there). It is the same as json.dump with indent=2 gives
+        for the whole structure.
+        """
         # Create a structured JSON output
-        json_data = {
-            'metadata': {
-                'total_venues': len(standardized_data),
-                'total_equipment': sum(len(venue['equipment']) for venue in standardized_data),
-                'equipment_types': list(set(
-                    item['equipment_type'] 
-                    for venue in standardized_data 
-                    for item in venue['equipment']
-                )),
-                'schema_version': '1.0'
-            },
-            'venues': []
+        metadata = {
+            'total_venues': len(standardized_data),
+            'total_equipment': sum(len(venue['equipment']) for venue in standardized_data),
+            'equipment_types': list(set(
+                item['equipment_type'] 
+                for venue in standardized_data 
+                for item in venue['equipment']
+            )),
+            'schema_version': self.validator.version
         }
         
-        for venue in standardized_data:
-            # Group equipment by type for better organization
-            equipment_by_type = {}
-            for item in venue['equipment']:
-                eq_type = item['equipment_type']
-                if eq_type not in equipment_by_type:
-                    equipment_by_type[eq_type] = []
-                equipment_by_type[eq_type].append(item)
-            
-            venue_data = {
-                'venue_name': venue['venue_name'],
-                'pdf_source': venue.get('pdf_source', ''),
-                'total_equipment': venue['total_items'],
-                'equipment_by_type': equipment_by_type,
-                'all_equipment': venue['equipment']
-            }
-            
-            json_data['venues'].append(venue_data)
-        
         # Export to JSON
         with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(json_data, f, indent=2, ensure_ascii=False)
+            f.write('{\n  "metadata": ' + self._dump_json(metadata, 1) + ',\n  "venues": [')
+            
+            for index, venue in enumerate(standardized_data):
+                # Add the venue fields to each item
+                venue_fields = {'venue_name': venue['venue_name'], 'pdf_source': venue.get('pdf_source', '')}
+                equipment = [{**item.to_dict(), **venue_fields} for item in venue['equipment']]
+                
+                # Group equipment by type for better organization
+                equipment_by_type = {}
+                for item in equipment:
+                    eq_type = item['equipment_type']
+                    if eq_type not in equipment_by_type:
+                        equipment_by_type[eq_type] = []
+                    equipment_by_type[eq_type].append(item)
+                
+                venue_data = {
+                    'venue_name': venue['venue_name'],
+                    'pdf_source': venue.get('pdf_source', ''),
+                    'total_equipment': venue['total_items'],
+                    'equipment_by_type': equipment_by_type,
+                    'all_equipment': equipment
+                }
+                
+                f.write((',\n    ' if index else '\n    ') + self._dump_json(venue_data, 2))
+            
+            f.write('\n  ]\n}' if standardized_data else ']\n}')
         
-        print(f"  📄 Exported structured JSON data for {len(standardized_data)} venues")
\ No newline at end of file
+        print(f"  📄 Exported structured JSON data for {len(standardized_data)} venues")
+    
+    @staticmethod
+    def _dump_json(data, level):
+        """Return data as json.dump with indent=2 writes it at the given nesting level."""
+        # JSON strings escape newlines, so every newline is an indentation
+        return json.dumps(data, indent=2, ensure_ascii=False).replace('\n', '\n' + '  ' * level)
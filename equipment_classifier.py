@@ -0,0 +1,110 @@
+"""
+Equipment Classifier Module
+
+This module assigns an equipment type (lighting, sound, video or other) to a
+piece of equipment text. The text is split into word tokens and each token is
+looked up in a keyword table built once, so keywords only match whole words
+("led" no longer matches "called", nor "pa" "space").
+"""
+
+
+import numpy as np
+
+from pattern_registry import register
+
+# Equipment type keywords for classification
+EQUIPMENT_KEYWORDS = {
+    "lighting": [
+        "lighting", "light", "fixture", "dimmer", "lantern", "par", "fresnel",
+        "profile", "flood", "led", "moving", "wash", "spot", "beam", "strobe",
+        "haze", "fog", "dmx", "channel", "circuit", "luminaire"
+    ],
+    "sound": [
+        "sound", "audio", "speaker", "microphone", "mic", "console", "mixer",
+        "amplifier", "amp", "monitor", "pa", "system", "wireless", "radio",
+        "headset", "earpiece", "di", "direct", "box", "compressor", "eq"
+    ],
+    "video": [
+        "video", "projection", "projector", "screen", "display", "monitor",
+        "camera", "led", "wall", "panel", "visual", "hdmi", "sdi", "dvi",
+        "switcher", "scaler", "converter", "plasma", "lcd", "oled"
+    ]
+}
+
+# Words of lower-cased text (see pattern_registry.py)
+TOKEN_PATTERN = register("equipment_classifier.token", r"[a-z0-9]+")
+
+class EquipmentClassifier:
+    """Classifies equipment text by counting whole-word keyword hits per type."""
+    
+    def __init__(self, equipment_keywords=EQUIPMENT_KEYWORDS):
+        """Build the keyword lookup.
+        
+        equipment_keywords maps each equipment type to its keywords. When
+        types score the same, the one listed first wins.
+        """
+        self.types = list(equipment_keywords)
+        
+        # Keyword -> indices of the types it counts towards (e.g. "led" is
+        # both lighting and video)
+        self.keyword_types = {}
+        for index, keywords in enumerate(equipment_keywords.values()):
+            for keyword in keywords:
+                self.keyword_types.setdefault(keyword.lower(), []).append(index)
+    
+    def _keyword(self, token):
+        """Return the keyword a token stands for (allowing simple plurals), or None."""
+        if token in self.keyword_types:
+            return token
+        if token.endswith("es") and token[:-2] in self.keyword_types:
+            return token[:-2]
+        if token.endswith("s") and token[:-1] in self.keyword_types:
+            return token[:-1]
+        return None
+    
+    def _keywords_in(self, text):
+        """Return the set of distinct keywords in text."""
+        keywords = {self._keyword(token) for token in TOKEN_PATTERN.findall(text.lower())}
+        keywords.discard(None)
+        return keywords
+    
+    def classify(self, text):
+        """Determine the equipment type of a single piece of text."""
+        scores = [0] * len(self.types)
+        if text:
+            for keyword in self._keywords_in(text):
+                for index in self.keyword_types[keyword]:
+                    scores[index] += 1
+        
+        # Return the type with the highest score, or 'other' if no keyword matched
+        max_score = max(scores)
+        if max_score > 0:
+            return self.types[scores.index(max_score)]
+        return 'other'
+    
+    def classify_batch(self, texts):
+        """Determine the equipment types of many texts at once.
+        
+        Keyword hits for every text are collected in one pass, summed into a
+        texts x types score matrix and the winning type of each row is picked
+        in a single vectorized step. Non-string entries (e.g. NaN from a CSV
+        column) are classified as 'other'. Returns a list of types in the
+        same order as texts.
+        """
+        texts = list(texts)
+        rows, columns = [], []
+        for row, text in enumerate(texts):
+            if isinstance(text, str) and text:
+                for keyword in self._keywords_in(text):
+                    for index in self.keyword_types[keyword]:
+                        rows.append(row)
+                        columns.append(index)
+        
+        scores = np.zeros((len(texts), len(self.types) + 1), dtype=np.int32)
+        np.add.at(scores, (rows, columns), 1)
+        
+        # Rows without any hit fall through to the extra 'other' column;
+        # argmax returns the first of tied types, matching classify()
+        scores[:, -1] = scores.max(axis=1) == 0
+        types = np.array(self.types + ['other'], dtype=object)
+        return types[scores.argmax(axis=1)].tolist()
@@ -0,0 +1,144 @@
+"""
+Equipment Item Module
+
+This module defines EquipmentItem, the record PDFProcessor produces for each
+piece of equipment found in a PDF and DataStandardizer cleans, validates and
+exports. It replaces the dict used for every item before: a dict carries a
+hash table sized for its keys, while an EquipmentItem has __slots__ and
+keeps a single pointer per field, which matters with millions of items.
+Items do not hold the name and source of their venue, which the venue they
+belong to holds once (see DataStandardizer.build_venue_table).
+
+Fields without a value are None and, like the missing keys of the item dicts
+used before, are left out of items() and to_dict(). Items still support the
+part of the dict interface the pipeline uses (item['model'], item.get(...),
+item.items()), so code written for item dicts works with either. Fields not
+in FIELDS (e.g. from item dicts of other sources) go to a small extras dict,
+created only for the items that have some. Items are converted to dicts only
+at the edges: the CSV and JSON exports and the extraction cache. to_frame
+turns a list of items into a DataFrame without building a dict per item.
+"""
+
+from operator import attrgetter
+
+import pandas as pd
+
+# Fields with a slot, in the order items() returns them: the fields parsed
+# by PDFProcessor. The other fields of the schema (max_spl, notes, ...) only
+# come from other sources of items and go to extras.
+FIELDS = (
+    'model', 'manufacturer', 'quantity', 'equipment_type', 'raw_text',
+    'power', 'dmx_channels', 'frequency_response', 'resolution',
+)
+_FIELD_SET = frozenset(FIELDS)
+
+# Returns the tuple of an item's FIELDS values
+_field_values = attrgetter(*FIELDS)
+
+class EquipmentItem:
+    """A piece of equipment, with a slot per field and None for missing ones."""
+    
+    __slots__ = FIELDS + ('extras',)
+    
+    def __init__(self, model=None, manufacturer=None, quantity=None, equipment_type=None, raw_text=None,
+                 power=None, dmx_channels=None, frequency_response=None, resolution=None):
+        self.model = model
+        self.manufacturer = manufacturer
+        self.quantity = quantity
+        self.equipment_type = equipment_type
+        self.raw_text = raw_text
+        self.power = power
+        self.dmx_channels = dmx_channels
+        self.frequency_response = frequency_response
+        self.resolution = resolution
+        
+        # Fields not in FIELDS, if any
+        self.extras = None
+    
+    @classmethod
+    def from_dict(cls, fields):
+        """Build an item from an item dict (or any mapping of field names to values)."""
+        item = cls()
+        for field, value in fields.items():
+            item[field] = value
+        return item
+    
+    def to_dict(self):
+        """Return the fields with a value as a dict, slot fields first."""
+        return dict(self.items())
+    
+    def copy(self):
+        """Return a shallow copy of the item."""
+        item = EquipmentItem(*_field_values(self))
+        item.extras = dict(self.extras) if self.extras else None
+        return item
+    
+    def items(self):
+        """Yield (field, value) for the fields with a value, as dict.items() does."""
+        for field, value in zip(FIELDS, _field_values(self)):
+            if value is not None:
+                yield field, value
+        if self.extras:
+            yield from self.extras.items()
+    
+    def keys(self):
+        """Yield the fields with a value."""
+        for field, _ in self.items():
+            yield field
+    
+    def get(self, field, default=None):
+        """Return the value of a field, or default if it has none."""
+        if field in _FIELD_SET:
+            value = getattr(self, field)
+        else:
+            value = self.extras.get(field) if self.extras else None
+        return default if value is None else value
+    
+    def __getitem__(self, field):
+        value = self.get(field)
+        if value is None:
+            raise KeyError(field)
+        return value
+    
+    def __setitem__(self, field, value):
+        if field in _FIELD_SET:
+            setattr(self, field, value)
+        elif self.extras is None:
+            self.extras = {field: value}
+        else:
+            self.extras[field] = value
+    
+    def __contains__(self, field):
+        return self.get(field) is not None
+    
+    def __iter__(self):
+        return self.keys()
+    
+    def __eq__(self, other):
+        if not isinstance(other, EquipmentItem):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+    
+    def __repr__(self):
+        fields = ", ".join(f"{field}={value!r}" for field, value in self.items())
+        return f"EquipmentItem({fields})"
+
+def to_frame(items):
+    """Return a DataFrame of EquipmentItems with a column per field any of them has.
+    
+    Each column is read from the slot of every item at once rather than
+    through a dict per item. The columns of FIELDS come first, in that
+    order, with object dtype and None for missing values, then the extra
+    fields in order of first appearance, with NaN for missing values.
+    """
+    columns = {}
+    for field in FIELDS:
+        values = pd.Series(list(map(attrgetter(field), items)), dtype=object)
+        if values.notna().any():
+            columns[field] = values
+    frame = pd.DataFrame(columns, index=range(len(items)))
+    
+    extras = [item.extras or {} for item in items]
+    if any(extras):
+        frame = frame.join(pd.DataFrame(extras, index=frame.index))
+    return frame
@@ -8,7 +8,6 @@ using text extraction and pattern matching.
 import os
 import sys
 import json
-import re
 from pathlib import Path
 import pandas as pd
 
@@ -20,22 +19,44 @@ except ImportError:
     print("pip install PyPDF2 pandas")
     sys.exit(1)
 
-def extract_text_from_pdf(pdf_path):
-    """Extract full text from a PDF file using PyPDF2."""
-    text = ""
+from pattern_registry import register
+from pdf_text import extract_page_texts, read_pdf_title
+import regex_engine as re
+from section_index import SectionIndex
+
+# Number of leading pages searched for the venue name
+VENUE_NAME_PAGES = 3
+
+# Patterns like "XXX Theatre", "XXX Hall", etc., tried in order (see pattern_registry.py)
+VENUE_NAME_PATTERNS = [
+    register("extract_venue_info.venue_with_kind", r"([A-Z][a-zA-Z\s]+) (Theatre|Theater|Hall|Venue|Auditorium|Arena|Stadium)", re.IGNORECASE),
+    register("extract_venue_info.known_venue", r"(Sydney Opera House|Royal Albert Hall|Carnegie Hall|Lincoln Center)", re.IGNORECASE),
+    register("extract_venue_info.title_label", r"TECHNICAL SPECIFICATIONS[:\s]+(.*?)[\n\r]", re.IGNORECASE),
+    register("extract_venue_info.venue_label", r"VENUE[:\s]+(.*?)[\n\r]", re.IGNORECASE),
+]
+
+def extract_pages_from_pdf(pdf_path, jobs=None, max_pages=None):
+    """Extract the text of each page (or the first max_pages pages) of a PDF file.
+    
+    Pages are extracted in parallel using `jobs` worker processes
+    (default: one per CPU core).
+    """
     try:
-        with open(pdf_path, 'rb') as file:
-            reader = PyPDF2.PdfReader(file)
-            for page_num in range(len(reader.pages)):
-                page = reader.pages[page_num]
-                text += page.extract_text() + "\n\n"
-        return text
+        return extract_page_texts(pdf_path, jobs=jobs or os.cpu_count(), max_pages=max_pages)
     except Exception as e:
         print(f"Error extracting text: {e}")
-        return ""
+        return []
 
-def identify_venue_name(pdf_path):
-    """Try to identify the venue name from the PDF filename or content."""
+def extract_text_from_pdf(pdf_path, jobs=None, max_pages=None):
+    """Extract full text from a PDF file using PyPDF2."""
+    return "".join(page_text + "\n\n" for page_text in extract_pages_from_pdf(pdf_path, jobs, max_pages))
+
+def identify_venue_name(pdf_path, text=None, max_pages=VENUE_NAME_PAGES):
+    """Try to identify the venue name from the PDF filename or content.
+    
+    Only the first max_pages pages are searched; pass their text if it has
+    already been extracted. The PDF metadata title is used as a fallback.
+    """
     # First, try to extract from filename
     filename = Path(pdf_path).stem
     # Clean up the filename to get a reasonable venue name
@@ -43,185 +64,198 @@ def identify_venue_name(pdf_path):
     
     # If the filename is just numbers or too short, try to extract from content
     if venue_name.isdigit() or len(venue_name) < 5:
-        # Extract first page text and look for venue name patterns
+        # Extract the leading pages' text and look for venue name patterns
         try:
-            text = extract_text_from_pdf(pdf_path)
+            if text is None:
+                text = extract_text_from_pdf(pdf_path, max_pages=max_pages)
             # Look for patterns like "XXX Theatre", "XXX Hall", etc.
-            venue_patterns = [
-                r"([A-Z][a-zA-Z\s]+) (Theatre|Theater|Hall|Venue|Auditorium|Arena|Stadium)",
-                r"(Sydney Opera House|Royal Albert Hall|Carnegie Hall|Lincoln Center)",
-                r"TECHNICAL SPECIFICATIONS[:\s]+(.*?)[\n\r]",
-                r"VENUE[:\s]+(.*?)[\n\r]"
-            ]
-            
-            for pattern in venue_patterns:
-                matches = re.search(pattern, text, re.IGNORECASE)
+            for pattern in VENUE_NAME_PATTERNS:
+                matches = pattern.search(text)
                 if matches:
                     return matches.group(0).strip()
+            
+            # Fall back to the document title from the PDF metadata
+            title = read_pdf_title(pdf_path)
+            if len(title) > 5 and len(title) < 100:
+                return title
         except:
             pass
     
     return venue_name
 
+# Find potential equipment lists (numbered or bulleted lists). Numbered items
+# may only start, and end, at the first digit of a number, so that a long run
+# of digits is not rescanned from each of its positions.
+LIST_PATTERNS = [
+    register("extract_venue_info.numbered_list", r"(?<!\d)(\d+)[\.|\)](.*?)(?=(?<!\d)(?:\d+)[\.|\)]|\Z)", re.MULTILINE),  # Numbered lists: 1. Item 1, 2. Item 2
+    register("extract_venue_info.bulleted_list", r"[\•|\-|\*|\–](.*?)(?=[\•|\-|\*|\–]|\Z)", re.MULTILINE),  # Bulleted lists: • Item 1, • Item 2
+    register("extract_venue_info.labelled_list", r"(?<![A-Za-z\s])([A-Za-z\s]+):\s*(\d+)[x|\s]([A-Za-z0-9\s\-\(\)]+)", re.MULTILINE)  # Format: Item name: 10x Description
+]
+
+# Extract quantities and models using common patterns: (pattern, quantity first).
+# The model patterns only start at the beginning of a run of model characters
+# (a match starting inside the run would also match from its beginning), and
+# whitespace before the separator is already part of the model.
+QUANTITY_MODEL_PATTERNS = [
+    (register("extract_venue_info.quantity_first", r"(?<!\d)(\d+)\s*[x|×]\s*([A-Za-z0-9\s\-\(\)\'\"\.]+)"), True),  # 10x Item description
+    (register("extract_venue_info.quantity_after_colon", r"(?<![A-Za-z0-9\s\-\(\)\'\"\.])([A-Za-z0-9\s\-\(\)\'\"\.]+):\s*(\d+)"), False),  # Item description: 10
+    (register("extract_venue_info.quantity_after_dash", r"(?<![A-Za-z0-9\s\-\(\)\'\"\.])([A-Za-z0-9\s\-\(\)\'\"\.]+)[-|–]\s*(\d+)"), False),  # Item description - 10
+]
+
+# A table cell word: letters, digits and - ( ) ' " .
+TABLE_WORD_PATTERN = register("extract_venue_info.table_word", r"[A-Za-z0-9\-\(\)\'\"\.]+")
+# A word that can name a model: letters, digits and dashes, with a letter
+MODEL_WORD_PATTERN = register("extract_venue_info.model_word", r"[A-Za-z0-9\-]*[A-Za-z][A-Za-z0-9\-]*")
+# Page header or footer line: "Page 12 ..."
+PAGE_LINE_PATTERN = register("extract_venue_info.page_line", r"\s*Page\s+\d+\b", re.IGNORECASE)
+
+# Most words in the model cell of a table row; longer runs are running text
+MAX_MODEL_WORDS = 6
+
+def split_quantity_model(item):
+    """Return (quantity, model) for a list item, or None if it has no quantity."""
+    for qm_pattern, quantity_first in QUANTITY_MODEL_PATTERNS:
+        qm_match = qm_pattern.search(item)
+        if qm_match:
+            if quantity_first:
+                return qm_match.group(1), qm_match.group(2).strip()
+            return qm_match.group(2), qm_match.group(1).strip()
+    return None
+
+def is_plausible_model(words):
+    """Return whether table cell words can name a model.
+    
+    The model must be short and have a word of at least two characters
+    with a letter in it (e.g. "SM58" or "Fresnel"), not only numbers.
+    """
+    return len(words) <= MAX_MODEL_WORDS and any(
+        len(word) >= 2 and MODEL_WORD_PATTERN.fullmatch(word) for word in words
+    )
+
+def iter_table_rows(text):
+    """Yield (model, quantity, description) for each table row found in text.
+    
+    Every line is split into words and cut into runs of table cell words.
+    A run gives a Model, Quantity, Description row at its last number after
+    the first word (the description may be empty, as in two-column
+    Model/Quantity tables) and, if it starts with a number and has at least
+    three words, a Quantity, Model, Description row. Rows are only given
+    for a plausible model (see is_plausible_model). Headings, table of
+    contents entries ("6 Lighting 18", see SectionIndex.is_contents_entry)
+    and page header or footer lines ("Page 12 ...") are skipped. Each word is looked at a fixed number of times, so this is linear in the
+    length of the text.
+    """
+    section_index = SectionIndex()
+    for line in text.split("\n"):
+        if (PAGE_LINE_PATTERN.match(line) or section_index.is_contents_entry(line)
+                or section_index.parse_heading(line)):
+            continue
+        
+        runs = [[]]
+        for word in line.split():
+            if TABLE_WORD_PATTERN.fullmatch(word):
+                runs[-1].append(word)
+            elif runs[-1]:
+                runs.append([])
+        
+        for words in runs:
+            numbers = [index for index, word in enumerate(words) if word.isdigit()]
+            if numbers and numbers[-1] >= 1 and is_plausible_model(words[:numbers[-1]]):
+                index = numbers[-1]
+                yield " ".join(words[:index]), words[index], " ".join(words[index + 1:])
+            if numbers and numbers[0] == 0 and len(words) >= 3 and is_plausible_model(words[1:-1]):
+                yield " ".join(words[1:-1]), words[0], words[-1]
+
 def extract_equipment_lists(text):
-    """Extract equipment lists from text using pattern matching."""
+    """Extract equipment lists from text using pattern matching.
+    
+    Sections are found by a single pass of the section index and all patterns
+    run in linear time, so the cost grows with the length of the text only.
+    """
     equipment_data = {
         "lighting": [],
         "sound": [],
         "video": []
     }
     
-    # Look for sections containing equipment information
-    sections = {
-        "lighting": ["lighting equipment", "lighting inventory", "lighting fixtures", "dimmer", "lantern"],
-        "sound": ["sound equipment", "audio equipment", "audio inventory", "sound system", "microphone", "console", "mixing desk"],
-        "video": ["video equipment", "projection", "screen", "display", "visual equipment"]
-    }
-    
-    # Find potential equipment lists (numbered or bulleted lists)
-    list_patterns = [
-        r"(\d+)[\.|\)](.*?)(?=(?:\d+)[\.|\)]|\Z)",  # Numbered lists: 1. Item 1, 2. Item 2
-        r"[\•|\-|\*|\–](.*?)(?=[\•|\-|\*|\–]|\Z)",  # Bulleted lists: • Item 1, • Item 2
-        r"([A-Za-z\s]+):\s*(\d+)[x|\s]([A-Za-z0-9\s\-\(\)]+)"  # Format: Item name: 10x Description
-    ]
-    
-    # Extract quantities and models using common patterns
-    quantity_model_patterns = [
-        r"(\d+)\s*[x|×]\s*([A-Za-z0-9\s\-\(\)\'\"\.]+)",  # 10x Item description
-        r"([A-Za-z0-9\s\-\(\)\'\"\.]+)\s*:\s*(\d+)",  # Item description: 10
-        r"([A-Za-z0-9\s\-\(\)\'\"\.]+)\s*[-|–]\s*(\d+)",  # Item description - 10
-    ]
-    
-    # For each equipment type, look for relevant sections and extract equipment
-    for eq_type, keywords in sections.items():
-        for keyword in keywords:
-            # Find sections containing the keyword
-            keyword_pattern = re.compile(r"(?i)(?:^|\n).*?" + keyword + r".*?(?:\n|$)(.*?)(?=(?:^|\n).*?(?:" + "|".join(["lighting", "sound", "audio", "video", "power", "rigging", "staging", "dimensions", "specifications"]) + r").*?(?:\n|$)|\Z)", re.DOTALL)
-            
-            section_matches = keyword_pattern.findall(text)
-            
-            for section in section_matches:
-                # Try to extract equipment from this section
-                for pattern in list_patterns:
-                    matches = re.findall(pattern, section, re.MULTILINE)
-                    for match in matches:
-                        # Normalize the match format
-                        if isinstance(match, tuple):
-                            if len(match) == 2:  # Simple numbered or bulleted list
-                                item = match[1].strip()
-                                
-                                # Try to extract quantity and model
-                                for qm_pattern in quantity_model_patterns:
-                                    qm_match = re.search(qm_pattern, item)
-                                    if qm_match:
-                                        if qm_pattern.startswith(r"(\d+)"):  # Quantity first
-                                            quantity = qm_match.group(1)
-                                            model = qm_match.group(2).strip()
-                                        else:  # Model first
-                                            model = qm_match.group(1).strip()
-                                            quantity = qm_match.group(2)
-                                        
-                                        equipment_data[eq_type].append({
-                                            "model": model,
-                                            "quantity": quantity,
-                                            "equipment_type": eq_type,
-                                            "raw_text": item
-                                        })
-                                        break
-                                else:
-                                    # If no quantity-model pattern matched, just store the raw text
-                                    equipment_data[eq_type].append({
-                                        "raw_text": item,
-                                        "equipment_type": eq_type
-                                    })
-                            elif len(match) == 3:  # Item: Quantity x Description format
-                                model = match[0].strip()
-                                quantity = match[1].strip()
-                                description = match[2].strip()
-                                
-                                equipment_data[eq_type].append({
-                                    "model": model if model else description,
-                                    "quantity": quantity,
-                                    "equipment_type": eq_type,
-                                    "raw_text": f"{model}: {quantity}x {description}"
-                                })
-                        else:  # Single string match
-                            item = match.strip()
-                            
-                            # Try to extract quantity and model
-                            for qm_pattern in quantity_model_patterns:
-                                qm_match = re.search(qm_pattern, item)
-                                if qm_match:
-                                    if qm_pattern.startswith(r"(\d+)"):  # Quantity first
-                                        quantity = qm_match.group(1)
-                                        model = qm_match.group(2).strip()
-                                    else:  # Model first
-                                        model = qm_match.group(1).strip()
-                                        quantity = qm_match.group(2)
-                                    
-                                    equipment_data[eq_type].append({
-                                        "model": model,
-                                        "quantity": quantity,
-                                        "equipment_type": eq_type,
-                                        "raw_text": item
-                                    })
-                                    break
-                            else:
-                                # If no quantity-model pattern matched, just store the raw text
-                                equipment_data[eq_type].append({
-                                    "raw_text": item,
-                                    "equipment_type": eq_type
-                                })
-    
-    # Try to find tables in the text
-    table_patterns = [
-        # Common table formats with 2-4 columns
-        r"([A-Za-z0-9\s\-\(\)\'\"\.]+)\s+(\d+)\s+([A-Za-z0-9\s\-\(\)\'\"\.]+)",  # Model, Quantity, Description
-        r"(\d+)\s+([A-Za-z0-9\s\-\(\)\'\"\.]+)\s+([A-Za-z0-9\s\-\(\)\'\"\.]+)",  # Quantity, Model, Description
-    ]
-    
-    for pattern in table_patterns:
-        matches = re.findall(pattern, text, re.MULTILINE)
-        for match in matches:
-            if len(match) >= 3:
-                # Try to determine what each column represents
-                if match[0].isdigit():  # First column is likely quantity
-                    quantity = match[0]
-                    model = match[1]
-                    description = match[2] if len(match) > 2 else ""
-                elif match[1].isdigit():  # Second column is likely quantity
-                    model = match[0]
-                    quantity = match[1]
-                    description = match[2] if len(match) > 2 else ""
-                else:
-                    continue  # Skip if we can't identify quantity
+    # Split the text at its headings in one pass; each section takes the
+    # equipment type announced by its heading (or its parent heading)
+    for section in SectionIndex().build(text):
+        eq_type = section.equipment_type
+        if eq_type not in equipment_data:
+            continue
+        section_text = text[section.start:section.end]
+        
+        # Try to extract equipment from this section
+        for pattern in LIST_PATTERNS:
+            for match in pattern.findall(section_text):
+                # Normalize the match format
+                if isinstance(match, tuple) and len(match) == 3:  # Item: Quantity x Description format
+                    model = match[0].strip()
+                    quantity = match[1].strip()
+                    description = match[2].strip()
+                    
+                    equipment_data[eq_type].append({
+                        "model": model if model else description,
+                        "quantity": quantity,
+                        "equipment_type": eq_type,
+                        "raw_text": f"{model}: {quantity}x {description}"
+                    })
+                    continue
                 
-                # Try to determine equipment type
-                eq_type = "unknown"
-                if any(keyword in model.lower() or keyword in description.lower() 
-                       for keyword in ["light", "dimmer", "par", "fresnel", "profile", "flood"]):
-                    eq_type = "lighting"
-                elif any(keyword in model.lower() or keyword in description.lower() 
-                         for keyword in ["speaker", "mic", "audio", "sound", "console"]):
-                    eq_type = "sound"
-                elif any(keyword in model.lower() or keyword in description.lower() 
-                         for keyword in ["projector", "screen", "video", "display"]):
-                    eq_type = "video"
+                # Numbered list (tuple) or bulleted list (single string)
+                item = match[1].strip() if isinstance(match, tuple) else match.strip()
                 
-                if eq_type != "unknown":
+                # Try to extract quantity and model
+                quantity_model = split_quantity_model(item)
+                if quantity_model:
+                    quantity, model = quantity_model
                     equipment_data[eq_type].append({
                         "model": model,
                         "quantity": quantity,
-                        "description": description,
                         "equipment_type": eq_type,
-                        "raw_text": f"{model} {quantity} {description}"
+                        "raw_text": item
                     })
+                elif item:
+                    # If no quantity-model pattern matched, just store the raw text
+                    equipment_data[eq_type].append({
+                        "raw_text": item,
+                        "equipment_type": eq_type
+                    })
+    
+    # Try to find tables in the text
+    for model, quantity, description in iter_table_rows(text):
+        # Try to determine equipment type
+        eq_type = "unknown"
+        if any(keyword in model.lower() or keyword in description.lower() 
+               for keyword in ["light", "dimmer", "par", "fresnel", "profile", "flood"]):
+            eq_type = "lighting"
+        elif any(keyword in model.lower() or keyword in description.lower() 
+                 for keyword in ["speaker", "mic", "audio", "sound", "console"]):
+            eq_type = "sound"
+        elif any(keyword in model.lower() or keyword in description.lower() 
+                 for keyword in ["projector", "screen", "video", "display"]):
+            eq_type = "video"
+        
+        if eq_type != "unknown":
+            equipment_data[eq_type].append({
+                "model": model,
+                "quantity": quantity,
+                "description": description,
+                "equipment_type": eq_type,
+                "raw_text": f"{model} {quantity} {description}"
+            })
     
     return equipment_data
 
 def process_venue_pdf(pdf_path):
     """Process a venue PDF and extract equipment information."""
-    venue_name = identify_venue_name(pdf_path)
+    # Extract text from PDF once; the venue name comes from the leading pages
+    page_texts = extract_pages_from_pdf(pdf_path)
+    text = "".join(page_text + "\n\n" for page_text in page_texts)
+    leading_text = "".join(page_text + "\n\n" for page_text in page_texts[:VENUE_NAME_PAGES])
+    
+    venue_name = identify_venue_name(pdf_path, leading_text)
     print(f"\nProcessing venue: {venue_name}")
     print(f"PDF: {pdf_path}")
     
@@ -229,8 +263,6 @@ def process_venue_pdf(pdf_path):
     venue_dir = Path(__file__).parent / "data" / venue_name.replace(" ", "_")
     venue_dir.mkdir(exist_ok=True, parents=True)
     
-    # Extract text from PDF
-    text = extract_text_from_pdf(pdf_path)
     text_file = venue_dir / "extracted_text.txt"
     with open(text_file, 'w', encoding='utf-8') as f:
         f.write(text)
@@ -0,0 +1,274 @@
+"""
+Extraction Cache Module
+
+This module provides a persistent on-disk cache for PDF extraction results.
+Entries are keyed by the SHA-256 of the PDF contents plus the parser version,
+so a venue's spec sheet is only decoded again when the file (or the parser)
+changes. The cache is bounded in size and evicts the least recently used
+entries first. The cache directory is only listed when the running total of
+the entry sizes passes the bound (and once to start the total), not every
+time an entry is stored; each process keeps its own total, so a parent
+running workers that share the cache evicts once they are done. Temporary
+files left behind by crashed writers are removed when the directory is
+listed. Entries can be written page by page as a PDF is decoded (see
+ExtractionCache.open_entry), so the pages never need to be held in memory
+all at once.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from pdf_text import open_pdf_buffer
+
+DEFAULT_CACHE_DIR = Path(__file__).parent / ".cache" / "extraction"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Eviction frees the cache down to this fraction of max_bytes, so that a full
+# cache is not listed again for every entry stored
+EVICTION_TARGET = 0.9
+
+# Temporary files not written to for this long are left over from a writer
+# that crashed or was killed before storing its entry
+STALE_TMP_SECONDS = 60 * 60
+
+def hash_pdf(pdf_path):
+    """Return the hex SHA-256 digest of a PDF given as a path or in-memory data."""
+    with open_pdf_buffer(pdf_path) as view:
+        return hashlib.sha256(view).hexdigest()
+
+class ExtractionCache:
+    """Size-bounded, content-addressed cache of per-page text and parsed equipment."""
+    
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES, rebuild=False):
+        """Initialize the cache.
+        
+        With rebuild=True existing entries are ignored on lookup and
+        overwritten as documents are processed again.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.rebuild = rebuild
+        
+        # Size of each entry by file name and their total, kept up to date as
+        # entries are stored; None until the directory is first listed.
+        # Entries stored by other processes are counted the next time it is.
+        self._entry_sizes = None
+        self._total_bytes = 0
+    
+    def cache_key(self, pdf_path, parser_version):
+        """Build the cache key for a PDF under the given parser version."""
+        return f"{hash_pdf(pdf_path)}-{parser_version}"
+    
+    def _entry_path(self, key):
+        return self.cache_dir / f"{key}.json"
+    
+    def get(self, key):
+        """Return the cached entry for key, or None on a miss."""
+        if self.rebuild:
+            return None
+        
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        # Mark the entry as recently used for eviction
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+        
+        return entry
+    
+    def open_entry(self, key):
+        """Start writing the entry for key one page at a time; returns an EntryWriter."""
+        return EntryWriter(self, key)
+    
+    def put(self, key, entry):
+        """Store an entry and evict old entries if the cache is over its size limit."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Write to a temporary file first so concurrent readers never see partial entries
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, self._entry_path(key))
+        except OSError as e:
+            print(f"Error writing extraction cache entry: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+        
+        self._stored(key)
+    
+    def _stored(self, key):
+        """Add a newly stored entry to the running total, evicting if it is over max_bytes."""
+        if self._entry_sizes is None:
+            # First store by this process: list (and sweep) the directory
+            self.evict()
+            return
+        
+        entry_path = self._entry_path(key)
+        try:
+            size = entry_path.stat().st_size
+        except OSError:
+            return
+        self._total_bytes += size - self._entry_sizes.get(entry_path.name, 0)
+        self._entry_sizes[entry_path.name] = size
+        
+        if self._total_bytes > self.max_bytes:
+            self.evict()
+    
+    def _list_entries(self):
+        """Return (mtime, size, path) for every entry in the cache directory.
+        
+        Stale temporary files of unfinished entries are removed on the way;
+        those still being written are left alone and not counted.
+        """
+        stale_before = time.time() - STALE_TMP_SECONDS
+        entries = []
+        for entry_path in self.cache_dir.glob("*"):
+            if entry_path.suffix not in (".json", ".tmp"):
+                continue
+            try:
+                stat = entry_path.stat()
+            except OSError:
+                continue
+            if entry_path.suffix == ".tmp":
+                if stat.st_mtime < stale_before:
+                    _remove(entry_path)
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry_path))
+        return entries
+    
+    def _index(self, entries):
+        """Restart the running total from a listing of the entries."""
+        self._entry_sizes = {entry_path.name: size for _, size, entry_path in entries}
+        self._total_bytes = sum(self._entry_sizes.values())
+    
+    def evict(self):
+        """Remove least recently used entries if the cache is over max_bytes.
+        
+        Entries are removed until the cache is down to EVICTION_TARGET of
+        max_bytes. The whole directory is listed, so entries stored by other
+        processes are counted as well.
+        """
+        entries = self._list_entries()
+        total_bytes = sum(size for _, size, _ in entries)
+        if total_bytes <= self.max_bytes:
+            self._index(entries)
+            return
+        
+        removed = set()
+        for _, size, entry_path in sorted(entries):
+            if total_bytes <= self.max_bytes * EVICTION_TARGET:
+                break
+            if not _remove(entry_path):
+                continue
+            removed.add(entry_path)
+            total_bytes -= size
+        
+        self._index([entry for entry in entries if entry[2] not in removed])
+    
+    def clear(self):
+        """Remove every entry, and every temporary file of an unfinished one, from the cache."""
+        for pattern in ("*.json", "*.tmp"):
+            for entry_path in self.cache_dir.glob(pattern):
+                _remove(entry_path)
+        self._index([])
+
+def _remove(path):
+    """Delete a file, returning whether it is gone."""
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        return True
+    except OSError:
+        return False
+    return True
+
+class EntryWriter:
+    """A cache entry written as its pages arrive.
+    
+    Pages are appended to a temporary file with add_page; commit adds the
+    other fields of the entry and moves the file into the cache, giving the
+    same entry as ExtractionCache.put would for {'pages': [...], **fields}.
+    An entry that is not committed (or fails to write) is discarded.
+    """
+    
+    def __init__(self, cache, key):
+        self.cache = cache
+        self.key = key
+        self.page_count = 0
+        self.file = None
+        self.tmp_path = None
+        try:
+            cache.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, self.tmp_path = tempfile.mkstemp(dir=cache.cache_dir, suffix=".tmp")
+            self.file = os.fdopen(fd, 'w', encoding='utf-8')
+            self.file.write('{"pages": [')
+        except OSError as e:
+            self._fail(e)
+    
+    def add_page(self, page_text):
+        """Append the text of the next page to the entry."""
+        if self.file is None:
+            return
+        try:
+            self.file.write((", " if self.page_count else "") + json.dumps(page_text, ensure_ascii=False))
+        except OSError as e:
+            self._fail(e)
+            return
+        self.page_count += 1
+    
+    def commit(self, **fields):
+        """Write the other fields of the entry and store it in the cache."""
+        if self.file is None:
+            return
+        try:
+            self.file.write("]")
+            for name, value in fields.items():
+                self.file.write(f", {json.dumps(name)}: {json.dumps(value, ensure_ascii=False)}")
+            self.file.write("}")
+            self.file.close()
+            self.file = None
+            os.replace(self.tmp_path, self.cache._entry_path(self.key))
+        except OSError as e:
+            self._fail(e)
+            return
+        
+        self.cache._stored(self.key)
+    
+    def abort(self):
+        """Discard the entry (a no-op once it is committed)."""
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+            self._remove_tmp()
+    
+    def _fail(self, error):
+        print(f"Error writing extraction cache entry: {error}")
+        if self.file is not None:
+            try:
+                self.file.close()
+            except OSError:
+                pass
+            self.file = None
+        self._remove_tmp()
+    
+    def _remove_tmp(self):
+        if self.tmp_path:
+            try:
+                os.remove(self.tmp_path)
+            except OSError:
+                pass
+            self.tmp_path = None
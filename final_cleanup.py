@@ -5,14 +5,17 @@ This script performs a final cleanup on the equipment data to remove any remaini
 irrelevant or duplicate entries.
 """
 
+import argparse
 import pandas as pd
 from pathlib import Path
-import re
 
-def is_valid_equipment(row):
-    """Check if this row represents valid equipment."""
-    # Invalid patterns in manufacturer
-    invalid_mfr_patterns = [
+from pattern_registry import enable_stats, print_pattern_stats, register
+import regex_engine as re
+
+# Invalid patterns in manufacturer
+INVALID_MANUFACTURER_PATTERNS = [
+    register(f"final_cleanup.invalid_manufacturer:{pattern}", pattern, re.IGNORECASE)
+    for pattern in [
         r'^Additional$',
         r'^Technical',
         r'^Audio$',
@@ -50,9 +53,12 @@ def is_valid_equipment(row):
         r'^Projection and Video Monitors$',
         r'^Temporary Show Relay$',
     ]
-    
-    # Invalid patterns in model
-    invalid_model_patterns = [
+]
+
+# Invalid patterns in model
+INVALID_MODEL_PATTERNS = [
+    register(f"final_cleanup.invalid_model:{pattern}", pattern, re.IGNORECASE)
+    for pattern in [
         r'^Equipment$',
         r'^Dimensions$',
         r'^wing$',
@@ -82,15 +88,18 @@ def is_valid_equipment(row):
         r'^Gio$',
         r'^Hall',
     ]
-    
+]
+
+def is_valid_equipment(row):
+    """Check if this row represents valid equipment."""
     # Check invalid manufacturer patterns
-    for pattern in invalid_mfr_patterns:
-        if re.search(pattern, str(row['manufacturer']), re.IGNORECASE):
+    for pattern in INVALID_MANUFACTURER_PATTERNS:
+        if pattern.search(str(row['manufacturer'])):
             return False
     
     # Check invalid model patterns
-    for pattern in invalid_model_patterns:
-        if re.search(pattern, str(row['model']), re.IGNORECASE):
+    for pattern in INVALID_MODEL_PATTERNS:
+        if pattern.search(str(row['model'])):
             return False
     
     # Check for non-equipment rows
@@ -134,8 +143,16 @@ def clean_data(df):
     
     return df
 
-def main():
+def main(argv=None):
     """Main function to clean up the final data."""
+    parser = argparse.ArgumentParser(description="Final cleanup of the equipment data")
+    parser.add_argument(
+        "--pattern-stats", action="store_true",
+        help="Report calls, matches and time spent per named pattern"
+    )
+    args = parser.parse_args(argv)
+    enable_stats(args.pattern_stats)
+    
     # Path to the final CSV file
     input_file = Path(__file__).parent / "output" / "final" / "all_venues_final.csv"
     
@@ -150,6 +167,8 @@ def main():
     # Clean the data
     cleaned_df = clean_data(df)
     print(f"Filtered to {len(cleaned_df)} valid equipment entries")
+    if args.pattern_stats:
+        print_pattern_stats()
     
     # Save the cleaned data
     output_file = Path(__file__).parent / "output" / "final" / "equipment_data_cleaned.csv"
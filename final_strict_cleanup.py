@@ -7,7 +7,6 @@ that clearly represent actual equipment.
 
 import pandas as pd
 from pathlib import Path
-import re
 
 def get_known_equipment():
     """Return a list of known equipment that should be included in the final output."""
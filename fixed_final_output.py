@@ -8,10 +8,13 @@ focusing on the actual equipment items for each venue, with improved handling fo
 import os
 import sys
 import json
-import re
 import pandas as pd
 from pathlib import Path
 
+from raw_text_scanner import scan_raw_texts
+import regex_engine as re
+from schema.manufacturer_catalog import get_manufacturer_catalog
+
 def is_valid_equipment(model_text):
     """Check if the model text represents valid equipment."""
     if not model_text or pd.isna(model_text) or not isinstance(model_text, str):
@@ -77,18 +80,15 @@ def clean_model_text(model_text):
     
     return model_text
 
-def identify_manufacturer(text, common_manufacturers):
+def identify_manufacturer(text, equipment_type=None):
     """Try to identify manufacturer from text."""
     if not text or pd.isna(text) or not isinstance(text, str):
         return ""
     
-    # Check if text starts with a known manufacturer
-    for manufacturer in common_manufacturers:
-        pattern = r'^' + re.escape(manufacturer) + r'\s+'
-        if re.search(pattern, text, re.IGNORECASE):
-            # Extract the manufacturer and return it with proper capitalization
-            match = re.search(pattern, text, re.IGNORECASE)
-            return manufacturer  # Return the proper case version from our list
+    # Check if text starts with a known manufacturer (of the given type, if any)
+    match = get_manufacturer_catalog().match_prefix(text, equipment_type, followed_by_space=True)
+    if match:
+        return match.name  # Return the proper case version from the catalog
     
     # Try to extract potential manufacturer using pattern matching
     # Look for capitalized words at the beginning
@@ -101,12 +101,17 @@ def identify_manufacturer(text, common_manufacturers):
     
     return ""
 
-def extract_model_info(text, common_manufacturers):
+def extract_model_info(text, equipment_type=None):
     """Extract manufacturer and model from text."""
     if not text or pd.isna(text) or not isinstance(text, str):
         return "", ""
+    
+    # Known manufacturers may be written as an alias, so cut the model after the matched text
+    match = get_manufacturer_catalog().match_prefix(text, equipment_type, followed_by_space=True)
+    if match:
+        return match.name, text[match.end:].lstrip()
         
-    manufacturer = identify_manufacturer(text, common_manufacturers)
+    manufacturer = identify_manufacturer(text, equipment_type)
     
     if manufacturer:
         # Remove manufacturer from the beginning of the text to get the model
@@ -118,25 +123,8 @@ def extract_model_info(text, common_manufacturers):
 
 def clean_equipment_data(df):
     """Clean and standardize equipment data."""
-    # Define common manufacturers by equipment type
-    common_manufacturers = {
-        'lighting': [
-            'ETC', 'Martin', 'Robe', 'Chauvet', 'Elation', 'Clay Paky', 'High End', 
-            'Vari-Lite', 'Robert Juliat', 'Philips', 'GLP', 'Ayrton', 'SGM', 'MA Lighting'
-        ],
-        'sound': [
-            'Shure', 'Sennheiser', 'Audio-Technica', 'AKG', 'DPA', 'Yamaha', 'DiGiCo', 
-            'Allen & Heath', 'Midas', 'Behringer', 'L-Acoustics', 'd&b audiotechnik', 
-            'Meyer Sound', 'JBL', 'QSC', 'Bose', 'Neumann', 'Beyerdynamic', 'SSL'
-        ],
-        'video': [
-            'Christie', 'Barco', 'Epson', 'Sony', 'Panasonic', 'Samsung', 'LG', 'NEC', 
-            'Blackmagic Design', 'Roland', 'Extron', 'Kramer', 'AJA', 'Crestron'
-        ]
-    }
-    
-    # Flatten the manufacturer list for easier lookup
-    all_manufacturers = [m for sublist in common_manufacturers.values() for m in sublist]
+    # Known manufacturers are looked up by equipment type where the catalog has that type
+    catalog_types = get_manufacturer_catalog().types()
     
     # Create empty result dataframe
     result_data = []
@@ -163,8 +151,8 @@ def clean_equipment_data(df):
             
             # If manufacturer is empty, try to extract it from model
             if not manufacturer_text:
-                type_manufacturers = common_manufacturers.get(equipment_type, all_manufacturers)
-                manufacturer_text, model_text = extract_model_info(model_text, type_manufacturers)
+                catalog_type = equipment_type if equipment_type in catalog_types else None
+                manufacturer_text, model_text = extract_model_info(model_text, catalog_type)
             
             # Add cleaned data to results
             result_data.append({
@@ -193,74 +181,31 @@ def clean_equipment_data(df):
     return result_df
 
 def extract_equipment_from_raw_text(df):
-    """Extract equipment directly from raw text."""
-    equipment_data = []
+    """Extract equipment directly from raw text.
     
-    # Process each row's raw text
-    for _, row in df.iterrows():
-        try:
-            if 'raw_text' not in row or pd.isna(row['raw_text']):
-                continue
-                
-            raw_text = str(row['raw_text'])
-            equipment_type = str(row['equipment_type']) if 'equipment_type' in row and pd.notna(row['equipment_type']) else ""
-            venue = str(row['venue']) if 'venue' in row and pd.notna(row['venue']) else ""
-            
-            # Common patterns for equipment
-            patterns = [
-                # Brand Model - Quantity
-                r'([A-Z][a-zA-Z\s&]+)\s+([A-Za-z0-9\-\s]+)\s+[-–]\s+(\d+)',
-                
-                # Brand Model Quantity
-                r'([A-Z][a-zA-Z\s&]+)\s+([A-Za-z0-9\-\s]+)\s+(\d+)',
-                
-                # Quantity x Brand Model
-                r'(\d+)\s*[xX]\s*([A-Z][a-zA-Z\s&]+)\s+([A-Za-z0-9\-\s]+)',
-                
-                # Model names with specific manufacturers
-                r'(Martin|ETC|Shure|Sennheiser|Yamaha|DPA|Robert Juliat|MAC)\s+([A-Za-z0-9\-\s]+)'
-            ]
-            
-            # Try each pattern
-            for pattern in patterns:
-                matches = re.finditer(pattern, raw_text)
-                for match in matches:
-                    parts = match.groups()
-                    
-                    if len(parts) == 3:  # Pattern with quantity
-                        if parts[0].isdigit():
-                            quantity = parts[0]
-                            manufacturer = parts[1]
-                            model = parts[2]
-                        elif parts[2].isdigit():
-                            manufacturer = parts[0]
-                            model = parts[1]
-                            quantity = parts[2]
-                        else:
-                            continue
-                    elif len(parts) == 2:  # Pattern without quantity
-                        manufacturer = parts[0]
-                        model = parts[1]
-                        quantity = ""
-                    else:
-                        continue
-                    
-                    # Clean the extracted data
-                    manufacturer = manufacturer.strip()
-                    model = model.strip()
-                    
-                    # Only keep if model looks valid
-                    if is_valid_equipment(model):
-                        equipment_data.append({
-                            'manufacturer': manufacturer,
-                            'model': model,
-                            'quantity': quantity,
-                            'equipment_type': equipment_type,
-                            'venue': venue
-                        })
-        except Exception as e:
-            print(f"Error processing raw text: {e}")
-            continue
+    The whole raw_text column is scanned in one pass (see raw_text_scanner),
+    in time linear in its total length.
+    """
+    if 'raw_text' not in df.columns:
+        return pd.DataFrame(columns=['manufacturer', 'model', 'quantity', 'equipment_type', 'venue'])
+    
+    rows = df[df['raw_text'].notna()]
+    raw_texts = rows['raw_text'].astype(str).tolist()
+    equipment_types = rows['equipment_type'].fillna("").astype(str).tolist() if 'equipment_type' in rows else [""] * len(rows)
+    venues = rows['venue'].fillna("").astype(str).tolist() if 'venue' in rows else [""] * len(rows)
+    
+    # Only keep matches whose model looks valid
+    equipment_data = [
+        {
+            'manufacturer': match.manufacturer,
+            'model': match.model,
+            'quantity': match.quantity,
+            'equipment_type': equipment_types[match.index],
+            'venue': venues[match.index]
+        }
+        for match in scan_raw_texts(raw_texts)
+        if is_valid_equipment(match.model)
+    ]
     
     # Convert to DataFrame
     if not equipment_data:
@@ -8,10 +8,12 @@ focusing on the actual equipment items for each venue, addressing specific data
 import os
 import sys
 import json
-import re
 import pandas as pd
 from pathlib import Path
 
+import regex_engine as re
+from schema.manufacturer_catalog import get_manufacturer_catalog
+
 def is_valid_equipment(model_text, manufacturer_text):
     """Check if the model and manufacturer represent valid equipment."""
     if not model_text or pd.isna(model_text):
@@ -67,18 +69,16 @@ def clean_model_text(model_text):
     
     return model_text
 
-def identify_manufacturer(text, common_manufacturers):
+def identify_manufacturer(text, equipment_type=None):
     """Try to identify manufacturer from text."""
     if not text or pd.isna(text):
         return ""
     
-    # Check if text starts with a known manufacturer
-    for manufacturer in common_manufacturers:
-        pattern = r'^' + re.escape(manufacturer) + r'\s+'
-        if re.search(pattern, text, re.IGNORECASE):
-            # Extract the manufacturer and return it with proper capitalization
-            match = re.search(pattern, text, re.IGNORECASE)
-            return text[:match.end()].strip()
+    # Check if text starts with a known manufacturer (of the given type, if any)
+    match = get_manufacturer_catalog().match_prefix(text, equipment_type, followed_by_space=True)
+    if match:
+        # Return the manufacturer as it is written in the text
+        return text[:match.end].strip()
     
     # Try to extract potential manufacturer using pattern matching
     # Look for capitalized words at the beginning
@@ -91,9 +91,9 @@ def identify_manufacturer(text, common_manufacturers):
     
     return ""
 
-def extract_model_info(text, common_manufacturers):
+def extract_model_info(text, equipment_type=None):
     """Extract manufacturer and model from text."""
-    manufacturer = identify_manufacturer(text, common_manufacturers)
+    manufacturer = identify_manufacturer(text, equipment_type)
     
     if manufacturer:
         # Remove manufacturer from the beginning of the text to get the model
@@ -105,25 +105,8 @@ def extract_model_info(text, common_manufacturers):
 
 def clean_equipment_data(df):
     """Clean and standardize equipment data."""
-    # Define common manufacturers by equipment type
-    common_manufacturers = {
-        'lighting': [
-            'ETC', 'Martin', 'Robe', 'Chauvet', 'Elation', 'Clay Paky', 'High End', 
-            'Vari-Lite', 'Robert Juliat', 'Philips', 'GLP', 'Ayrton', 'SGM', 'MA Lighting'
-        ],
-        'sound': [
-            'Shure', 'Sennheiser', 'Audio-Technica', 'AKG', 'DPA', 'Yamaha', 'DiGiCo', 
-            'Allen & Heath', 'Midas', 'Behringer', 'L-Acoustics', 'd&b audiotechnik', 
-            'Meyer Sound', 'JBL', 'QSC', 'Bose', 'Neumann', 'Beyerdynamic', 'SSL'
-        ],
-        'video': [
-            'Christie', 'Barco', 'Epson', 'Sony', 'Panasonic', 'Samsung', 'LG', 'NEC', 
-            'Blackmagic Design', 'Roland', 'Extron', 'Kramer', 'AJA', 'Crestron'
-        ]
-    }
-    
-    # Flatten the manufacturer list for easier lookup
-    all_manufacturers = [m for sublist in common_manufacturers.values() for m in sublist]
+    # Known manufacturers are looked up by equipment type where the catalog has that type
+    catalog_types = get_manufacturer_catalog().types()
     
     # Create empty result dataframe
     result_data = []
@@ -145,8 +128,8 @@ def clean_equipment_data(df):
         
         # If manufacturer is empty, try to extract it from model
         if not manufacturer_text:
-            type_manufacturers = common_manufacturers.get(equipment_type, all_manufacturers)
-            manufacturer_text, model_text = extract_model_info(model_text, type_manufacturers)
+            catalog_type = equipment_type if equipment_type in catalog_types else None
+            manufacturer_text, model_text = extract_model_info(model_text, catalog_type)
         
         # Add cleaned data to results
         result_data.append({
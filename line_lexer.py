@@ -0,0 +1,146 @@
+"""
+Line Lexer Module
+
+This module splits extracted PDF text into lines and classifies each line
+exactly once as a numbered item, bullet, heading, table row, prose or blank
+line. Numbered and bulleted list items (including prose lines that wrap onto
+the following lines) are then emitted as equipment candidates.
+
+Classification only looks at each character a bounded number of times using
+plain string operations, so the total work is linear in the size of the text
+and no input can trigger regex backtracking.
+"""
+
+from collections import namedtuple
+
+BLANK = "blank"
+NUMBERED = "numbered"
+BULLET = "bullet"
+HEADING = "heading"
+TABLE_ROW = "table_row"
+PROSE = "prose"
+
+# Characters that mark a bulleted line, including the private-use glyphs
+# PDF symbol fonts extract to
+BULLET_CHARS = frozenset("•‣▪◦●○■□–-*\uf0a7\uf0b7")
+
+# Bullet glyphs that also separate several items on one line ("• A • B").
+# Hyphens and asterisks are left out because they occur inside model names.
+INLINE_BULLET_CHARS = frozenset("•‣▪◦●■\uf0a7\uf0b7")
+
+# Words that, followed by a number only, mark a page or section label
+MARKER_WORDS = ("page", "section", "chapter")
+
+# Longest list number accepted ("999." is an item, "2024." is not)
+MAX_ITEM_NUMBER_DIGITS = 3
+
+# Line endings after which an item carries on onto the next line
+CONTINUATION_ENDINGS = tuple(",;:-&/(+")
+
+Line = namedtuple("Line", ["kind", "text", "body"])
+Line.__doc__ = """A classified line: its kind, the stripped line and the text after any list marker."""
+
+def _skip_digits(text, start):
+    """Return the index of the first non-digit character at or after start."""
+    end = start
+    while end < len(text) and text[end].isdigit():
+        end += 1
+    return end
+
+def _is_marker_line(text):
+    """Return True for bare page/section labels such as "12" or "Page 4"."""
+    if text.isdigit():
+        return True
+    word, _, number = text.partition(" ")
+    return word.lower() in MARKER_WORDS and (not number.strip() or number.strip().isdigit())
+
+def classify_line(line):
+    """Classify a single line, returning a Line."""
+    text = line.strip()
+    if not text:
+        return Line(BLANK, text, "")
+    
+    if text[0] in BULLET_CHARS:
+        return Line(BULLET, text, text[1:].strip())
+    
+    if text[0].isdigit():
+        end = _skip_digits(text, 0)
+        marker = text[end:end + 1]
+        following = text[end + 1:end + 2]
+        
+        # "1. Item" or "2) Item", but not decimals such as "1.3m"
+        if (marker in (".", ")") and end <= MAX_ITEM_NUMBER_DIGITS
+                and following and not following.isdigit() and text[end + 1:].strip()):
+            return Line(NUMBERED, text, text[end + 1:].strip())
+        
+        # Dotted section numbers such as "6.1.5 Lighting Positions"
+        if marker == "." and following.isdigit():
+            while text[end:end + 1] == "." and text[end + 1:end + 2].isdigit():
+                end = _skip_digits(text, end + 1)
+            if end == len(text) or text[end].isspace():
+                return Line(HEADING, text, text[end:].strip())
+    
+    if _is_marker_line(text):
+        return Line(HEADING, text, "")
+    
+    # Short all-caps lines without numbers, e.g. "LIGHTING EQUIPMENT"
+    if text.isupper() and len(text.split()) <= 6 and not any(char.isdigit() for char in text):
+        return Line(HEADING, text, text)
+    
+    if "\t" in text or "|" in text or "  " in text:
+        return Line(TABLE_ROW, text, text)
+    
+    return Line(PROSE, text, text)
+
+def tokenize(text):
+    """Return the classified lines of a block of text, in order."""
+    return [classify_line(line) for line in text.split("\n")]
+
+def _split_inline_bullets(body):
+    """Split a bullet line's text on any further bullet glyphs it contains."""
+    parts = []
+    start = 0
+    for index, char in enumerate(body):
+        if char in INLINE_BULLET_CHARS:
+            parts.append(body[start:index].strip())
+            start = index + 1
+    parts.append(body[start:].strip())
+    return parts
+
+def _continues(current, line):
+    """Return True if a prose line looks like the current item wrapping onto it."""
+    return line.body[0].islower() or current[-1].endswith(CONTINUATION_ENDINGS)
+
+def iter_list_items(lines):
+    """Yield the text of each numbered or bulleted list item.
+    
+    lines is a sequence of Line tuples (see tokenize). A prose line directly
+    following an item is joined onto it if it starts in lower case or the
+    item's last line ends mid-phrase (e.g. with a comma), as happens when an
+    item wraps; any other line ends the item.
+    """
+    current = None
+    for line in lines:
+        if line.kind == PROSE and current and _continues(current, line):
+            current.append(line.body)
+            continue
+        
+        if current:
+            item_text = " ".join(current).strip()
+            if item_text:
+                yield item_text
+        current = None
+        
+        if line.kind == NUMBERED:
+            current = [line.body]
+        elif line.kind == BULLET:
+            parts = _split_inline_bullets(line.body)
+            for part in parts[:-1]:
+                if part:
+                    yield part
+            current = [parts[-1]]
+    
+    if current:
+        item_text = " ".join(current).strip()
+        if item_text:
+            yield item_text
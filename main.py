@@ -6,27 +6,168 @@ This is the main script that orchestrates the entire venue data processing pipel
 2. Standardizes the data using field mapping and schema validation
 3. Outputs clean, standardized data ready for database import
 
-Usage: python main.py
+Usage: python main.py [--jobs N] [--page-jobs N] [--no-cache | --rebuild-cache] [--outline]
+                      [--no-triage | --triage-threshold SCORE] [--prefilter] [--pattern-stats]
 """
 
 import os
 import sys
+import argparse
+import functools
+import multiprocessing
 from pathlib import Path
 import json
 
 # Import our custom modules
 from pdf_processor import PDFProcessor
 from data_standardizer import DataStandardizer
+from extraction_cache import ExtractionCache
+from pattern_registry import enable_stats, merge_stats, print_pattern_stats, stats_enabled, take_stats
 
-def main():
+# PDFProcessor owned by a pool worker process, created once by _init_worker
+_worker_processor = None
+
+def parse_args(argv=None):
+    """Parse command line options for the pipeline."""
+    parser = argparse.ArgumentParser(description="Venue data standardization pipeline")
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=os.cpu_count() or 1,
+        help="Number of worker processes used to process PDFs (default: CPU count)"
+    )
+    parser.add_argument(
+        "--page-jobs", type=int, default=os.cpu_count() or 1,
+        help="Number of processes used to extract the pages of a single PDF when "
+             "PDFs are processed serially (default: CPU count)"
+    )
+    cache_group = parser.add_mutually_exclusive_group()
+    cache_group.add_argument(
+        "--no-cache", action="store_true",
+        help="Do not read or write the extraction cache"
+    )
+    cache_group.add_argument(
+        "--rebuild-cache", action="store_true",
+        help="Ignore cached extraction results and store fresh ones"
+    )
+    parser.add_argument(
+        "--outline", action="store_true",
+        help="Only process the pages of the lighting/sound/video chapters listed in "
+             "each PDF's outline (bookmarks), falling back to every page"
+    )
+    triage_group = parser.add_mutually_exclusive_group()
+    triage_group.add_argument(
+        "--no-triage", action="store_true",
+        help="Fully process every PDF instead of skipping ones that do not look "
+             "like technical specifications"
+    )
+    triage_group.add_argument(
+        "--triage-threshold", type=float, default=40,
+        help="Minimum triage score (equipment keyword hits per 1000 words on the "
+             "best sampled page) for a PDF to be processed (default: 40)"
+    )
+    parser.add_argument(
+        "--prefilter", action="store_true",
+        help="Skip text sections without any equipment keywords or manufacturer "
+             "names instead of running the full equipment parsers on them (faster, "
+             "but misses some equipment)"
+    )
+    parser.add_argument(
+        "--pattern-stats", action="store_true",
+        help="Report calls, matches and time spent per named pattern (see "
+             "pattern_registry.py), to find the dominant and the dead patterns"
+    )
+    args = parser.parse_args(argv)
+    args.jobs = max(1, args.jobs)
+    return args
+
+def _init_worker(processor_options, pattern_stats=False):
+    """Pool initializer: give each worker process its own PDFProcessor."""
+    global _worker_processor
+    enable_stats(pattern_stats)
+    # Pool workers cannot start processes of their own, so pages are read serially
+    _worker_processor = PDFProcessor(page_jobs=1, **processor_options)
+
+def _process_pdf(pdf_processor, pdf_file, triage=True):
+    """Triage and process one PDF, returning (venue_data, triage_result, error_message).
+    
+    PDFs rejected by triage are never parsed and come back without venue data.
+    """
+    triage_result = None
+    try:
+        if triage:
+            triage_result = pdf_processor.triage_pdf(pdf_file)
+            decision = "accepted" if triage_result['accepted'] else "rejected, skipping"
+            print(f"  🔎 Triage score {triage_result['score']} "
+                  f"(threshold {triage_result['threshold']}): {decision}")
+            if not triage_result['accepted']:
+                return None, triage_result, None
+        return pdf_processor.process_venue_pdf(pdf_file), triage_result, None
+    except Exception as e:
+        return None, triage_result, str(e)
+
+def _process_pdf_in_worker(pdf_file, triage=True):
+    """Pool task: triage and process one PDF with the worker's PDFProcessor.
+    
+    The pattern statistics gathered on the way (if enabled) are returned
+    as well, for the parent process to add up.
+    """
+    result = _process_pdf(_worker_processor, pdf_file, triage)
+    return (*result, take_stats() if stats_enabled() else None)
+
+def iter_processed_pdfs(pdf_files, jobs=1, page_jobs=1, processor_options=None, triage=True):
+    """Process PDF files and yield (pdf_file, venue_data, triage_result, error) in input order.
+    
+    With more than one job the files are fanned out to a pool of worker
+    processes that is started (and initialized) up front; results are still
+    yielded in the order of pdf_files so the output matches a serial run.
+    When the files are processed serially, page_jobs processes are used to
+    extract the pages of each PDF instead. processor_options are extra
+    keyword arguments for every PDFProcessor (e.g. the extraction cache).
+    With triage, PDFs that do not look like technical specifications are
+    skipped before the expensive parse; triage_result is None otherwise.
+    Pattern statistics, if enabled, are collected from the worker processes.
+    """
+    processor_options = processor_options or {}
+    jobs = min(jobs, len(pdf_files))
+    
+    if jobs <= 1:
+        pdf_processor = PDFProcessor(page_jobs=page_jobs, **processor_options)
+        for pdf_file in pdf_files:
+            print(f"\n🔄 Processing: {pdf_file.name}")
+            yield (pdf_file, *_process_pdf(pdf_processor, pdf_file, triage))
+        return
+    
+    print(f"   Using {jobs} worker processes")
+    with multiprocessing.Pool(processes=jobs, initializer=_init_worker,
+                              initargs=(processor_options, stats_enabled())) as pool:
+        task = functools.partial(_process_pdf_in_worker, triage=triage)
+        for pdf_file, (*result, pattern_stats) in zip(pdf_files, pool.imap(task, pdf_files)):
+            if pattern_stats:
+                merge_stats(pattern_stats)
+            print(f"\n🔄 Processed: {pdf_file.name}")
+            yield (pdf_file, *result)
+    
+    # Each worker only keeps track of the cache entries it stored itself, so
+    # bring the shared cache back within its size limit once all are done
+    if processor_options.get('cache'):
+        processor_options['cache'].evict()
+
+def main(argv=None):
     """Main function that runs the complete venue data processing pipeline."""
+    args = parse_args(argv)
+    enable_stats(args.pattern_stats)
+    
     print("=" * 60)
     print("VENUE DATA STANDARDIZATION PIPELINE")
     print("=" * 60)
     
-    # Initialize processors
-    pdf_processor = PDFProcessor()
+    # Initialize the standardizer (PDF processors are created per worker)
     data_standardizer = DataStandardizer()
+    processor_options = {
+        'cache': None if args.no_cache else ExtractionCache(rebuild=args.rebuild_cache),
+        'use_outline': args.outline,
+        'triage_threshold': args.triage_threshold,
+        'prefilter': args.prefilter,
+    }
     
     # Define directories
     base_dir = Path(__file__).parent
@@ -38,7 +179,8 @@ def main():
     
     # Step 1: Find and process all PDF files
     print("\n📄 STEP 1: Processing PDF files...")
-    pdf_files = list(data_dir.glob("*.pdf"))
+    # Sorted so that results are merged in a deterministic filename order
+    pdf_files = sorted(data_dir.glob("*.pdf"))
     
     if not pdf_files:
         print("❌ No PDF files found in the data directory.")
@@ -49,21 +191,32 @@ def main():
     
     # Process each PDF and extract equipment data
     all_venues_data = []
+    triage_results = {}
+    
+    for pdf_file, venue_data, triage_result, error in iter_processed_pdfs(
+            pdf_files, args.jobs, args.page_jobs, processor_options, not args.no_triage):
+        if triage_result:
+            triage_results[pdf_file.name] = triage_result
+        
+        if error:
+            print(f"❌ Error processing {pdf_file.name}: {error}")
+        elif venue_data:
+            all_venues_data.append(venue_data)
+            print(f"✅ Successfully processed {venue_data['venue_name']}")
+        elif triage_result and not triage_result['accepted']:
+            print(f"🚫 Skipped {pdf_file.name}: does not look like a technical specification")
+        else:
+            print(f"⚠️  No equipment data extracted from {pdf_file.name}")
     
-    for pdf_file in pdf_files:
-        print(f"\n🔄 Processing: {pdf_file.name}")
-        try:
-            venue_data = pdf_processor.process_venue_pdf(pdf_file)
-            if venue_data:
-                all_venues_data.append(venue_data)
-                print(f"✅ Successfully processed {venue_data['venue_name']}")
-            else:
-                print(f"⚠️  No equipment data extracted from {pdf_file.name}")
-        except Exception as e:
-            print(f"❌ Error processing {pdf_file.name}: {e}")
+    summary_file = output_dir / "processing_summary.txt"
     
     if not all_venues_data:
         print("❌ No venue data was successfully extracted. Please check your PDF files.")
+        if triage_results:
+            generate_summary_report([], summary_file, triage_results)
+            print(f"   Triage decisions saved to: {summary_file}")
+        if args.pattern_stats:
+            print_pattern_stats()
         return
     
     # Step 2: Standardize all extracted data
@@ -91,8 +244,7 @@ def main():
         print(f"✅ JSON data saved to: {final_json}")
         
         # Generate summary report
-        summary_file = output_dir / "processing_summary.txt"
-        generate_summary_report(standardized_data, summary_file)
+        generate_summary_report(standardized_data, summary_file, triage_results)
         print(f"✅ Summary report saved to: {summary_file}")
         
     except Exception as e:
@@ -106,9 +258,15 @@ def main():
     print(f"📁 All outputs saved to: {output_dir}")
     print("\nYour venue equipment data is now ready for database import!")
     print("Artists can now easily browse available equipment at each venue.")
+    
+    if args.pattern_stats:
+        print_pattern_stats()
 
-def generate_summary_report(standardized_data, output_file):
-    """Generate a human-readable summary report."""
+def generate_summary_report(standardized_data, output_file, triage_results=None):
+    """Generate a human-readable summary report.
+    
+    triage_results maps PDF filenames to PDFProcessor.triage_pdf decisions.
+    """
     total_venues = len(standardized_data)
     total_equipment = sum(len(venue['equipment']) for venue in standardized_data)
     
@@ -149,6 +307,28 @@ def generate_summary_report(standardized_data, output_file):
             for eq_type, count in venue_counts.items():
                 if count > 0:
                     f.write(f"    {eq_type.capitalize()}: {count} items\n")
+        
+        if triage_results:
+            write_triage_report(f, triage_results)
+
+def write_triage_report(f, triage_results):
+    """Write the document triage section of the summary report."""
+    rejected = [name for name, result in triage_results.items() if not result['accepted']]
+    triage_seconds = sum(result['triage_seconds'] for result in triage_results.values())
+    seconds_saved = sum(result['estimated_seconds_saved'] for result in triage_results.values())
+    
+    f.write("\nDocument Triage:\n")
+    f.write("-" * 16 + "\n")
+    f.write(f"Documents triaged: {len(triage_results)}\n")
+    f.write(f"Documents quarantined (not parsed): {len(rejected)}\n")
+    f.write(f"Time spent on triage: {triage_seconds:.2f}s\n")
+    f.write(f"Estimated extraction time saved: {seconds_saved:.2f}s\n\n")
+    
+    for name, result in triage_results.items():
+        decision = "ACCEPTED" if result['accepted'] else "QUARANTINED"
+        f.write(f"  {name}: {decision} (score {result['score']}, threshold "
+                f"{result['threshold']}, {result['pages_sampled']} of "
+                f"{result['page_count']} pages sampled)\n")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,247 @@
+"""
+Pattern Registry Module
+
+This module holds the named regular expressions used by the parsing and
+cleanup code. Each pattern is registered once under a name, usually as a
+module constant, and compiled (through regex_engine) the first time it is
+used, so importing a module stays cheap and no call goes through the
+pattern cache lookup of re.search(pattern_string, ...).
+
+With statistics enabled, every call records its count, whether it matched
+and the time spent, so the dominant patterns (most time) and the dead ones
+(never matching) can be found; see print_pattern_stats.
+"""
+
+import time
+
+import regex_engine
+
+# Registered patterns by name, in registration order
+_patterns = {}
+
+# Whether calls are counted and timed
+_stats_enabled = False
+
+class NamedPattern:
+    """A registered pattern with the interface of re.Pattern, compiled on first use."""
+    
+    __slots__ = ("name", "pattern", "flags", "_compiled", "calls", "matches", "seconds")
+    
+    def __init__(self, name, pattern, flags=0):
+        self.name = name
+        self.pattern = pattern
+        self.flags = flags
+        self._compiled = None
+        self.calls = 0
+        self.matches = 0
+        self.seconds = 0.0
+    
+    def __repr__(self):
+        return f"NamedPattern({self.name!r}, {self.pattern!r})"
+    
+    @property
+    def compiled(self):
+        """The pattern compiled for the current regex engine."""
+        if self._compiled is None:
+            self._compiled = regex_engine.compile(self.pattern, self.flags)
+        return self._compiled
+    
+    @property
+    def groups(self):
+        """The number of capturing groups in the pattern."""
+        return self.compiled.groups
+    
+    @property
+    def groupindex(self):
+        """The mapping of named group names to group numbers."""
+        return self.compiled.groupindex
+    
+    def _timed(self, method, found, *args):
+        """Call a method of the compiled pattern, recording its time and whether found(result)."""
+        compiled = self.compiled
+        start_time = time.perf_counter()
+        result = getattr(compiled, method)(*args)
+        self.seconds += time.perf_counter() - start_time
+        self.calls += 1
+        if found(result):
+            self.matches += 1
+        return result
+    
+    def _timed_iter(self, *args):
+        """Iterate over finditer results, recording the time spent producing them."""
+        start_time = time.perf_counter()
+        iterator = self.compiled.finditer(*args)
+        self.calls += 1
+        matched = False
+        while True:
+            match = next(iterator, None)
+            self.seconds += time.perf_counter() - start_time
+            if match is None:
+                break
+            if not matched:
+                matched = True
+                self.matches += 1
+            yield match
+            start_time = time.perf_counter()
+    
+    def search(self, string, *args):
+        if _stats_enabled:
+            return self._timed("search", _is_match, string, *args)
+        return self.compiled.search(string, *args)
+    
+    def match(self, string, *args):
+        if _stats_enabled:
+            return self._timed("match", _is_match, string, *args)
+        return self.compiled.match(string, *args)
+    
+    def fullmatch(self, string, *args):
+        if _stats_enabled:
+            return self._timed("fullmatch", _is_match, string, *args)
+        return self.compiled.fullmatch(string, *args)
+    
+    def findall(self, string, *args):
+        if _stats_enabled:
+            return self._timed("findall", bool, string, *args)
+        return self.compiled.findall(string, *args)
+    
+    def finditer(self, string, *args):
+        if _stats_enabled:
+            return self._timed_iter(string, *args)
+        return self.compiled.finditer(string, *args)
+    
+    def sub(self, repl, string, count=0):
+        if _stats_enabled:
+            return self._timed("subn", _substituted, repl, string, count)[0]
+        return self.compiled.sub(repl, string, count)
+    
+    def subn(self, repl, string, count=0):
+        if _stats_enabled:
+            return self._timed("subn", _substituted, repl, string, count)
+        return self.compiled.subn(repl, string, count)
+    
+    def split(self, string, maxsplit=0):
+        if _stats_enabled:
+            return self._timed("split", _was_split, string, maxsplit)
+        return self.compiled.split(string, maxsplit)
+
+def _is_match(result):
+    return result is not None
+
+def _substituted(result):
+    return result[1] > 0
+
+def _was_split(result):
+    return len(result) > 1
+
+def register(name, pattern, flags=0):
+    """Register a pattern under name and return it as a NamedPattern.
+    
+    Registering the same pattern under the same name again (e.g. from two
+    modules sharing a cleaning step) returns the existing entry; a
+    different pattern under a taken name is an error.
+    """
+    existing = _patterns.get(name)
+    if existing is not None:
+        if (existing.pattern, existing.flags) != (pattern, flags):
+            raise ValueError(f"Pattern name {name!r} is already registered for {existing.pattern!r}")
+        return existing
+    named = NamedPattern(name, pattern, flags)
+    _patterns[name] = named
+    return named
+
+def extract_column(texts, pattern):
+    """Return the first group of pattern's first match in each text of a pandas Series (NaN if none).
+    
+    Series string methods run on the standard re engine and are not counted
+    in the pattern statistics.
+    """
+    return texts.str.extract(pattern.pattern, pattern.flags, expand=False)
+
+def replace_column(texts, pattern, repl, n=-1):
+    """Replace (up to n of) the matches of pattern in each text of a pandas Series."""
+    return texts.str.replace(pattern.pattern, repl, n=n, flags=pattern.flags, regex=True)
+
+def get_pattern(name):
+    """Return the registered pattern called name."""
+    return _patterns[name]
+
+def recompile():
+    """Drop the compiled patterns, so they are compiled again for the current regex engine."""
+    for named in _patterns.values():
+        named._compiled = None
+
+def enable_stats(enabled=True):
+    """Turn counting and timing of pattern calls on or off."""
+    global _stats_enabled
+    _stats_enabled = enabled
+
+def stats_enabled():
+    """Return whether pattern calls are being counted and timed."""
+    return _stats_enabled
+
+def reset_stats():
+    """Zero the counters of every pattern."""
+    for named in _patterns.values():
+        named.calls, named.matches, named.seconds = 0, 0, 0.0
+
+def take_stats():
+    """Return {name: (calls, matches, seconds)} for the patterns used since the last call, and reset them.
+    
+    Used to send the counters of a worker process to the parent, which adds
+    them up with merge_stats.
+    """
+    stats = {named.name: (named.calls, named.matches, named.seconds)
+             for named in _patterns.values() if named.calls}
+    reset_stats()
+    return stats
+
+def merge_stats(stats):
+    """Add counters returned by take_stats (e.g. in another process) to the local ones."""
+    for name, (calls, matches, seconds) in stats.items():
+        named = _patterns.get(name)
+        if named is not None:
+            named.calls += calls
+            named.matches += matches
+            named.seconds += seconds
+
+def pattern_stats():
+    """Return one dict per registered pattern, the most time-consuming first."""
+    stats = [
+        {
+            'name': named.name,
+            'pattern': named.pattern,
+            'calls': named.calls,
+            'matches': named.matches,
+            'seconds': named.seconds,
+        }
+        for named in _patterns.values()
+    ]
+    stats.sort(key=lambda entry: (-entry['seconds'], -entry['calls'], entry['name']))
+    return stats
+
+def print_pattern_stats(limit=None):
+    """Print calls, matches and cumulative time per pattern, and list the dead ones.
+    
+    limit caps the number of patterns listed in the timing table.
+    """
+    stats = pattern_stats()
+    used = [entry for entry in stats if entry['calls']]
+    total_seconds = sum(entry['seconds'] for entry in used)
+    
+    print(f"\n⏱️  Pattern statistics ({regex_engine.get_engine()} engine, "
+          f"{sum(entry['calls'] for entry in used)} calls, {total_seconds * 1000:.1f}ms):")
+    width = max([len(entry['name']) for entry in used[:limit]] + [30])
+    print(f"  {'pattern':<{width}} {'calls':>9} {'matches':>9} {'total':>10} {'per call':>10} {'share':>6}")
+    for entry in used[:limit]:
+        share = entry['seconds'] / total_seconds if total_seconds else 0.0
+        print(f"  {entry['name']:<{width}} {entry['calls']:>9} {entry['matches']:>9} "
+              f"{entry['seconds'] * 1000:>8.1f}ms {entry['seconds'] * 1e6 / entry['calls']:>8.2f}us {share:>6.1%}")
+    
+    dead = [entry for entry in stats if entry['calls'] and not entry['matches']]
+    unused = [entry for entry in stats if not entry['calls']]
+    if dead:
+        print(f"  Never matched ({len(dead)}):")
+        for entry in dead:
+            print(f"    {entry['name']}: {entry['pattern']}")
+    if unused:
+        print(f"  Never called ({len(unused)}): {', '.join(entry['name'] for entry in unused)}")
@@ -5,10 +5,76 @@ This module handles the extraction of equipment information from venue PDF files
 It uses text extraction and pattern matching to identify and parse technical equipment data.
 """
 
-import re
 import json
+import time
+from collections import OrderedDict
 from pathlib import Path
 
+import pandas as pd
+
+from equipment_classifier import EQUIPMENT_KEYWORDS, EquipmentClassifier
+from equipment_item import EquipmentItem
+from line_lexer import iter_list_items, tokenize
+from pattern_registry import extract_column, register, replace_column
+from pdf_text import (
+    count_pages, extract_page_texts, iter_page_texts, is_pdf_path, read_pdf_title,
+    read_outline_sections
+)
+import regex_engine as re
+from schema.manufacturer_catalog import get_manufacturer_catalog
+from section_index import SectionIndex
+from spec_scanner import SPEC_FIELDS, scan_spec_columns, scan_specs
+
+# Bump whenever a change alters the text or equipment a PDF produces, so that
+# cached extraction results from older versions are not reused
+PARSER_VERSION = "10"
+
+# Named patterns (see pattern_registry.py)
+WORD_PATTERN = register("text.word", r"[a-z0-9]+")
+BLOCK_SEPARATOR_PATTERN = register("text.blank_line", r'\n\s*\n')
+WHITESPACE_PATTERN = register("text.whitespace", r'\s+')
+LETTER_PATTERN = register("text.letter", r'[A-Za-z]')
+DIGIT_PATTERN = register("text.digit", r'\d')
+
+# Outline (bookmark) titles of chapters that list equipment
+OUTLINE_CHAPTER_PATTERN = register(
+    "outline.equipment_chapter", r"\b(lighting|sound|audio|video|visual|a/?v|projection)\b", re.IGNORECASE
+)
+
+# Venue names in the first pages of a document
+VENUE_NAME_PATTERNS = [
+    register("venue.name_with_kind", r"([A-Z][a-zA-Z\s]+)\s+(Theatre|Theater|Hall|Venue|Auditorium|Arena|Stadium|Opera House)", re.IGNORECASE | re.MULTILINE),
+    register("venue.known_name", r"(Sydney Opera House|Royal Albert Hall|Carnegie Hall|Lincoln Center|Barbican)", re.IGNORECASE | re.MULTILINE),
+    register("venue.venue_label", r"VENUE[:\s]+(.*?)[\n\r]", re.IGNORECASE | re.MULTILINE),
+    register("venue.title_label", r"TECHNICAL SPECIFICATIONS[:\s]+(.*?)[\n\r]", re.IGNORECASE | re.MULTILINE),
+    register("venue.standalone_line", r"^([A-Z][A-Za-z\s]{10,50})\s*$", re.IGNORECASE | re.MULTILINE),  # Standalone venue names
+]
+
+# Common patterns for extracting equipment information
+QUANTITY_PATTERNS = [
+    register("section.quantity_first", r"(\d+)\s*[x×]\s*([A-Za-z0-9\s\-\(\)\'\"\.]+)"),  # 10x Item description
+    register("section.quantity_last", r"([A-Za-z0-9\s\-\(\)\'\"\.]+)\s*[:\-]\s*(\d+)"),  # Item description: 10
+    register("section.quantity_number", r"(\d+)\s+([A-Za-z0-9\s\-\(\)\'\"\.]+)"),  # 10 Item description
+]
+TABLE_HEADER_PATTERN = register("section.table_header", r'^\s*(page|section|chapter|\d+)\s*$', re.IGNORECASE)
+
+# Model name cleaning (shared with DataStandardizer._clean_model_name)
+MODEL_PREFIX_PATTERN = register("model.prefix", r'^(Type|Model|Name|Description|Item)\s*[:;-]\s*', re.IGNORECASE)
+MODEL_QUANTITY_PATTERN = register("model.quantity", r'\d+\s*[x×]\s*')
+ITEM_QUANTITY_PATTERN = register("item.quantity", r'(\d+)\s*[x×]')
+
+# Columns of the equipment frames returned by parse_equipment_items
+EQUIPMENT_COLUMNS = [
+    'model', 'manufacturer', 'quantity', 'equipment_type', 'raw_text',
+    'power', 'dmx_channels', 'frequency_response', 'resolution'
+]
+
+# Manufacturers not in the catalog
+MANUFACTURER_PATTERNS = [
+    register("manufacturer.before_model_number", r'^([A-Z][a-zA-Z\s&-]+?)\s+[A-Z0-9\-]+'),  # Brand followed by model number
+    register("manufacturer.leading_words", r'^([A-Z][a-zA-Z\s&-]{2,15})\s+'),  # Capitalized words at the beginning
+]
+
 # Attempt to import PDF processing libraries
 try:
     import PyPDF2
@@ -20,167 +86,486 @@ except ImportError:
 class PDFProcessor:
     """Handles PDF text extraction and equipment data parsing."""
     
-    def __init__(self):
-        """Initialize the PDF processor with equipment patterns and keywords."""
+    def __init__(self, page_jobs=1, cache=None, cache_equipment=True, venue_name_pages=3,
+                 use_outline=False, triage_threshold=40, triage_pages=8, prefilter=False,
+                 relevance_min_hits=1, parse_cache_size=4096):
+        """Initialize the PDF processor with equipment patterns and keywords.
+        
+        page_jobs is the number of worker processes used to extract the pages
+        of a single PDF in parallel. cache is an optional ExtractionCache used
+        to skip PDF decoding for unchanged documents; with cache_equipment the
+        parsed equipment items are cached as well. venue_name_pages is the
+        number of leading pages searched for the venue name. With use_outline
+        only the pages of the equipment chapters listed in the PDF outline
+        are extracted and parsed (all pages if there is no such outline).
+        triage_threshold and triage_pages configure triage_pdf. With prefilter
+        only sections with at least relevance_min_hits equipment keyword or
+        manufacturer hits are run through the full parsers; it is off by
+        default, as it misses equipment in sections without such hits. parse_cache_size
+        bounds the number of parsed candidates memoized by parse_equipment_item
+        (0 disables the cache).
+        """
+        self.page_jobs = page_jobs
+        self.cache = cache
+        self.cache_equipment = cache_equipment
+        self.venue_name_pages = venue_name_pages
+        self.use_outline = use_outline
+        self.triage_threshold = triage_threshold
+        self.triage_pages = triage_pages
+        self.prefilter = prefilter
+        self.relevance_min_hits = relevance_min_hits
+        
+        # Parsed candidates keyed by (normalized text, quantity), least recently
+        # used first; shared by every document this processor handles
+        self.parse_cache_size = parse_cache_size
+        self.parse_cache = OrderedDict()
+        self.parse_cache_hits = 0
+        self.parse_cache_misses = 0
+        
         # Equipment type keywords for classification
-        self.equipment_keywords = {
-            "lighting": [
-                "lighting", "light", "fixture", "dimmer", "lantern", "par", "fresnel", 
-                "profile", "flood", "led", "moving", "wash", "spot", "beam", "strobe",
-                "haze", "fog", "dmx", "channel", "circuit", "luminaire"
-            ],
-            "sound": [
-                "sound", "audio", "speaker", "microphone", "mic", "console", "mixer",
-                "amplifier", "amp", "monitor", "pa", "system", "wireless", "radio",
-                "headset", "earpiece", "di", "direct", "box", "compressor", "eq"
-            ],
-            "video": [
-                "video", "projection", "projector", "screen", "display", "monitor",
-                "camera", "led", "wall", "panel", "visual", "hdmi", "sdi", "dvi",
-                "switcher", "scaler", "converter", "plasma", "lcd", "oled"
-            ]
+        self.equipment_keywords = EQUIPMENT_KEYWORDS
+        self.equipment_classifier = EquipmentClassifier(self.equipment_keywords)
+        
+        # Headings that give the equipment type of the text below them
+        self.section_index = SectionIndex()
+        
+        # Technical specifications looked for in each type of equipment
+        # (items without a known type are checked for all of them)
+        self.spec_fields = {
+            'lighting': {'power', 'dmx_channels'},
+            'sound': {'power', 'frequency_response'},
+            'video': {'power', 'resolution'}
         }
         
-        # Common patterns for extracting equipment information
-        self.quantity_patterns = [
-            r"(\d+)\s*[x×]\s*([A-Za-z0-9\s\-\(\)\'\"\.]+)",  # 10x Item description
-            r"([A-Za-z0-9\s\-\(\)\'\"\.]+)\s*[:\-]\s*(\d+)",  # Item description: 10
-            r"(\d+)\s+([A-Za-z0-9\s\-\(\)\'\"\.]+)",  # 10 Item description
-        ]
+        # Known manufacturers (see schema/manufacturers.json)
+        self.manufacturer_catalog = get_manufacturer_catalog()
         
-        # List patterns for structured data
-        self.list_patterns = [
-            r"(\d+)[\.|\)](.*?)(?=(?:\d+)[\.|\)]|\Z)",  # Numbered lists: 1. Item 1, 2. Item 2
-            r"[\•|\-|\*|\–](.*?)(?=[\•|\-|\*|\–]|\Z)",  # Bulleted lists: • Item 1, • Item 2
-        ]
+        # Vocabulary used to triage documents and pre-filter sections: every
+        # equipment keyword, plus manufacturer names matched case-sensitively
+        # (so "etc." is not "ETC")
+        self.triage_keywords = {
+            keyword for keywords in self.equipment_keywords.values() for keyword in keywords
+        }
+        
+        # Outline (bookmark) titles of chapters that list equipment
+        self.outline_chapter_pattern = OUTLINE_CHAPTER_PATTERN
+        
+        # Common patterns for extracting equipment information
+        self.quantity_patterns = QUANTITY_PATTERNS
+    
+    def extract_pages_from_pdf(self, pdf_path, max_pages=None):
+        """Extract the text of each page (or the first max_pages pages) of a PDF file using PyPDF2."""
+        try:
+            return extract_page_texts(pdf_path, jobs=self.page_jobs, max_pages=max_pages)
+        except Exception as e:
+            print(f"Error extracting text from {pdf_path}: {e}")
+            return []
+    
+    def iter_pages_from_pdf(self, pdf_path, page_numbers=None):
+        """Yield the text of each page (or just page_numbers) of a PDF file as it is decoded.
+        
+        A decoding error is raised (as a RuntimeError) rather than ending the
+        pages early, so a document that fails partway is never parsed or
+        cached as if it were complete.
+        """
+        page_count = 0
+        try:
+            for page_text in iter_page_texts(pdf_path, jobs=self.page_jobs, page_numbers=page_numbers):
+                yield page_text
+                page_count += 1
+        except Exception as e:
+            raise RuntimeError(f"text extraction failed after {page_count} pages: {e}") from e
     
     def extract_text_from_pdf(self, pdf_path):
         """Extract full text from a PDF file using PyPDF2."""
-        text = ""
+        return self.join_pages(self.extract_pages_from_pdf(pdf_path))
+    
+    @staticmethod
+    def join_pages(page_texts):
+        """Join page texts into a single document string, skipping empty pages."""
+        return "".join(page_text + "\n\n" for page_text in page_texts if page_text)
+    
+    def find_equipment_pages(self, pdf_path):
+        """Return the sorted page numbers of the outline's equipment chapters.
+        
+        Returns None when the PDF has no outline or none of its chapters look
+        like lighting, sound or video chapters.
+        """
         try:
-            with open(pdf_path, 'rb') as file:
-                reader = PyPDF2.PdfReader(file)
-                for page_num in range(len(reader.pages)):
-                    page = reader.pages[page_num]
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n\n"
-            return text
+            sections = read_outline_sections(pdf_path)
         except Exception as e:
-            print(f"Error extracting text from {pdf_path}: {e}")
-            return ""
+            print(f"Error reading outline from {pdf_path}: {e}")
+            return None
+        
+        page_numbers = set()
+        for title, level, start_page, stop_page in sections:
+            if self.outline_chapter_pattern.search(title):
+                page_numbers.update(range(start_page, stop_page))
+        
+        return sorted(page_numbers) or None
+    
+    def score_triage_page(self, page_text):
+        """Score how much a page reads like an equipment list.
+        
+        The score is the number of equipment keyword hits per 1000 words, with
+        manufacturer names counting triple. Near-empty pages are scored as if
+        they had 50 words so that a lone heading does not dominate.
+        """
+        word_count, keyword_hits, manufacturer_hits = self.count_vocabulary_hits(page_text)
+        return 1000 * (keyword_hits + 3 * manufacturer_hits) / max(word_count, 50)
+    
+    def count_vocabulary_hits(self, text):
+        """Return (word_count, keyword_hits, manufacturer_hits) for a piece of text.
+        
+        Runs in a single pass over the words of the text plus one scan for
+        manufacturer names.
+        """
+        words = WORD_PATTERN.findall(text.lower())
+        keyword_hits = sum(1 for word in words if word in self.triage_keywords)
+        manufacturer_hits = len(self.manufacturer_catalog.find_all(text, match_case=True))
+        return len(words), keyword_hits, manufacturer_hits
     
-    def identify_venue_name(self, pdf_path, text=""):
-        """Try to identify the venue name from the PDF filename or content."""
+    def is_relevant_section(self, section):
+        """Decide whether a section mentions equipment at all.
+        
+        Sections without at least relevance_min_hits equipment keyword or
+        manufacturer hits are skipped by iter_equipment_items when the
+        pre-filter is enabled.
+        """
+        _, keyword_hits, manufacturer_hits = self.count_vocabulary_hits(section)
+        return keyword_hits + manufacturer_hits >= self.relevance_min_hits
+    
+    def triage_pdf(self, pdf_path):
+        """Decide cheaply whether a PDF looks like a technical specification.
+        
+        A handful of pages (the first two plus pages spread evenly through the
+        document) are decoded and scored with score_triage_page. The document
+        is accepted if its best sampled page reaches triage_threshold.
+        Returns a dict describing the decision, including an estimate of the
+        extraction time saved when the document is rejected.
+        """
+        start_time = time.perf_counter()
+        try:
+            page_count = count_pages(pdf_path)
+            sample = self._triage_sample(page_count)
+            page_texts = extract_page_texts(pdf_path, page_numbers=sample)
+        except Exception as e:
+            print(f"Error triaging {pdf_path}: {e}")
+            page_count, sample, page_texts = 0, [], []
+        elapsed = time.perf_counter() - start_time
+        
+        score = max((self.score_triage_page(text) for text in page_texts), default=0.0)
+        accepted = score >= self.triage_threshold
+        
+        # Estimate the work skipped from the per-page cost of the sample
+        seconds_saved = 0.0
+        if not accepted and sample:
+            seconds_saved = elapsed / len(sample) * (page_count - len(sample))
+        
+        return {
+            'accepted': accepted,
+            'score': round(score, 1),
+            'threshold': self.triage_threshold,
+            'page_count': page_count,
+            'pages_sampled': len(sample),
+            'triage_seconds': elapsed,
+            'estimated_seconds_saved': seconds_saved
+        }
+    
+    def _triage_sample(self, page_count):
+        """Choose the page numbers sampled by triage_pdf."""
+        if page_count <= self.triage_pages:
+            return list(range(page_count))
+        
+        sample = {0, 1}
+        spread = self.triage_pages - len(sample)
+        for index in range(spread):
+            sample.add(2 + index * (page_count - 3) // max(spread - 1, 1))
+        return sorted(sample)
+    
+    def identify_venue_name(self, pdf_path, text="", source_name=None):
+        """Try to identify the venue name from the PDF filename or content.
+        
+        Only the first venue_name_pages pages are searched, so text should hold
+        (at least) those pages if they have already been decoded; otherwise
+        they are read from the PDF. The PDF metadata title is used as a
+        fallback. source_name is the filename to use when pdf_path is
+        in-memory PDF data.
+        """
         # First, try to extract from filename
-        filename = Path(pdf_path).stem
+        filename = Path(source_name or pdf_path).stem
         venue_name = filename.replace('_', ' ').replace('-', ' ')
         
         # If the filename is just numbers or too short, try to extract from content
         if venue_name.isdigit() or len(venue_name) < 5:
             if not text:
-                text = self.extract_text_from_pdf(pdf_path)
+                text = self.join_pages(self.extract_pages_from_pdf(pdf_path, self.venue_name_pages))
             
             # Look for venue name patterns in the text
-            venue_patterns = [
-                r"([A-Z][a-zA-Z\s]+)\s+(Theatre|Theater|Hall|Venue|Auditorium|Arena|Stadium|Opera House)",
-                r"(Sydney Opera House|Royal Albert Hall|Carnegie Hall|Lincoln Center|Barbican)",
-                r"VENUE[:\s]+(.*?)[\n\r]",
-                r"TECHNICAL SPECIFICATIONS[:\s]+(.*?)[\n\r]",
-                r"^([A-Z][A-Za-z\s]{10,50})\s*$"  # Standalone venue names
-            ]
-            
-            for pattern in venue_patterns:
-                matches = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+            for pattern in VENUE_NAME_PATTERNS:
+                matches = pattern.search(text)
                 if matches:
                     potential_name = matches.group(1).strip() if len(matches.groups()) > 1 else matches.group(0).strip()
                     if len(potential_name) > 5 and len(potential_name) < 100:
                         return potential_name
+            
+            # Fall back to the document title from the PDF metadata
+            try:
+                title = read_pdf_title(pdf_path)
+            except Exception:
+                title = ""
+            if len(title) > 5 and len(title) < 100:
+                return title
         
         return venue_name
     
     def classify_equipment_type(self, text):
         """Determine the equipment type based on keywords in the text."""
-        text_lower = text.lower()
-        scores = {eq_type: 0 for eq_type in self.equipment_keywords}
-        
-        for eq_type, keywords in self.equipment_keywords.items():
-            for keyword in keywords:
-                if keyword in text_lower:
-                    scores[eq_type] += 1
-        
-        # Return the type with the highest score, or 'other' if no clear match
-        max_score = max(scores.values())
-        if max_score > 0:
-            return max(scores.items(), key=lambda x: x[1])[0]
-        return 'other'
+        return self.equipment_classifier.classify(text)
+    
+    def classify_equipment_types(self, texts):
+        """Determine the equipment types of many texts in one pass (see EquipmentClassifier)."""
+        return self.equipment_classifier.classify_batch(texts)
     
     def extract_equipment_from_text(self, text):
         """Extract equipment information from text using pattern matching."""
-        equipment_items = []
-        
-        # Split text into sections for better processing
-        sections = re.split(r'\n\s*\n', text)
+        return list(self.iter_equipment_items([text]))
+    
+    def iter_typed_sections(self, page_texts):
+        """Yield (equipment_type, section) pairs from an iterable of pages.
+        
+        Pages are split at the headings found by the section index and then
+        into blank-line separated blocks. equipment_type is the type announced
+        by the heading the block falls under, or None if it is not under an
+        equipment heading.
+        """
+        pages = (page_text for page_text in page_texts if page_text)
+        for page_text, section in self.section_index.iter_sections(pages):
+            section_text = page_text[section.heading_start:section.end]
+            for block in BLOCK_SEPARATOR_PATTERN.split(section_text):
+                yield section.equipment_type, block
+    
+    def iter_equipment_items(self, page_texts):
+        """Yield unique equipment items, parsing each page as soon as it arrives.
+        
+        page_texts can be any iterable of page strings (e.g. a generator that
+        decodes a PDF page by page), so parsing runs alongside extraction and
+        only the current page needs to be held in memory. Items under an
+        equipment heading take that heading's type. With the pre-filter
+        enabled, sections that fail is_relevant_section are not parsed.
+        """
+        seen_items = set()
         
-        for section in sections:
-            # Skip very short sections
-            if len(section.strip()) < 10:
+        for equipment_type, section in self.iter_typed_sections(page_texts):
+            if self.prefilter and not self.is_relevant_section(section):
                 continue
-            
-            # Try numbered and bulleted lists first
-            for pattern in self.list_patterns:
-                matches = re.findall(pattern, section, re.MULTILINE | re.DOTALL)
-                for match in matches:
-                    if isinstance(match, tuple):
-                        item_text = match[1].strip() if len(match) > 1 else match[0].strip()
+            for item in self.extract_equipment_from_section(section, equipment_type):
+                if item and item.model:
+                    # Create a key for deduplication
+                    key = (item.model.lower(), item.quantity)
+                    if key not in seen_items:
+                        seen_items.add(key)
+                        yield item
+    
+    def extract_equipment_frame(self, page_texts):
+        """Return the unique equipment items of page texts as a DataFrame.
+        
+        The same items as iter_equipment_items, in the same order, but the
+        candidates of every section are collected first and parsed in one
+        batch by parse_equipment_items, so no EquipmentItem is built per item.
+        """
+        texts, quantities, equipment_types = [], [], []
+        for equipment_type, section in self.iter_typed_sections(page_texts):
+            if self.prefilter and not self.is_relevant_section(section):
+                continue
+            for text, quantity in self.iter_section_candidates(section):
+                texts.append(text)
+                quantities.append(quantity)
+                equipment_types.append(equipment_type)
+        
+        items = self.parse_equipment_items(texts, quantities, equipment_types)
+        keys = pd.DataFrame({'model': items['model'].str.lower(), 'quantity': items['quantity']})
+        return items[~keys.duplicated()].reset_index(drop=True)
+    
+    def extract_equipment_from_section(self, section, equipment_type=None):
+        """Extract candidate equipment items (possibly invalid or duplicated) from one section.
+        
+        equipment_type is the type of the section, if known; otherwise each
+        item is classified on its own.
+        """
+        return [
+            self.parse_equipment_item(text, quantity, equipment_type)
+            for text, quantity in self.iter_section_candidates(section)
+        ]
+    
+    def iter_section_candidates(self, section):
+        """Yield the (text, quantity) pairs of one section that may describe equipment.
+        
+        quantity is None unless the strategy that found the text gave one.
+        """
+        # Skip very short sections
+        if len(section.strip()) < 10:
+            return
+        
+        # Classify each line once (see line_lexer.py)
+        lines = tokenize(section)
+        
+        # Try numbered and bulleted lists first
+        for item_text in iter_list_items(lines):
+            if len(item_text) > 5 and len(item_text) < 200:
+                yield item_text, None
+        
+        # Try quantity patterns
+        for pattern in self.quantity_patterns:
+            matches = pattern.findall(section)
+            for match in matches:
+                if len(match) == 2:
+                    # Determine which part is quantity and which is description
+                    if match[0].isdigit():
+                        quantity, description = match[0], match[1].strip()
+                    elif match[1].isdigit():
+                        description, quantity = match[0].strip(), match[1]
                     else:
-                        item_text = match.strip()
+                        continue
                     
-                    if len(item_text) > 5 and len(item_text) < 200:
-                        equipment_items.append(self.parse_equipment_item(item_text))
-            
-            # Try quantity patterns
-            for pattern in self.quantity_patterns:
-                matches = re.findall(pattern, section)
-                for match in matches:
-                    if len(match) == 2:
-                        # Determine which part is quantity and which is description
-                        if match[0].isdigit():
-                            quantity, description = match[0], match[1].strip()
-                        elif match[1].isdigit():
-                            description, quantity = match[0].strip(), match[1]
-                        else:
-                            continue
-                        
-                        if len(description) > 3:
-                            equipment_items.append(self.parse_equipment_item(description, quantity))
-            
-            # Look for table-like structures
-            lines = section.split('\n')
-            for line in lines:
-                line = line.strip()
-                if len(line) > 10 and len(line) < 200:
-                    # Check if line looks like equipment (contains alphanumeric and some numbers)
-                    if re.search(r'[A-Za-z]', line) and re.search(r'\d', line):
-                        # Skip lines that are clearly headers or page numbers
-                        if not re.match(r'^\s*(page|section|chapter|\d+)\s*$', line, re.IGNORECASE):
-                            equipment_items.append(self.parse_equipment_item(line))
-        
-        # Remove duplicates and filter out invalid items
-        unique_items = []
-        seen_items = set()
-        
-        for item in equipment_items:
-            if item and item.get('model'):
-                # Create a key for deduplication
-                key = (item['model'].lower(), item.get('quantity', ''))
-                if key not in seen_items:
-                    seen_items.add(key)
-                    unique_items.append(item)
+                    if len(description) > 3:
+                        yield description, quantity
+        
+        # Look for table-like structures
+        for line in lines:
+            line = line.text
+            if len(line) > 10 and len(line) < 200:
+                # Check if line looks like equipment (contains alphanumeric and some numbers)
+                if LETTER_PATTERN.search(line) and DIGIT_PATTERN.search(line):
+                    # Skip lines that are clearly headers or page numbers
+                    if not TABLE_HEADER_PATTERN.match(line):
+                        yield line, None
+    
+    def parse_equipment_item(self, text, quantity=None, equipment_type=None):
+        """Parse a single equipment item from text, reusing earlier results.
+        
+        equipment_type is the type of the section the text comes from, if
+        known. The same candidate is often found by several strategies (and
+        in the boilerplate of several documents), so results are memoized by
+        the whitespace-normalized text, quantity and section type. Whitespace does not affect
+        the parsed fields, except that raw_text keeps the spacing of the
+        first occurrence. Returns an EquipmentItem (None if the text does not
+        describe equipment); a copy is returned so callers may modify it.
+        """
+        if not self.parse_cache_size:
+            return self._parse_equipment_item(text, quantity, equipment_type)
+        
+        key = (" ".join(text.split()) if text else "", quantity or "", equipment_type)
+        if key in self.parse_cache:
+            self.parse_cache_hits += 1
+            self.parse_cache.move_to_end(key)
+            item = self.parse_cache[key]
+        else:
+            self.parse_cache_misses += 1
+            item = self._parse_equipment_item(text, quantity, equipment_type)
+            self.parse_cache[key] = item
+            if len(self.parse_cache) > self.parse_cache_size:
+                self.parse_cache.popitem(last=False)
+        
+        return item.copy() if item else item
+    
+    def parse_equipment_items(self, texts, quantities=None, equipment_types=None):
+        """Parse many equipment candidates at once into a DataFrame.
+        
+        Takes the arguments of parse_equipment_item as parallel sequences
+        (quantities and equipment_types default to None for every text) and
+        applies the same steps with vectorized string operations over the
+        whole batch. Repeated candidates are parsed once, in place of the
+        parse cache (which is not used). The result has the EQUIPMENT_COLUMNS,
+        missing specifications as NaN, and one row per valid candidate,
+        indexed by its position in texts.
+        """
+        candidates = pd.DataFrame({'text': list(texts)}, dtype=object)
+        candidates['quantity'] = pd.Series(quantities if quantities is None else list(quantities), dtype=object)
+        candidates['equipment_type'] = pd.Series(equipment_types if equipment_types is None else list(equipment_types),
+                                                 dtype=object)
+        
+        codes = candidates.groupby(list(candidates.columns), sort=False, dropna=False).ngroup()
+        unique = candidates[~codes.duplicated()].reset_index(drop=True)
+        parsed = self._parse_unique_candidates(unique['text'], unique['quantity'], unique['equipment_type'])
+        
+        codes = codes[codes.isin(parsed.index)]
+        items = parsed.loc[codes]
+        items.index = codes.index
+        return items
+    
+    def _parse_unique_candidates(self, texts, quantity, equipment_type):
+        """Parse Series of distinct candidates for parse_equipment_items."""
+        text = texts.str.strip()
+        valid = text.str.len() >= 3
+        text, quantity, equipment_type = text[valid], quantity[valid], equipment_type[valid]
+        
+        # Extract quantity if not provided, removing it from the text
+        missing = quantity.isna() | (quantity == '')
+        found = extract_column(text[missing], ITEM_QUANTITY_PATTERN).dropna()
+        quantity[found.index] = found
+        text[found.index] = replace_column(text[found.index], MODEL_QUANTITY_PATTERN, '', n=1).str.strip()
+        
+        # Clean up the model name, dropping candidates without one
+        model = self.clean_model_names(text)
+        kept = model.notna()
+        model, text, quantity, equipment_type = model[kept], text[kept], quantity[kept], equipment_type[kept]
+        
+        manufacturer = self.extract_manufacturers(model)
+        
+        # Determine equipment type, unless the section heading gave it
+        unknown = equipment_type.isna() | (equipment_type == '')
+        equipment_type[unknown] = self.classify_equipment_types(text[unknown])
+        
+        # Extract technical specifications, keeping those relevant to each type
+        items = pd.DataFrame({
+            'model': model,
+            'manufacturer': manufacturer,
+            'quantity': quantity.where(quantity.notna() & (quantity != ''), ''),
+            'equipment_type': equipment_type,
+            'raw_text': text,
+        }, columns=EQUIPMENT_COLUMNS)
+        specs = scan_spec_columns(text)
+        for field in specs.columns:
+            excluded = [eq_type for eq_type, fields in self.spec_fields.items() if field not in fields]
+            items[field] = specs[field].where(~equipment_type.isin(excluded))
         
-        return unique_items
+        return items
+    
+    def clean_model_names(self, texts):
+        """Clean a Series of model names as clean_model_name does, with NaN for rejected ones."""
+        models = replace_column(texts, MODEL_PREFIX_PATTERN, '')
+        models = replace_column(models, MODEL_QUANTITY_PATTERN, '')
+        models = models.str.strip('.,:;-')
+        models = replace_column(models, WHITESPACE_PATTERN, ' ').str.strip()
+        lengths = models.str.len()
+        return models.where((lengths >= 2) & (lengths <= 100))
     
-    def parse_equipment_item(self, text, quantity=None):
+    def extract_manufacturers(self, models):
+        """Return the manufacturers of a Series of model names, as extract_manufacturer does."""
+        manufacturers = pd.Series(
+            [match.name if match else None for match in map(self.manufacturer_catalog.match_prefix, models)],
+            index=models.index, dtype=object
+        )
+        for pattern in MANUFACTURER_PATTERNS:
+            missing = manufacturers.isna()
+            candidates = extract_column(models[missing], pattern).str.strip()
+            lengths = candidates.str.len()
+            valid = (lengths > 2) & (lengths < 20) & ~candidates.str.isdigit().astype(bool)
+            manufacturers[valid[valid].index] = candidates[valid]
+        return manufacturers.where(manufacturers.notna(), '')
+    
+    def parse_cache_stats(self):
+        """Return hit/miss counts and the hit rate of the parse cache."""
+        lookups = self.parse_cache_hits + self.parse_cache_misses
+        return {
+            'hits': self.parse_cache_hits,
+            'misses': self.parse_cache_misses,
+            'hit_rate': self.parse_cache_hits / lookups if lookups else 0.0,
+            'size': len(self.parse_cache)
+        }
+    
+    def _parse_equipment_item(self, text, quantity=None, equipment_type=None):
         """Parse a single equipment item from text."""
         if not text or len(text.strip()) < 3:
             return None
@@ -189,11 +574,11 @@ class PDFProcessor:
         
         # Extract quantity if not provided
         if not quantity:
-            quantity_match = re.search(r'(\d+)\s*[x×]', text)
+            quantity_match = ITEM_QUANTITY_PATTERN.search(text)
             if quantity_match:
                 quantity = quantity_match.group(1)
                 # Remove the quantity part from the text
-                text = re.sub(r'\d+\s*[x×]\s*', '', text, count=1).strip()
+                text = MODEL_QUANTITY_PATTERN.sub('', text, count=1).strip()
         
         # Clean up the model name
         model = self.clean_model_name(text)
@@ -203,20 +588,21 @@ class PDFProcessor:
         # Extract manufacturer if possible
         manufacturer = self.extract_manufacturer(model)
         
-        # Determine equipment type
-        equipment_type = self.classify_equipment_type(text)
+        # Determine equipment type, unless the section heading gave it
+        if not equipment_type:
+            equipment_type = self.classify_equipment_type(text)
         
         # Extract additional technical specifications
-        specs = self.extract_technical_specs(text)
-        
-        item = {
-            'model': model,
-            'manufacturer': manufacturer,
-            'quantity': quantity or '',
-            'equipment_type': equipment_type,
-            'raw_text': text,
+        specs = self.extract_technical_specs(text, equipment_type)
+        
+        item = EquipmentItem(
+            model=model,
+            manufacturer=manufacturer,
+            quantity=quantity or '',
+            equipment_type=equipment_type,
+            raw_text=text,
             **specs  # Add any extracted technical specifications
-        }
+        )
         
         return item
     
@@ -226,16 +612,16 @@ class PDFProcessor:
             return ""
         
         # Remove common prefixes
-        text = re.sub(r'^(Type|Model|Name|Description|Item)\s*[:;-]\s*', '', text, flags=re.IGNORECASE)
+        text = MODEL_PREFIX_PATTERN.sub('', text)
         
         # Remove quantity indicators
-        text = re.sub(r'\d+\s*[x×]\s*', '', text)
+        text = MODEL_QUANTITY_PATTERN.sub('', text)
         
         # Remove trailing punctuation and whitespace
         text = text.strip('.,:;-')
         
         # Clean up excessive whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = WHITESPACE_PATTERN.sub(' ', text).strip()
         
         # Remove very short or very long strings
         if len(text) < 2 or len(text) > 100:
@@ -248,33 +634,14 @@ class PDFProcessor:
         if not model_text:
             return ""
         
-        # Known manufacturers
-        manufacturers = [
-            # Lighting
-            "ETC", "Martin", "Robe", "Chauvet", "Elation", "Clay Paky", "High End", 
-            "Vari-Lite", "Ayrton", "GLP", "Philips", "Osram", "Strand",
-            # Sound
-            "L-Acoustics", "d&b audiotechnik", "Meyer Sound", "JBL", "Yamaha", 
-            "Shure", "Sennheiser", "DPA", "Audio-Technica", "Neumann", "AKG",
-            # Video
-            "Christie", "Barco", "Epson", "Sony", "Panasonic", "Samsung", 
-            "LG", "NEC", "Sharp", "Mitsubishi"
-        ]
-        
-        # Check for exact manufacturer matches at the beginning
-        for manufacturer in manufacturers:
-            pattern = r'^' + re.escape(manufacturer) + r'\b'
-            if re.search(pattern, model_text, re.IGNORECASE):
-                return manufacturer
+        # Check for known manufacturers at the beginning
+        match = self.manufacturer_catalog.match_prefix(model_text)
+        if match:
+            return match.name
         
         # Try to extract manufacturer from common patterns
-        patterns = [
-            r'^([A-Z][a-zA-Z\s&-]+?)\s+[A-Z0-9\-]+',  # Brand followed by model number
-            r'^([A-Z][a-zA-Z\s&-]{2,15})\s+'  # Capitalized words at the beginning
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, model_text)
+        for pattern in MANUFACTURER_PATTERNS:
+            match = pattern.search(model_text)
             if match:
                 potential_manufacturer = match.group(1).strip()
                 # Validate the extracted manufacturer
@@ -283,51 +650,118 @@ class PDFProcessor:
         
         return ""
     
-    def extract_technical_specs(self, text):
-        """Extract technical specifications from equipment text."""
-        specs = {}
-        
-        # Power specifications
-        power_match = re.search(r'(\d+)\s*[wW](?:att)?', text)
-        if power_match:
-            specs['power'] = power_match.group(1) + 'W'
-        
-        # DMX channels for lighting
-        dmx_match = re.search(r'(\d+)\s*(?:ch|channel|dmx)', text, re.IGNORECASE)
-        if dmx_match:
-            specs['dmx_channels'] = dmx_match.group(1)
-        
-        # Frequency response for sound
-        freq_match = re.search(r'(\d+(?:\.\d+)?)\s*(?:Hz|kHz)\s*[-–]\s*(\d+(?:\.\d+)?)\s*(?:Hz|kHz)', text, re.IGNORECASE)
-        if freq_match:
-            specs['frequency_response'] = f"{freq_match.group(1)}-{freq_match.group(2)} Hz"
-        
-        # Resolution for video
-        res_match = re.search(r'(\d+)\s*[x×]\s*(\d+)', text)
-        if res_match and int(res_match.group(1)) > 100 and int(res_match.group(2)) > 100:
-            specs['resolution'] = f"{res_match.group(1)}x{res_match.group(2)}"
-        
-        return specs
+    def extract_technical_specs(self, text, equipment_type=None):
+        """Extract technical specifications from equipment text.
+        
+        Only the specifications relevant to equipment_type (see spec_fields)
+        are looked for; all of them if the type is unknown or 'other'. All
+        of them are found in a single pass (see spec_scanner.py) and come
+        back as typed values (e.g. "2.5kW" with value 2.5 and unit "kW"),
+        with frequencies given in Hz.
+        """
+        return scan_specs(text, self.spec_fields.get(equipment_type, SPEC_FIELDS))
     
-    def process_venue_pdf(self, pdf_path):
-        """Process a venue PDF and extract all equipment information."""
-        print(f"  📄 Extracting text from PDF...")
-        text = self.extract_text_from_pdf(pdf_path)
-        
-        if not text:
-            print(f"  ❌ Could not extract text from PDF")
-            return None
-        
-        print(f"  🏢 Identifying venue name...")
-        venue_name = self.identify_venue_name(pdf_path, text)
-        
-        print(f"  🔍 Extracting equipment data...")
-        equipment_items = self.extract_equipment_from_text(text)
+    def _report_parse_cache(self, stats_before):
+        """Print the parse cache hit rate for the document just parsed."""
+        if not self.parse_cache_size:
+            return
+        stats = self.parse_cache_stats()
+        hits = stats['hits'] - stats_before['hits']
+        lookups = hits + stats['misses'] - stats_before['misses']
+        if lookups:
+            print(f"  🧠 Parse cache: {hits} of {lookups} candidates reused ({hits / lookups:.0%}), "
+                  f"{stats['hit_rate']:.0%} overall")
+    
+    @staticmethod
+    def _retain_pages(pages, page_texts, limit=None):
+        """Pass pages through unchanged while appending them (up to limit) to page_texts."""
+        for page_text in pages:
+            if limit is None or len(page_texts) < limit:
+                page_texts.append(page_text)
+            yield page_text
+    
+    @staticmethod
+    def _write_pages(pages, cache_entry):
+        """Pass pages through unchanged while adding them to a cache entry being written."""
+        for page_text in pages:
+            cache_entry.add_page(page_text)
+            yield page_text
+    
+    def process_venue_pdf(self, pdf_path, source_name=None):
+        """Process a venue PDF and extract all equipment information.
+        
+        pdf_path may be a file path or in-memory PDF data (bytes, bytearray or
+        memoryview); source_name names in-memory data in the output.
+        """
+        if source_name is None:
+            source_name = str(pdf_path) if is_pdf_path(pdf_path) else "in-memory.pdf"
+        
+        cache_key = None
+        cached = None
+        if self.cache:
+            # Outline-guided and pre-filtered runs parse different text, so cache them separately
+            parser_version = PARSER_VERSION + ("-outline" if self.use_outline else "")
+            parser_version += "-prefilter" if self.prefilter else ""
+            cache_key = self.cache.cache_key(pdf_path, parser_version)
+            cached = self.cache.get(cache_key)
+        
+        # Page numbers being processed (None means every page)
+        page_numbers = cached.get('page_numbers') if cached else None
+        
+        if cached and cached.get('equipment') is not None:
+            print(f"  ♻️  Using cached extraction")
+            page_texts = cached['pages']
+            equipment_items = [EquipmentItem.from_dict(item) for item in cached['equipment']]
+        else:
+            if cached:
+                print(f"  ♻️  Using cached text")
+                pages = cached['pages']
+            else:
+                if self.use_outline:
+                    page_numbers = self.find_equipment_pages(pdf_path)
+                    if page_numbers:
+                        print(f"  📑 Outline: processing {len(page_numbers)} pages of equipment chapters")
+                    else:
+                        print(f"  📑 No equipment chapters in the outline, scanning every page")
+                print(f"  📄 Extracting text and equipment data from PDF...")
+                pages = self.iter_pages_from_pdf(pdf_path, page_numbers)
+            
+            # Pages are written to the cache as they stream past (unless the
+            # cached text is all the cache would hold); only the leading
+            # pages used for the venue name are retained. If decoding fails
+            # partway the error propagates and the entry is discarded.
+            cache_entry = None
+            if self.cache and not (cached and not self.cache_equipment):
+                cache_entry = self.cache.open_entry(cache_key)
+                pages = self._write_pages(pages, cache_entry)
+            page_texts = []
+            pages = self._retain_pages(pages, page_texts, self.venue_name_pages)
+            try:
+                stats_before = self.parse_cache_stats()
+                equipment_items = list(self.iter_equipment_items(pages))
+                self._report_parse_cache(stats_before)
+                
+                if cache_entry:
+                    cache_entry.commit(
+                        page_numbers=page_numbers,
+                        equipment=[item.to_dict() for item in equipment_items] if self.cache_equipment else None
+                    )
+            finally:
+                if cache_entry:
+                    cache_entry.abort()
         
         if not equipment_items:
             print(f"  ⚠️  No equipment items found")
             return None
         
+        print(f"  🏢 Identifying venue name...")
+        # Reuse the already decoded leading pages rather than reading the PDF again
+        # (when only outline chapters were decoded, the leading pages are read on demand)
+        leading_text = ""
+        if page_numbers is None:
+            leading_text = self.join_pages(page_texts[:self.venue_name_pages])
+        venue_name = self.identify_venue_name(pdf_path, leading_text, source_name)
+        
         # Group equipment by type
         equipment_by_type = {
             'lighting': [],
@@ -337,12 +771,12 @@ class PDFProcessor:
         }
         
         for item in equipment_items:
-            eq_type = item.get('equipment_type', 'other')
+            eq_type = item.equipment_type or 'other'
             equipment_by_type[eq_type].append(item)
         
         venue_data = {
             'venue_name': venue_name,
-            'pdf_source': str(pdf_path),
+            'pdf_source': source_name,
             'equipment': equipment_items,
             'equipment_by_type': equipment_by_type,
             'total_items': len(equipment_items)
@@ -353,4 +787,4 @@ class PDFProcessor:
             if items:
                 print(f"     {eq_type.capitalize()}: {len(items)} items")
         
-        return venue_data
\ No newline at end of file
+        return venue_data
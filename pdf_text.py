@@ -0,0 +1,256 @@
+"""
+PDF Text Module
+
+This module is the text extraction engine shared by pdf_processor.py and
+extract_venue_info.py. Pages are streamed one at a time as they are decoded,
+and large documents can be split into page ranges that are extracted in
+parallel worker processes and stitched back together in order.
+
+PDFs can be given as a file path, which is memory-mapped rather than read
+through a buffered file, or as in-memory bytes/bytearray/memoryview data.
+Either way the reader works on a zero-copy view of the document.
+"""
+
+import io
+import mmap
+import os
+import multiprocessing
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+
+# Attempt to import PDF processing libraries
+try:
+    import PyPDF2
+    from PyPDF2.generic import IndirectObject
+except ImportError:
+    print("Required packages not installed. Please run:")
+    print("pip install PyPDF2 pandas")
+    exit(1)
+
+# Smallest page range worth handing to a worker process
+MIN_PAGES_PER_JOB = 8
+
+class BufferStream(io.RawIOBase):
+    """Read-only, seekable file object over a buffer, without copying the buffer.
+    
+    Only the byte ranges the PDF reader actually asks for are copied out.
+    """
+    
+    def __init__(self, buffer):
+        super().__init__()
+        self._view = memoryview(buffer).cast('B')
+        self._pos = 0
+    
+    def readable(self):
+        return True
+    
+    def seekable(self):
+        return True
+    
+    def read(self, size=-1):
+        start = self._pos
+        end = len(self._view) if size is None or size < 0 else min(start + size, len(self._view))
+        self._pos = max(start, end)
+        return self._view[start:end].tobytes()
+    
+    def readinto(self, buffer):
+        data = self.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+    
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._pos + offset
+        elif whence == io.SEEK_END:
+            position = len(self._view) + offset
+        else:
+            raise ValueError(f"invalid whence ({whence})")
+        if position < 0:
+            raise ValueError(f"negative seek position {position}")
+        self._pos = position
+        return position
+    
+    def tell(self):
+        return self._pos
+    
+    def close(self):
+        if not self.closed:
+            self._view.release()
+        super().close()
+
+def is_pdf_path(source):
+    """Return True if source names a PDF file rather than holding its data."""
+    return isinstance(source, (str, os.PathLike))
+
+@contextmanager
+def open_pdf_buffer(source):
+    """Yield a read-only memoryview of a PDF given as a path or in-memory data.
+    
+    Paths are memory-mapped, so the document is never read into a Python
+    bytes object as a whole.
+    """
+    if not is_pdf_path(source):
+        with memoryview(source) as view:
+            yield view
+        return
+    
+    with open(source, 'rb') as file:
+        try:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Empty files (and some special files) cannot be mapped
+            with memoryview(file.read()) as view:
+                yield view
+            return
+        
+        try:
+            with memoryview(mapped) as view:
+                yield view
+        finally:
+            mapped.close()
+
+@contextmanager
+def open_pdf_stream(source):
+    """Yield a seekable binary stream over a PDF given as a path or in-memory data."""
+    with open_pdf_buffer(source) as view:
+        stream = BufferStream(view)
+        try:
+            yield stream
+        finally:
+            stream.close()
+
+def split_page_ranges(page_count, parts):
+    """Split page_count pages into at most `parts` contiguous (start, stop) ranges."""
+    parts = max(1, min(parts, page_count))
+    base, extra = divmod(page_count, parts)
+    ranges = []
+    start = 0
+    for index in range(parts):
+        stop = start + base + (1 if index < extra else 0)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+def _release_page(reader, page):
+    """Drop a page's content streams from the reader's object cache.
+    
+    PyPDF2 keeps every object it resolves (including decoded content streams)
+    for the lifetime of the reader, so without this a long document keeps all
+    of its page contents alive until the end.
+    """
+    pending = [dict.get(page, "/Contents")]
+    while pending:
+        obj = pending.pop()
+        if isinstance(obj, IndirectObject):
+            pending.append(reader.resolved_objects.pop((obj.generation, obj.idnum), None))
+        elif isinstance(obj, list):
+            pending.extend(list.__iter__(obj))
+
+def _iter_reader_pages(reader, page_numbers):
+    """Yield the text of the given pages of an open reader, releasing each page after use."""
+    for page_num in page_numbers:
+        page = reader.pages[page_num]
+        page_text = page.extract_text() or ""
+        _release_page(reader, page)
+        del page
+        yield page_text
+
+def _extract_pages(pdf_path, page_numbers):
+    """Extract the text of the given pages with a reader of our own."""
+    with open_pdf_stream(pdf_path) as stream:
+        reader = PyPDF2.PdfReader(stream)
+        return list(_iter_reader_pages(reader, page_numbers))
+
+def _effective_jobs(jobs, page_count):
+    """Work out how many worker processes a document of page_count pages should use."""
+    # Daemonic processes (e.g. multiprocessing.Pool workers) cannot spawn children
+    if not jobs or multiprocessing.current_process().daemon:
+        return 1
+    return max(1, min(jobs, page_count // MIN_PAGES_PER_JOB))
+
+def iter_page_texts(pdf_path, jobs=1, max_pages=None, page_numbers=None):
+    """Yield the text of each page of a PDF, in page order, as it is decoded.
+    
+    pdf_path may also be in-memory PDF data (bytes, bytearray or memoryview).
+    page_numbers restricts extraction to the given (0-based) pages, and only
+    the first max_pages of those are read when a page budget is given.
+    With jobs > 1 a PDF file is split into page ranges that are extracted in
+    separate processes, each of which opens the file independently; pages are
+    then yielded one range at a time. In-memory data is always extracted
+    in-process.
+    """
+    with open_pdf_stream(pdf_path) as stream:
+        reader = PyPDF2.PdfReader(stream)
+        if page_numbers is None:
+            page_numbers = range(len(reader.pages))
+        page_numbers = list(page_numbers)[:max_pages]
+        jobs = _effective_jobs(jobs, len(page_numbers)) if is_pdf_path(pdf_path) else 1
+        if jobs <= 1:
+            yield from _iter_reader_pages(reader, page_numbers)
+            return
+    
+    ranges = split_page_ranges(len(page_numbers), jobs)
+    with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+        futures = [executor.submit(_extract_pages, os.fspath(pdf_path), page_numbers[start:stop])
+                   for start, stop in ranges]
+        for future in futures:
+            yield from future.result()
+
+def extract_page_texts(pdf_path, jobs=1, max_pages=None, page_numbers=None):
+    """Extract the text of every page of a PDF, returned as a list in page order."""
+    return list(iter_page_texts(pdf_path, jobs, max_pages, page_numbers))
+
+def count_pages(pdf_path):
+    """Return the number of pages in a PDF."""
+    with open_pdf_stream(pdf_path) as stream:
+        return len(PyPDF2.PdfReader(stream).pages)
+
+def read_pdf_title(pdf_path):
+    """Return the document title from the PDF metadata, or "" if there is none."""
+    with open_pdf_stream(pdf_path) as stream:
+        metadata = PyPDF2.PdfReader(stream).metadata
+        title = metadata.title if metadata else None
+    return str(title).strip() if title else ""
+
+def _flatten_outline(reader, outline, level=0):
+    """Yield (title, level, page_number) for every entry of a nested outline."""
+    for entry in outline:
+        if isinstance(entry, list):
+            yield from _flatten_outline(reader, entry, level + 1)
+            continue
+        try:
+            page_number = reader.get_destination_page_number(entry)
+        except Exception:
+            continue
+        if page_number is not None and page_number >= 0:
+            yield str(entry.title).strip(), level, page_number
+
+def read_outline_sections(pdf_path):
+    """Map the PDF outline (bookmark tree) to page ranges.
+    
+    Returns a list of (title, level, start_page, stop_page) tuples in
+    document order, where [start_page, stop_page) runs up to the next entry
+    at the same or a higher level. The list is empty if the PDF has no
+    outline.
+    """
+    with open_pdf_stream(pdf_path) as stream:
+        reader = PyPDF2.PdfReader(stream)
+        try:
+            outline = reader.outline
+        except Exception:
+            outline = []
+        entries = list(_flatten_outline(reader, outline))
+        page_count = len(reader.pages)
+    
+    sections = []
+    for index, (title, level, start_page) in enumerate(entries):
+        stop_page = page_count
+        for _, next_level, next_start in entries[index + 1:]:
+            if next_level <= level:
+                stop_page = next_start
+                break
+        # Entries that share a page with the next chapter still cover that page
+        sections.append((title, level, start_page, max(stop_page, start_page + 1)))
+    return sections
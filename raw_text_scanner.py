@@ -0,0 +1,163 @@
+"""
+Raw Text Scanner Module
+
+This module finds manufacturer, model and quantity mentions in the raw text of
+extracted equipment rows. It recognizes the same four forms as the regular
+expressions previously used by fixed_final_output.extract_equipment_from_raw_text:
+
+- Brand Model - Quantity
+- Brand Model Quantity
+- Quantity x Brand Model
+- a known manufacturer followed by a model
+
+In the first two forms the brand, the model and the whitespace between them
+could all absorb spaces, so a line without a quantity was retried at every
+split point from every start position. Here the runs of brand and model
+characters are found once and the split the regex would pick (longest brand,
+then longest model) is computed directly, so scanning is linear in the length
+of the text. The third form does not backtrack and is kept as a regex. Known
+manufacturers are those of the manufacturer catalog (schema/manufacturers.json),
+found by name or alias as spelled there and reported by canonical name,
+rather than the few brands the last regex listed.
+
+All texts of a column are scanned in one pass, joined by a separator that no
+match can contain.
+"""
+
+from bisect import bisect_right
+from collections import namedtuple
+
+from pattern_registry import register
+from schema.manufacturer_catalog import get_manufacturer_catalog
+
+# A mention found in texts[index]; manufacturer and model are stripped
+RawTextMatch = namedtuple("RawTextMatch", ["index", "manufacturer", "model", "quantity"])
+
+# Neither whitespace nor a brand, model or quantity character
+SEPARATOR = "\0"
+
+# Run of brand characters starting at a capital letter
+BRAND_RUN_PATTERN = register("raw_text_scanner.brand_run", r"[A-Z][a-zA-Z\s&]*")
+# Run of model characters
+MODEL_RUN_PATTERN = register("raw_text_scanner.model_run", r"[A-Za-z0-9\-\s]*")
+# Quantity after whitespace: Brand Model Quantity
+QUANTITY_START_PATTERN = register("raw_text_scanner.quantity_start", r"(?<=\s)\d")
+# Dash after whitespace: Brand Model - Quantity
+DASH_PATTERN = register("raw_text_scanner.dash", r"(?<=\s)[-–]")
+DASH_QUANTITY_PATTERN = register("raw_text_scanner.dash_quantity", r"\s+(\d+)")
+DIGITS_PATTERN = register("raw_text_scanner.digits", r"\d+")
+
+# Quantity x Brand Model; a quantity only starts at the first digit of a number
+QUANTITY_FIRST_PATTERN = register("raw_text_scanner.quantity_first", r"(?<!\d)(\d+)\s*[xX]\s*([A-Z][a-zA-Z\s&]+)\s+([A-Za-z0-9\-\s]+)")
+# Model after a known manufacturer
+KNOWN_MODEL_PATTERN = register("raw_text_scanner.known_model", r"\s+([A-Za-z0-9\-\s]+)")
+
+def _last_quantity_site(text, start, end):
+    """Return (site, quantity, match end) for the last quantity in text[start:end + 1], or None."""
+    site = None
+    for site_match in QUANTITY_START_PATTERN.finditer(text, start, min(end + 1, len(text))):
+        site = site_match.start()
+    if site is None:
+        return None
+    digits = DIGITS_PATTERN.match(text, site)
+    return site, digits.group(), digits.end()
+
+def _last_dash_site(text, start, end):
+    """Return (site, quantity, match end) for the last " - N" in text[start:end + 1], or None."""
+    best = None
+    for site_match in DASH_PATTERN.finditer(text, start, min(end + 1, len(text))):
+        quantity = DASH_QUANTITY_PATTERN.match(text, site_match.end())
+        if quantity:
+            best = site_match.start(), quantity.group(1), quantity.end()
+    return best
+
+def _iter_brand_model_quantity(text, find_site):
+    """Yield (start, manufacturer, model, quantity) for Brand Model <quantity> mentions.
+    
+    find_site(text, start, end) returns the last place a quantity can follow
+    a model running up to end, as (site, quantity, match end). A match
+    starts at the first capital letter of a run of brand characters. Its
+    brand ends at the last whitespace that leaves a model of at least one
+    character before the site (and no "&", which models cannot contain),
+    and its model runs from there to the site.
+    """
+    position = 0
+    # The model run text[cached_start:cached_end] and its site; every start
+    # inside one model run shares them
+    cached_start, cached_end, cached_site = -1, -1, None
+    
+    while True:
+        brand_run = BRAND_RUN_PATTERN.search(text, position)
+        if not brand_run:
+            return
+        start, brand_end = brand_run.span()
+        
+        if not cached_start <= brand_end <= cached_end:
+            cached_start, cached_end = brand_end, MODEL_RUN_PATTERN.match(text, brand_end).end()
+            cached_site = find_site(text, cached_start, cached_end)
+        
+        split = -1
+        if cached_site:
+            site, quantity, match_end = cached_site
+            lowest = max(start + 2, text.rfind("&", start, brand_end) + 1)
+            split = min(brand_end - 1, site - 3)
+            while split >= lowest and not text[split].isspace():
+                split -= 1
+            if split < lowest:
+                split = -1
+        
+        if split < 0:
+            # Later starts in this brand run would fail the same way
+            position = brand_end
+            continue
+        
+        yield start, text[start:split].strip(), text[split:site].strip(), quantity
+        position = match_end
+
+def _iter_quantity_first(text):
+    """Yield (start, manufacturer, model, quantity) for Quantity x Brand Model mentions."""
+    for match in QUANTITY_FIRST_PATTERN.finditer(text):
+        quantity, manufacturer, model = match.groups()
+        yield match.start(), manufacturer.strip(), model.strip(), quantity
+
+def _iter_known_manufacturer_models(text):
+    """Yield (start, manufacturer, model, quantity) for known manufacturers followed by a model.
+    
+    As with a regex, matches do not overlap: a manufacturer mentioned inside
+    the model of a previous match is skipped.
+    """
+    position = 0
+    for mention in get_manufacturer_catalog().find_all(text, match_case=True):
+        if mention.start < position:
+            continue
+        model = KNOWN_MODEL_PATTERN.match(text, mention.end)
+        if model:
+            yield mention.start, mention.name, model.group(1).strip(), ""
+            position = model.end()
+
+def scan_raw_texts(texts):
+    """Find the manufacturer/model mentions in a sequence of texts.
+    
+    Returns a list of RawTextMatch, ordered by text, then by form (in the
+    order listed in the module docstring), then by position.
+    """
+    text = SEPARATOR.join(texts)
+    offsets = [0]
+    for piece in texts[:-1]:
+        offsets.append(offsets[-1] + len(piece) + len(SEPARATOR))
+    
+    scans = [
+        _iter_brand_model_quantity(text, _last_dash_site),
+        _iter_brand_model_quantity(text, _last_quantity_site),
+        _iter_quantity_first(text),
+        _iter_known_manufacturer_models(text),
+    ]
+    
+    found = []
+    for form, scan in enumerate(scans):
+        for start, manufacturer, model, quantity in scan:
+            index = bisect_right(offsets, start) - 1
+            found.append((index, form, start, RawTextMatch(index, manufacturer, model, quantity)))
+    
+    found.sort(key=lambda entry: entry[:3])
+    return [entry[3] for entry in found]
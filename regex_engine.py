@@ -0,0 +1,321 @@
+"""
+Regex Engine Module
+
+This module is the regular expression facade used by the extraction and
+cleanup code. It offers the parts of the re module those modules use
+(compile, search, match, fullmatch, findall, finditer, sub, subn, split,
+escape and the flags) and runs each pattern on one of two engines:
+
+- "re2": Google's RE2 (pip install google-re2), which matches in time linear
+  in the length of the text whatever the pattern, so hostile PDF text cannot
+  make a pattern backtrack for minutes.
+- "re": the standard library engine.
+
+By default RE2 is used when it is installed and re otherwise; set the
+VENUE_REGEX_ENGINE environment variable to "re" or "re2" (or call set_engine)
+to choose. Results are the same on both engines: patterns are validated by re
+first, re's Unicode \\d, \\w and \\s are translated to the equivalent RE2
+classes (RE2's own are ASCII-only), and patterns RE2 cannot run exactly as re
+does (lookarounds, backreferences, word boundaries, verbose patterns, ...)
+fall back to re automatically.
+"""
+
+import os
+import re as _re
+
+try:
+    import re2 as _re2
+except ImportError:
+    _re2 = None
+
+# Environment variable choosing the engine: "auto" (default), "re" or "re2"
+ENGINE_VARIABLE = "VENUE_REGEX_ENGINE"
+
+IGNORECASE = I = _re.IGNORECASE
+MULTILINE = M = _re.MULTILINE
+DOTALL = S = _re.DOTALL
+VERBOSE = X = _re.VERBOSE
+ASCII = A = _re.ASCII
+UNICODE = U = _re.UNICODE
+
+error = _re.error
+escape = _re.escape
+
+# Flags RE2 supports, as inline flags
+_INLINE_FLAGS = [(IGNORECASE, "i"), (MULTILINE, "m"), (DOTALL, "s")]
+
+# Contents of RE2 classes matching what re's \d, \w and \s match in str patterns
+_CLASSES = {
+    "d": r"\p{Nd}",
+    "w": r"\p{L}\p{N}_",
+    "s": r"\t-\r\x{1c}-\x{1f}\x{85}\p{Z}",
+}
+
+# Compiled patterns by (pattern type, pattern, flags, engine); cleared when full
+_MAXCACHE = 512
+_cache = {}
+
+# Patterns that fell back to re on the RE2 engine, as (pattern, flags)
+_fallbacks = set()
+
+class _Unsupported(Exception):
+    """Raised for pattern syntax RE2 cannot run with re's semantics."""
+
+def _translate(pattern, flags):
+    """Translate a pattern valid for re into RE2 syntax.
+    
+    Returns (translated, bare, end_anchored): bare is the translation
+    without its ^, $, \\A and \\Z anchors and end_anchored tells whether
+    the pattern uses $ outside MULTILINE mode, which unlike RE2's also
+    matches before a newline at the end of the text.
+    """
+    if flags & ~(IGNORECASE | MULTILINE | DOTALL | UNICODE):
+        raise _Unsupported
+    
+    prefix = "".join(letter for flag, letter in _INLINE_FLAGS if flags & flag)
+    out = [f"(?{prefix})"] if prefix else []
+    bare = list(out)
+    end_anchored = False
+    in_class = False
+    class_start = 0
+    index = 0
+    
+    while index < len(pattern):
+        char = pattern[index]
+        piece = char
+        anchor = False
+        
+        if char == "\\":
+            index += 1
+            escaped = pattern[index]
+            if escaped in _CLASSES:
+                piece = _CLASSES[escaped] if in_class else f"[{_CLASSES[escaped]}]"
+            elif escaped == "D":
+                piece = r"\P{Nd}"
+            elif escaped in "WS" and not in_class:
+                piece = f"[^{_CLASSES[escaped.lower()]}]"
+            elif escaped == "b" and in_class:
+                piece = r"\x{8}"
+            elif escaped in "uU":
+                digits = 4 if escaped == "u" else 8
+                piece = "\\x{" + pattern[index + 1:index + 1 + digits] + "}"
+                index += digits
+            elif escaped == "A":
+                piece, anchor = r"\A", True
+            elif escaped == "Z":
+                piece, anchor = r"\z", True
+            elif not escaped.isascii():
+                piece = "\\x{%x}" % ord(escaped)
+            elif escaped in "WSbBN" or escaped.isdigit():
+                # Unicode word boundaries, negated classes inside a class,
+                # named characters, backreferences and octal escapes
+                raise _Unsupported
+            else:
+                piece = "\\" + escaped
+        elif in_class:
+            if char == "]" and index > class_start:
+                in_class = False
+            elif char == "[" and pattern.startswith(":", index + 1):
+                # A POSIX class to RE2, literal characters to re
+                raise _Unsupported
+        elif char == "[":
+            in_class = True
+            class_start = index + 1
+            if pattern.startswith("^", class_start):
+                class_start += 1
+        elif char == "^":
+            anchor = True
+        elif char == "$":
+            anchor = True
+            end_anchored = not flags & MULTILINE
+        elif char == "{" and pattern.startswith(",", index + 1):
+            # {,n} is a repeat to re but literal text to RE2
+            raise _Unsupported
+        
+        out.append(piece)
+        if not anchor:
+            bare.append(piece)
+        index += 1
+    
+    return "".join(out), "".join(bare), end_anchored
+
+class Re2Pattern:
+    """A pattern run by RE2, with the interface of re.Pattern.
+    
+    A few calls are passed to the equivalent re pattern instead, where the
+    RE2 bindings would not return what re does: calls with pos or endpos
+    (the bindings re-encode the whole text on every call, which would make
+    scanning loops quadratic), texts ending in a newline for patterns that
+    use $, finditer, findall, sub and split for patterns that can match the
+    empty string (the bindings report some empty matches twice), and
+    replacement templates containing backslashes.
+    """
+    
+    def __init__(self, regexp, fallback, end_anchored, matches_empty):
+        self._regexp = regexp
+        self._fallback = fallback
+        self._end_anchored = end_anchored
+        self._matches_empty = matches_empty
+        self.pattern = fallback.pattern
+        self.flags = fallback.flags
+        self.groups = fallback.groups
+        self.groupindex = fallback.groupindex
+    
+    def __repr__(self):
+        return f"Re2Pattern({self.pattern!r})"
+    
+    def _engine(self, string):
+        """Return the compiled pattern that answers exactly for string."""
+        if not isinstance(string, str) or (self._end_anchored and string.endswith("\n")):
+            return self._fallback
+        return self._regexp
+    
+    def search(self, string, *args):
+        if args:
+            return self._fallback.search(string, *args)
+        return self._engine(string).search(string)
+    
+    def match(self, string, *args):
+        if args:
+            return self._fallback.match(string, *args)
+        return self._engine(string).match(string)
+    
+    def fullmatch(self, string, *args):
+        if args:
+            return self._fallback.fullmatch(string, *args)
+        return self._engine(string).fullmatch(string)
+    
+    def finditer(self, string, *args):
+        if args or self._matches_empty:
+            return self._fallback.finditer(string, *args)
+        return self._engine(string).finditer(string)
+    
+    def findall(self, string, *args):
+        if args or self._matches_empty:
+            return self._fallback.findall(string, *args)
+        return self._engine(string).findall(string)
+    
+    def sub(self, repl, string, count=0):
+        return self.subn(repl, string, count)[0]
+    
+    def subn(self, repl, string, count=0):
+        if self._matches_empty or (isinstance(repl, str) and "\\" in repl):
+            return self._fallback.subn(repl, string, count)
+        if isinstance(repl, str):
+            # The bindings mangle non-ASCII template text; a literal needs no expanding
+            literal = repl
+            repl = lambda match: literal
+        return self._engine(string).subn(repl, string, count)
+    
+    def split(self, string, maxsplit=0):
+        if self._matches_empty:
+            return self._fallback.split(string, maxsplit)
+        return self._engine(string).split(string, maxsplit)
+
+def _re2_options():
+    options = _re2.Options()
+    options.log_errors = False
+    return options
+
+def _compile_re2(pattern, flags):
+    """Compile a pattern for RE2, or for re if RE2 cannot run it exactly."""
+    fallback = _re.compile(pattern, flags)
+    if not isinstance(pattern, str):
+        return fallback
+    try:
+        translated, bare, end_anchored = _translate(pattern, fallback.flags)
+        regexp = _re2.compile(translated, _re2_options())
+    except (_Unsupported, _re2.error):
+        _fallbacks.add((pattern, flags))
+        return fallback
+    
+    try:
+        matches_empty = _re2.compile(bare, _re2_options()).fullmatch("") is not None
+    except _re2.error:
+        matches_empty = True
+    return Re2Pattern(regexp, fallback, end_anchored, matches_empty)
+
+def _engine_from_environment():
+    name = os.environ.get(ENGINE_VARIABLE, "auto").strip().lower() or "auto"
+    if name == "re2" and _re2 is None:
+        print(f"Warning: {ENGINE_VARIABLE}=re2 but google-re2 is not installed, using re")
+        return "re"
+    if name not in ("auto", "re", "re2"):
+        print(f"Warning: unknown {ENGINE_VARIABLE} value {name!r}, using auto")
+        name = "auto"
+    if name == "auto":
+        return "re2" if _re2 is not None else "re"
+    return name
+
+_engine = _engine_from_environment()
+
+def available_engines():
+    """Return the names of the engines that can be used here."""
+    return ["re", "re2"] if _re2 is not None else ["re"]
+
+def get_engine():
+    """Return the name of the engine patterns are compiled for."""
+    return _engine
+
+def set_engine(name):
+    """Choose the engine ("re", "re2" or "auto") for patterns compiled from now on.
+    
+    Patterns compiled before (e.g. at module import) keep their engine.
+    """
+    global _engine
+    if name == "auto":
+        name = "re2" if _re2 is not None else "re"
+    if name not in available_engines():
+        raise ValueError(f"Regex engine {name!r} is not available (have: {', '.join(available_engines())})")
+    _engine = name
+
+def fallback_patterns():
+    """Return the (pattern, flags) pairs that fell back to re on the RE2 engine."""
+    return sorted(_fallbacks, key=lambda entry: (str(entry[0]), entry[1]))
+
+def compile(pattern, flags=0):
+    """Compile a pattern for the current engine.
+    
+    Returns a re.Pattern, or a Re2Pattern with the same interface.
+    Compiled patterns are returned unchanged.
+    """
+    if isinstance(pattern, (_re.Pattern, Re2Pattern)):
+        if flags:
+            raise ValueError("cannot process flags argument with a compiled pattern")
+        return pattern
+    
+    key = (type(pattern), pattern, flags, _engine)
+    compiled = _cache.get(key)
+    if compiled is None:
+        if _engine == "re2":
+            compiled = _compile_re2(pattern, flags)
+        else:
+            compiled = _re.compile(pattern, flags)
+        if len(_cache) >= _MAXCACHE:
+            _cache.clear()
+        _cache[key] = compiled
+    return compiled
+
+def search(pattern, string, flags=0):
+    return compile(pattern, flags).search(string)
+
+def match(pattern, string, flags=0):
+    return compile(pattern, flags).match(string)
+
+def fullmatch(pattern, string, flags=0):
+    return compile(pattern, flags).fullmatch(string)
+
+def findall(pattern, string, flags=0):
+    return compile(pattern, flags).findall(string)
+
+def finditer(pattern, string, flags=0):
+    return compile(pattern, flags).finditer(string)
+
+def sub(pattern, repl, string, count=0, flags=0):
+    return compile(pattern, flags).sub(repl, string, count)
+
+def subn(pattern, repl, string, count=0, flags=0):
+    return compile(pattern, flags).subn(repl, string, count)
+
+def split(pattern, string, maxsplit=0, flags=0):
+    return compile(pattern, flags).split(string, maxsplit)
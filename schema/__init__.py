@@ -2,4 +2,9 @@
 Schema package for venue data standardization.
 """
 
-from .field_mapping import standardize_field_name, determine_equipment_type, load_schema
\ No newline at end of file
+from .field_mapping import (
+    standardize_field_name, standardize_field_names, determine_equipment_type, determine_equipment_types,
+    load_schema, get_schema
+)
+from .manufacturer_catalog import ManufacturerCatalog, get_manufacturer_catalog, load_manufacturer_catalog
+from .validator import SchemaValidator, get_schema_validator
\ No newline at end of file
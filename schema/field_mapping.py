@@ -1,6 +1,11 @@
 """
 Field mapping utilities for standardizing venue data.
 This module provides functions to map various field names to our standardized schema.
+
+The schema is loaded once per process and reloaded only when
+equipment_schema.json changes on disk (see get_schema_tables); the field
+mapping and the field x type matrix used to score equipment types are
+built from it once per load.
 """
 
 import json
@@ -8,43 +13,94 @@ import os
 import re
 from pathlib import Path
 
+import numpy as np
+
+SCHEMA_PATH = Path(__file__).parent / "equipment_schema.json"
+
+# Characters replaced by underscores when normalizing field names
+FIELD_NAME_SEPARATOR = re.compile(r'[^a-zA-Z0-9]')
+
 # Load the schema
 def load_schema():
     """Load the equipment schema from the JSON file."""
-    schema_path = Path(__file__).parent / "equipment_schema.json"
-    with open(schema_path, 'r') as f:
+    with open(SCHEMA_PATH, 'r') as f:
         return json.load(f)
 
+def normalize_field_name(field_name):
+    """Normalize a field name (lowercase, special characters to underscores)."""
+    return FIELD_NAME_SEPARATOR.sub('_', field_name.lower())
+
+class SchemaTables:
+    """Lookup tables built from one version of the equipment schema."""
+    
+    def __init__(self, schema):
+        self.schema = schema
+        
+        # Mapping of normalized aliases to their standardized field names
+        self.field_mapping = {}
+        for equipment_type in schema["equipment_types"]:
+            for field in equipment_type["fields"]:
+                for alias in field["aliases"]:
+                    self.field_mapping[normalize_field_name(alias)] = field["name"]
+        
+        # Field x type matrix: 1 where the type has the field
+        self.type_names = [equipment_type["type"] for equipment_type in schema["equipment_types"]]
+        self.field_index = {}
+        for equipment_type in schema["equipment_types"]:
+            for field in equipment_type["fields"]:
+                self.field_index.setdefault(field["name"], len(self.field_index))
+        self.type_matrix = np.zeros((len(self.field_index), len(self.type_names)), dtype=np.int32)
+        for column, equipment_type in enumerate(schema["equipment_types"]):
+            for field in equipment_type["fields"]:
+                self.type_matrix[self.field_index[field["name"]], column] = 1
+
+# The tables of the last schema loaded, and the (mtime, size) of the file they come from
+_tables = None
+_tables_stamp = None
+
+def get_schema_tables():
+    """Return the SchemaTables of equipment_schema.json, reloading it if the file changed."""
+    global _tables, _tables_stamp
+    stat = os.stat(SCHEMA_PATH)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    if _tables is None or stamp != _tables_stamp:
+        _tables = SchemaTables(load_schema())
+        _tables_stamp = stamp
+    return _tables
+
+def get_schema():
+    """Return the equipment schema, loaded once per process (do not modify it)."""
+    return get_schema_tables().schema
+
 # Build a mapping of all possible field names to their standardized names
 def build_field_mapping():
     """Build a dictionary mapping all possible field names to their standardized names."""
-    schema = load_schema()
-    mapping = {}
-    
-    for equipment_type in schema["equipment_types"]:
-        for field in equipment_type["fields"]:
-            for alias in field["aliases"]:
-                # Create a normalized version of the alias (lowercase, spaces to underscores)
-                normalized_alias = re.sub(r'[^a-zA-Z0-9]', '_', alias.lower())
-                # Map this normalized alias to the standardized field name
-                mapping[normalized_alias] = field["name"]
-                
-    return mapping
+    return dict(get_schema_tables().field_mapping)
 
 # Function to standardize a field name based on our mapping
 def standardize_field_name(raw_field_name):
     """Convert a raw field name to its standardized equivalent."""
-    field_mapping = build_field_mapping()
-    # Normalize the input field name
-    normalized_name = re.sub(r'[^a-zA-Z0-9]', '_', raw_field_name.lower())
-    
+    field_mapping = get_schema_tables().field_mapping
     # Return the standardized field name if found, otherwise return the original
-    return field_mapping.get(normalized_name, raw_field_name)
+    return field_mapping.get(normalize_field_name(raw_field_name), raw_field_name)
+
+def standardize_field_names(raw_field_names):
+    """Convert a list of raw field names to their standardized equivalents.
+    
+    The schema is looked up once for the whole list and each distinct name
+    is normalized once.
+    """
+    field_mapping = get_schema_tables().field_mapping
+    standardized = {}
+    for raw_field_name in raw_field_names:
+        if raw_field_name not in standardized:
+            standardized[raw_field_name] = field_mapping.get(normalize_field_name(raw_field_name), raw_field_name)
+    return [standardized[raw_field_name] for raw_field_name in raw_field_names]
 
 # Get the equipment type from a field set
 def determine_equipment_type(fields):
     """Try to determine the equipment type based on the fields present."""
-    schema = load_schema()
+    schema = get_schema()
     
     # Count matching fields for each equipment type
     type_scores = {}
@@ -59,4 +115,29 @@ def determine_equipment_type(fields):
     # Return the equipment type with the highest score
     if type_scores:
         return max(type_scores.items(), key=lambda x: x[1])[0]
-    return "unknown"
\ No newline at end of file
+    return "unknown"
+
+def determine_equipment_types(field_sets):
+    """Determine the equipment types of many field sets at once.
+    
+    Each field set (any iterable of standardized field names) becomes a row
+    of a field-set x field incidence matrix, which is multiplied by the
+    field x type matrix to score every type in one step. Ties go to the
+    first type in the schema, as in determine_equipment_type. Returns a list
+    of types in the same order as field_sets.
+    """
+    tables = get_schema_tables()
+    field_sets = list(field_sets)
+    if not tables.type_names:
+        return ["unknown"] * len(field_sets)
+    
+    incidence = np.zeros((len(field_sets), len(tables.field_index)), dtype=np.int32)
+    for row, fields in enumerate(field_sets):
+        for field in set(fields):
+            column = tables.field_index.get(field)
+            if column is not None:
+                incidence[row, column] = 1
+    
+    scores = incidence @ tables.type_matrix
+    types = np.array(tables.type_names, dtype=object)
+    return types[scores.argmax(axis=1)].tolist()
@@ -0,0 +1,182 @@
+"""
+Manufacturer catalog for venue data standardization.
+This module loads the known equipment manufacturers from manufacturers.json and
+compiles their names and aliases into a single Aho-Corasick automaton, so that
+recognizing a manufacturer costs the same however many brands are listed.
+
+Matching is case-insensitive, treats any run of whitespace as a single space
+and only accepts whole words (a match must not start or end inside a word).
+"""
+
+import json
+from collections import deque, namedtuple
+from pathlib import Path
+
+MANUFACTURERS_PATH = Path(__file__).parent / "manufacturers.json"
+
+# A recognized manufacturer: canonical name, equipment type and the matched span
+ManufacturerMatch = namedtuple("ManufacturerMatch", ["name", "equipment_type", "start", "end"])
+
+def _is_word_char(char):
+    return char.isalnum() or char == "_"
+
+def _normalize_char(char):
+    """Map a character to the symbol the automaton is built over."""
+    return " " if char.isspace() else char.lower()
+
+class ManufacturerCatalog:
+    """Known manufacturers compiled into a multi-pattern automaton."""
+    
+    def __init__(self, manufacturers):
+        """Compile the catalog.
+        
+        manufacturers is a list of dicts with a canonical "name", an
+        equipment "type" and optional "aliases" spelled differently in
+        spec sheets.
+        """
+        self.manufacturers = list(manufacturers)
+        
+        # Trie over normalized pattern characters; node 0 is the root
+        self._goto = [{}]
+        self._fail = [0]
+        # Patterns ending at each node: (length, canonical name, type, spelling).
+        # _patterns holds those spelled by the path from the root, _outputs
+        # adds the shorter ones reached through failure links.
+        self._patterns = [[]]
+        self._outputs = [[]]
+        
+        for manufacturer in self.manufacturers:
+            for spelling in [manufacturer["name"], *manufacturer.get("aliases", [])]:
+                self._add_pattern(" ".join(spelling.split()), manufacturer)
+        
+        self._build_failure_links()
+    
+    def _add_pattern(self, pattern, manufacturer):
+        node = 0
+        for char in pattern:
+            symbol = _normalize_char(char)
+            if symbol not in self._goto[node]:
+                self._goto.append({})
+                self._fail.append(0)
+                self._patterns.append([])
+                self._outputs.append([])
+                self._goto[node][symbol] = len(self._goto) - 1
+            node = self._goto[node][symbol]
+        self._patterns[node].append((len(pattern), manufacturer["name"], manufacturer["type"], pattern))
+    
+    def _build_failure_links(self):
+        """Breadth-first construction of the Aho-Corasick failure links."""
+        queue = deque(self._goto[0].values())
+        for node in queue:
+            self._outputs[node] = list(self._patterns[node])
+        while queue:
+            node = queue.popleft()
+            for symbol, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and symbol not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(symbol, 0)
+                self._outputs[child] = self._patterns[child] + self._outputs[self._fail[child]]
+    
+    def names(self, equipment_type=None):
+        """Return the canonical manufacturer names, optionally for one equipment type."""
+        return [manufacturer["name"] for manufacturer in self.manufacturers
+                if equipment_type is None or manufacturer["type"] == equipment_type]
+    
+    def types(self):
+        """Return the equipment types that have manufacturers in the catalog."""
+        return {manufacturer["type"] for manufacturer in self.manufacturers}
+    
+    def match_prefix(self, text, equipment_type=None, followed_by_space=False):
+        """Return the longest manufacturer at the start of text, or None.
+        
+        Leading whitespace is skipped. With equipment_type only manufacturers
+        of that type are considered, and with followed_by_space the name must
+        be followed by whitespace (i.e. by a model name). The returned match's
+        end is the index in text just after the manufacturer name.
+        """
+        if not text:
+            return None
+        
+        start = len(text) - len(text.lstrip())
+        best = None
+        node = 0
+        previous = ""
+        for index in range(start, len(text)):
+            symbol = _normalize_char(text[index])
+            if symbol == " " and previous == " ":
+                continue
+            node = self._goto[node].get(symbol)
+            if node is None:
+                break
+            previous = symbol
+            
+            if followed_by_space:
+                at_boundary = index + 1 < len(text) and text[index + 1].isspace()
+            else:
+                at_boundary = index + 1 == len(text) or not _is_word_char(text[index + 1])
+            if not at_boundary:
+                continue
+            for _, name, eq_type, _ in self._patterns[node]:
+                if equipment_type is None or eq_type == equipment_type:
+                    best = ManufacturerMatch(name, eq_type, start, index + 1)
+                    break
+        return best
+    
+    def find_all(self, text, match_case=False):
+        """Return every non-overlapping manufacturer mention in text.
+        
+        Overlapping candidates are resolved leftmost first, preferring the
+        longest. With match_case a mention must be spelled exactly as in
+        the catalog (e.g. so that "etc." is not taken for "ETC").
+        """
+        candidates = []
+        node = 0
+        previous = ""
+        length = 0   # normalized characters consumed so far
+        positions = []   # text index of each normalized character
+        for index, char in enumerate(text):
+            symbol = _normalize_char(char)
+            if symbol == " " and previous == " ":
+                continue
+            previous = symbol
+            positions.append(index)
+            length += 1
+            
+            while node and symbol not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(symbol, 0)
+            
+            for pattern_length, name, eq_type, spelling in self._outputs[node]:
+                start = positions[length - pattern_length]
+                end = index + 1
+                if start > 0 and _is_word_char(text[start - 1]) and _is_word_char(text[start]):
+                    continue
+                if end < len(text) and _is_word_char(text[end]) and _is_word_char(text[end - 1]):
+                    continue
+                if match_case and " ".join(text[start:end].split()) != spelling:
+                    continue
+                candidates.append(ManufacturerMatch(name, eq_type, start, end))
+        
+        matches = []
+        last_end = 0
+        for match in sorted(candidates, key=lambda m: (m.start, -m.end)):
+            if match.start >= last_end:
+                matches.append(match)
+                last_end = match.end
+        return matches
+
+def load_manufacturer_catalog(path=MANUFACTURERS_PATH):
+    """Load and compile the manufacturer catalog from a JSON file."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return ManufacturerCatalog(json.load(f)["manufacturers"])
+
+_catalog = None
+
+def get_manufacturer_catalog():
+    """Return the shared catalog compiled from manufacturers.json."""
+    global _catalog
+    if _catalog is None:
+        _catalog = load_manufacturer_catalog()
+    return _catalog
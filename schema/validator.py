@@ -0,0 +1,110 @@
+"""
+Schema validator for standardized equipment records.
+
+The equipment schema (equipment_schema.json) is compiled once into a
+SchemaValidator: the alias table of field_mapping, a bit per known field, a
+bitmask of the required fields of each equipment type and, for callers that
+clean values, a cleaner function per field. A record's fields mask (the OR
+of the bits of its non-empty fields) is best accumulated while the record is
+built; checking that it has the required fields of its type is then one AND
+and one comparison against the type's mask.
+
+The validator returned by get_schema_validator is built on the cached
+schema tables of field_mapping, so it shares their alias table and is
+compiled again when the schema file changes.
+"""
+
+from .field_mapping import get_schema_tables, normalize_field_name
+
+# Type whose required fields apply to records of a type not in the schema
+DEFAULT_EQUIPMENT_TYPE = "other"
+
+class SchemaValidator:
+    """The equipment schema compiled into lookup tables and required-field bitmasks."""
+    
+    def __init__(self, tables):
+        """Compile the schema of a field_mapping.SchemaTables."""
+        schema = tables.schema
+        self.schema = schema
+        self.version = schema.get("version", "")
+        self.field_mapping = tables.field_mapping
+        self.type_names = list(tables.type_names)
+        
+        # One bit per field, in order of first appearance in the schema
+        self.field_bits = {field: 1 << index for field, index in tables.field_index.items()}
+        
+        # Required fields, optional fields and bitmask of the required ones, per type
+        self.required_fields = {}
+        self.optional_fields = {}
+        self.required_masks = {}
+        for equipment_type in schema["equipment_types"]:
+            type_name = equipment_type["type"]
+            required = [field["name"] for field in equipment_type["fields"] if field.get("required")]
+            self.required_fields[type_name] = required
+            self.optional_fields[type_name] = [
+                field["name"] for field in equipment_type["fields"] if not field.get("required")
+            ]
+            mask = 0
+            for field in required:
+                mask |= self.field_bits[field]
+            self.required_masks[type_name] = mask
+        self.default_mask = self.required_masks.get(DEFAULT_EQUIPMENT_TYPE, 0)
+        
+        # Kind of cleaning for each field with a "cleaner" in the schema
+        self.cleaner_kinds = {}
+        for equipment_type in schema["equipment_types"]:
+            for field in equipment_type["fields"]:
+                if "cleaner" in field:
+                    self.cleaner_kinds.setdefault(field["name"], field["cleaner"])
+    
+    def standardize_field_name(self, raw_field_name):
+        """Convert a raw field name to its standardized equivalent."""
+        return self.field_mapping.get(normalize_field_name(raw_field_name), raw_field_name)
+    
+    def schema_type(self, equipment_type):
+        """Return the type whose required fields apply to equipment_type."""
+        return equipment_type if equipment_type in self.required_masks else DEFAULT_EQUIPMENT_TYPE
+    
+    def required_mask(self, equipment_type):
+        """Return the bitmask of the fields required for equipment_type."""
+        return self.required_masks.get(equipment_type, self.default_mask)
+    
+    def fields_mask(self, record):
+        """Return the bitmask of the known fields with a non-empty value in a record dict."""
+        field_bits = self.field_bits
+        mask = 0
+        for field, value in record.items():
+            if value:
+                mask |= field_bits.get(field, 0)
+        return mask
+    
+    def is_valid_mask(self, fields_mask, equipment_type):
+        """Return whether a fields mask includes every field required for equipment_type."""
+        required = self.required_masks.get(equipment_type, self.default_mask)
+        return fields_mask & required == required
+    
+    def has_required_fields(self, record, equipment_type):
+        """Return whether a record has a non-empty value for every field required for equipment_type."""
+        return self.is_valid_mask(self.fields_mask(record), equipment_type)
+    
+    def compile_cleaners(self, cleaners_by_kind):
+        """Return {field: cleaner function} from {cleaner kind: function}.
+        
+        Fields whose kind is not in cleaners_by_kind (or that have none) are
+        left out; callers fall back to their general cleaning for them.
+        """
+        return {
+            field: cleaners_by_kind[kind]
+            for field, kind in self.cleaner_kinds.items() if kind in cleaners_by_kind
+        }
+
+# The validator of the last schema tables compiled
+_validator = None
+
+def get_schema_validator():
+    """Return the SchemaValidator of equipment_schema.json, compiled again if the file changed."""
+    global _validator
+    tables = get_schema_tables()
+    if _validator is None or _validator.schema is not tables.schema:
+        _validator = SchemaValidator(tables)
+    return _validator
@@ -0,0 +1,205 @@
+"""
+Section Index Module
+
+This module finds the headings of a venue specification in a single pass over
+its text and splits the text into sections, each tagged with the equipment
+type its heading (or its parent heading) announces: lighting, sound, video, or
+None for chapters such as staging, power or rigging, table of contents entries
+and text before the first heading.
+
+Each line is examined once: a cheap shape test decides whether it can be a
+heading at all, and only then are its (few) words looked up in a keyword
+table, so building the index is linear in the size of the text however many
+keywords there are.
+"""
+
+from collections import namedtuple
+
+from line_lexer import HEADING, classify_line
+from pattern_registry import register
+
+# Heading words (or two-word phrases) that announce an equipment section
+HEADING_KEYWORDS = {
+    "lighting": [
+        "lighting", "light", "lights", "dimmer", "dimmers", "lantern", "lanterns",
+        "luminaire", "luminaires", "fixture", "fixtures", "followspot", "followspots"
+    ],
+    "sound": [
+        "sound", "audio", "loudspeaker", "loudspeakers", "speaker", "speakers",
+        "microphone", "microphones", "console", "consoles", "mixing desk", "pa system"
+    ],
+    "video": [
+        "video", "visual", "a v", "av", "projection", "projector", "projectors",
+        "screen", "screens", "display", "displays"
+    ]
+}
+
+# Heading words that start a chapter with no equipment type of its own
+BOUNDARY_WORDS = frozenset([
+    "power", "rigging", "staging", "stage", "dimensions", "specifications", "contents",
+    "introduction", "access", "seating", "machinery", "communications", "facilities",
+    "pianos", "safety"
+])
+
+# Words allowed in lower case within a title-case heading
+CONNECTOR_WORDS = frozenset(["&", "and", "of", "the", "for", "to", "-", "–", "/", "a/v"])
+
+# Longest heading title, in words
+MAX_HEADING_WORDS = 6
+
+# Words of a lower-cased heading title (see pattern_registry.py)
+TOKEN_PATTERN = register("section_index.token", r"[a-z0-9]+")
+# Table of contents entry: section number, title without digits, page number
+CONTENTS_ENTRY_PATTERN = register("section_index.contents_entry", r"\s*\d+(?:\.\d+)*\.?\s+[^\d\n]*[^\d\s][^\d\n]*?\s+\d+\s*")
+
+# A section of text: its equipment type, heading line, and offsets of the
+# heading line and of the section body (which runs up to the next heading)
+Section = namedtuple("Section", ["equipment_type", "heading", "heading_start", "start", "end"])
+
+class SectionIndex:
+    """Splits documents into typed sections at their headings."""
+    
+    def __init__(self, heading_keywords=HEADING_KEYWORDS, boundary_words=BOUNDARY_WORDS):
+        """Build the heading keyword lookup.
+        
+        heading_keywords maps each equipment type to the words or two-word
+        phrases that mark its headings; boundary_words end a section without
+        starting a typed one.
+        """
+        self.types = list(heading_keywords)
+        self.keyword_types = {}
+        for eq_type, keywords in heading_keywords.items():
+            for keyword in keywords:
+                self.keyword_types.setdefault(keyword.lower(), eq_type)
+        self.boundary_words = frozenset(word.lower() for word in boundary_words)
+    
+    def parse_heading(self, line):
+        """Return (section_number, title) if line looks like a heading, else None.
+        
+        Accepted are numbered headings ("6.1 Base Lighting Equipment"),
+        all-caps headings and short title-case lines, optionally with a
+        chapter number in front or a page number behind (as in a table of
+        contents). section_number is "" for unnumbered headings.
+        """
+        kind, text, body = classify_line(line)
+        if kind == HEADING and body and text != body:
+            # Dotted section number followed by the title
+            number = text[:len(text) - len(body)].strip()
+            words = body.split()
+        elif kind == HEADING and body:
+            number, words = "", body.split()
+        else:
+            words = text.split()
+            if not words or len(words) > MAX_HEADING_WORDS + 2 or text.endswith((".", ",", ";", ":")):
+                return None
+            number = ""
+            if words[0].isdigit() and len(words[0]) <= 2:
+                number = words[0]
+                words = words[1:]
+            if not words:
+                return None
+            for word in words:
+                if any(char.isdigit() for char in word):
+                    return None
+                if not word[0].isupper() and word.lower() not in CONNECTOR_WORDS:
+                    return None
+        
+        # Table of contents entries end with a page number
+        if words and words[-1].isdigit():
+            words = words[:-1]
+        if not words or len(words) > MAX_HEADING_WORDS:
+            return None
+        return number, " ".join(words)
+    
+    def heading_type(self, title):
+        """Classify a heading title.
+        
+        Returns the equipment type with the most keyword hits (the first type
+        listed on a tie), None for a boundary heading, or False if the
+        heading has no bearing on equipment type.
+        """
+        tokens = TOKEN_PATTERN.findall(title.lower())
+        scores = dict.fromkeys(self.types, 0)
+        for index, token in enumerate(tokens):
+            for key in (token, " ".join(tokens[index:index + 2])):
+                if key in self.keyword_types:
+                    scores[self.keyword_types[key]] += 1
+        
+        best = max(self.types, key=lambda eq_type: scores[eq_type])
+        if scores[best]:
+            return best
+        if any(token in self.boundary_words for token in tokens):
+            return None
+        return False
+    
+    @staticmethod
+    def is_contents_entry(line):
+        """Return whether a line is a table of contents entry.
+        
+        An entry is a section number, a title and a page number, as in "6.1
+        Base Lighting Equipment 18" or "7 Sound & Audio Visual 21". Without
+        the section number the line could as well be a table row such as
+        "Vinyl Chair 10".
+        """
+        return CONTENTS_ENTRY_PATTERN.fullmatch(line) is not None
+    
+    @staticmethod
+    def _parent_type(number, numbered_types):
+        """Return the type of the nearest numbered parent heading, or None."""
+        parent = number.rstrip(".")
+        while "." in parent:
+            parent = parent.rsplit(".", 1)[0]
+            if parent in numbered_types:
+                return numbered_types[parent]
+        return None
+    
+    def iter_sections(self, texts):
+        """Split a document given as an iterable of texts (e.g. pages) into sections.
+        
+        Yields (text, section) pairs, where the section's offsets refer to
+        text. Section types carry over from one text to the next. A numbered
+        sub-heading without equipment keywords of its own (e.g. "6.1.1
+        Control") takes the type of its closest numbered parent ("6.1"), if
+        any, unless it names a chapter of another kind (e.g. "6.1.3 Power").
+        Table of contents entries ("6.1 Base Lighting Equipment 18") end the
+        section before them but are left untyped, so that the list of
+        chapters is not taken for their contents.
+        """
+        equipment_type = None
+        numbered_types = {}
+        
+        for text in texts:
+            heading, heading_start, start = "", 0, 0
+            offset = 0
+            for line in text.split("\n"):
+                line_start = offset
+                offset += len(line) + 1
+                
+                parsed = self.parse_heading(line)
+                if not parsed:
+                    continue
+                number, title = parsed
+                line_type = self.heading_type(title)
+                
+                if line_type is False and not number:
+                    continue
+                if self.is_contents_entry(line):
+                    line_type = None
+                else:
+                    if line_type is False:
+                        # Sub-sections without a keyword of their own stay in their chapter
+                        line_type = self._parent_type(number, numbered_types)
+                    if number:
+                        numbered_types[number.rstrip(".")] = line_type
+                
+                if line_start > heading_start or heading:
+                    yield text, Section(equipment_type, heading, heading_start, start, line_start)
+                equipment_type = line_type
+                heading, heading_start, start = line.strip(), line_start, min(offset, len(text))
+            
+            if len(text) > heading_start or heading:
+                yield text, Section(equipment_type, heading, heading_start, start, len(text))
+    
+    def build(self, text):
+        """Return the sections of a single text, in order."""
+        return [section for _, section in self.iter_sections([text])]
@@ -0,0 +1,176 @@
+"""
+Spec Scanner Module
+
+This module pulls the technical specifications of a piece of equipment (power,
+DMX channels, frequency response and resolution) out of its text in a single
+pass. One combined pattern, with a named group per specification, is tried at
+the start of every number in the text; the first occurrence of each
+specification is kept, which is what searching for each of them separately
+would find.
+
+Values come back as SpecValue strings in canonical form ("750W", "16",
+"20-20000 Hz", "1920x1080") that also carry their parsed numbers and units,
+so DataStandardizer can take them as they are instead of parsing the text
+again. scan_spec_columns does the same for a whole Series of texts at once,
+returning a column of canonical strings per specification.
+"""
+
+import pandas as pd
+
+from pattern_registry import register
+
+# Specifications the scanner looks for, by field name
+SPEC_FIELDS = frozenset(["power", "dmx_channels", "frequency_response", "resolution"])
+
+# At the start of a number, each lookahead captures the specification
+# starting there, if any
+SPEC_PATTERN = register(
+    "spec.all",
+    r"(?<!\d)(?=\d)"
+    r"(?=(?P<power>(?P<power_value>\d+(?:\.\d+)?)\s*(?P<power_unit>[kK]?[wW]))?)"
+    r"(?=(?:(?P<dmx_channels>\d+)\s*(?i:ch|channel|dmx))?)"
+    r"(?=(?P<frequency_response>(?P<low>\d+(?:\.\d+)?)\s*(?P<low_unit>(?i:k?hz))\s*[-–]\s*"
+    r"(?P<high>\d+(?:\.\d+)?)\s*(?P<high_unit>(?i:k?hz)))?)"
+    r"(?=(?P<resolution>(?P<width>\d+)\s*[x×]\s*(?P<height>\d+))?)"
+)
+
+def _number(text):
+    """Return the int or float written in text."""
+    return float(text) if "." in text else int(text)
+
+def _format_number(number):
+    """Format a number without a trailing .0."""
+    number = round(number, 6)
+    return str(int(number)) if number == int(number) else str(number)
+
+class SpecValue(str):
+    """A specification in canonical text form, with its parsed parts as attributes."""
+    
+    def __new__(cls, text, **parts):
+        value = super().__new__(cls, text)
+        value.__dict__.update(parts)
+        return value
+
+class Power(SpecValue):
+    """A power rating such as "750W" or "2.5kW": value in unit ("W" or "kW")."""
+    
+    @property
+    def watts(self):
+        return self.value * 1000 if self.unit == "kW" else self.value
+
+class Channels(SpecValue):
+    """A DMX channel count such as "16"."""
+
+class FrequencyRange(SpecValue):
+    """A frequency response, e.g. "20-20000 Hz" for 20Hz - 20kHz.
+    
+    low and high are in low_unit and high_unit ("Hz" or "kHz") as written;
+    the text and low_hz/high_hz give both ends in Hz.
+    """
+    
+    @property
+    def low_hz(self):
+        return self.low * 1000 if self.low_unit == "kHz" else self.low
+    
+    @property
+    def high_hz(self):
+        return self.high * 1000 if self.high_unit == "kHz" else self.high
+
+class Resolution(SpecValue):
+    """A display resolution such as "1920x1080"."""
+
+def _power(match):
+    value_text = match.group("power_value")
+    unit = "kW" if match.group("power_unit")[0] in "kK" else "W"
+    return Power(value_text + unit, value=_number(value_text), unit=unit)
+
+def _hertz(number_text, unit):
+    """Return (number, unit, text in Hz) for one end of a frequency range."""
+    unit = "kHz" if unit.lower() == "khz" else "Hz"
+    number = _number(number_text)
+    if unit == "Hz":
+        return number, unit, number_text
+    return number, unit, _format_number(number * 1000)
+
+def _frequency_range(match):
+    low, low_unit, low_text = _hertz(match.group("low"), match.group("low_unit"))
+    high, high_unit, high_text = _hertz(match.group("high"), match.group("high_unit"))
+    return FrequencyRange(f"{low_text}-{high_text} Hz", low=low, low_unit=low_unit,
+                          high=high, high_unit=high_unit)
+
+def _resolution(match):
+    """Return the resolution, or None if it is too small to be one (e.g. "2x 4")."""
+    width, height = int(match.group("width")), int(match.group("height"))
+    if width > 100 and height > 100:
+        return Resolution(f"{width}x{height}", width=width, height=height)
+    return None
+
+def _channels(match):
+    count_text = match.group("dmx_channels")
+    return Channels(count_text, count=int(count_text))
+
+# Value builders by field, in the order fields are returned
+_BUILDERS = {
+    "power": _power,
+    "dmx_channels": _channels,
+    "frequency_response": _frequency_range,
+    "resolution": _resolution,
+}
+
+def scan_specs(text, fields=SPEC_FIELDS):
+    """Return {field: SpecValue} for the specifications in text.
+    
+    Only the given fields are looked for. For each, the first occurrence in
+    text counts; a first resolution that is too small to be one means no
+    resolution.
+    """
+    found = {}
+    remaining = [field for field in _BUILDERS if field in fields]
+    if not text or not remaining:
+        return found
+    
+    for match in SPEC_PATTERN.finditer(text):
+        for field in remaining:
+            if match.group(field) is not None:
+                found[field] = _BUILDERS[field](match)
+        remaining = [field for field in remaining if field not in found]
+        if not remaining:
+            break
+    return {field: found[field] for field in _BUILDERS if found.get(field) is not None}
+
+def _kilohertz_to_hertz(number_text):
+    return _format_number(_number(number_text) * 1000)
+
+def scan_spec_columns(texts):
+    """Return a DataFrame with a column per specification for a Series of texts.
+    
+    Rows have the index of texts and hold the canonical text scan_specs
+    gives for each field (NaN where there is none); all fields are looked
+    for. The pattern runs over every text in one extractall call, and the
+    first non-missing value of each group per text is the first occurrence.
+    """
+    columns = pd.DataFrame(index=texts.index, columns=list(_BUILDERS), dtype=object)
+    matches = texts.str.extractall(SPEC_PATTERN.pattern, SPEC_PATTERN.flags)
+    if matches.empty:
+        return columns
+    first = matches.groupby(level=0).first().reindex(texts.index).astype(object)
+    
+    kilo = first["power_unit"].str[0].str.lower() == "k"
+    columns["power"] = first["power_value"] + kilo.map({True: "kW", False: "W"})
+    
+    columns["dmx_channels"] = first["dmx_channels"]
+    
+    ends = []
+    for number, unit in [("low", "low_unit"), ("high", "high_unit")]:
+        hertz = first[number].copy()
+        khz = first[unit].str.lower() == "khz"
+        hertz[khz] = first[number][khz].map(_kilohertz_to_hertz)
+        ends.append(hertz)
+    columns["frequency_response"] = ends[0] + "-" + ends[1] + " Hz"
+    
+    found = first["resolution"].notna()
+    width = first["width"][found].map(int)
+    height = first["height"][found].map(int)
+    valid = width.index[(width > 100) & (height > 100)]
+    columns.loc[valid, "resolution"] = width[valid].astype(str) + "x" + height[valid].astype(str)
+    return columns.where(columns.notna())
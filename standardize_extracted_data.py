@@ -9,11 +9,21 @@ import sys
 import json
 import pandas as pd
 from pathlib import Path
-import re
 
 # Add the schema directory to the path
 sys.path.insert(0, str(Path(__file__).parent))
-from schema.field_mapping import standardize_field_name, determine_equipment_type, load_schema
+from pattern_registry import register
+import regex_engine as re
+from schema.manufacturer_catalog import get_manufacturer_catalog
+
+# Named patterns (see pattern_registry.py)
+MODEL_PREFIX_PATTERN = register("model.prefix", r'^(Type|Model|Name|Description|Item)\s*[:;-]\s*', re.IGNORECASE)
+WHITESPACE_PATTERN = register("text.whitespace", r'\s+')
+NUMBER_PATTERN = register("value.number", r'(\d+)')
+MANUFACTURER_PATTERNS = [
+    register("extracted.manufacturer_before_model", r'^([A-Z][a-zA-Z\s&]+?)\s+[A-Z0-9\-]+'),  # Brand followed by model number
+    register("extracted.manufacturer_words", r'([A-Z][a-zA-Z\s&]+)\s+'),  # Any capitalized words at the beginning
+]
 
 def clean_model_name(model_text):
     """Clean and standardize model names."""
@@ -21,13 +31,13 @@ def clean_model_name(model_text):
         return ""
     
     # Remove common prefixes like "Type: ", "Model: ", etc.
-    model_text = re.sub(r'^(Type|Model|Name|Description|Item)\s*[:;-]\s*', '', model_text, flags=re.IGNORECASE)
+    model_text = MODEL_PREFIX_PATTERN.sub('', model_text)
     
     # Remove any trailing punctuation
     model_text = model_text.strip('.,:;-')
     
     # Remove any excessive whitespace
-    model_text = re.sub(r'\s+', ' ', model_text).strip()
+    model_text = WHITESPACE_PATTERN.sub(' ', model_text).strip()
     
     return model_text
 
@@ -42,7 +52,7 @@ def standardize_quantity(quantity_text):
     
     # Extract numeric value from text
     quantity_text = str(quantity_text)
-    match = re.search(r'(\d+)', quantity_text)
+    match = NUMBER_PATTERN.search(quantity_text)
     if match:
         return match.group(1)
     
@@ -53,27 +63,20 @@ def extract_manufacturer(model_text):
     if not model_text or not isinstance(model_text, str):
         return ""
     
-    # Common manufacturer patterns
-    manufacturers = [
-        "ETC", "Martin", "Robe", "Chauvet", "Elation", "Clay Paky", "High End", "Vari-Lite",  # Lighting
-        "L-Acoustics", "d&b audiotechnik", "Meyer Sound", "JBL", "Yamaha", "Shure", "Sennheiser", "DPA",  # Sound
-        "Christie", "Barco", "Epson", "Sony", "Panasonic", "Samsung", "LG", "NEC"  # Video
-    ]
-    
-    # Check for manufacturer names at the beginning of the model text
-    for manufacturer in manufacturers:
-        pattern = r'^' + re.escape(manufacturer) + r'\s+'
-        if re.search(pattern, model_text, re.IGNORECASE):
-            return manufacturer
-    
-    # Check for other patterns
-    patterns = [
-        r'^([A-Z][a-zA-Z\s&]+?)\s+[A-Z0-9\-]+',  # Brand followed by model number
-        r'([A-Z][a-zA-Z\s&]+)\s+'  # Any capitalized words at the beginning
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, model_text)
+    # Check for known manufacturer names at the beginning of the model text
+    match = get_manufacturer_catalog().match_prefix(model_text, followed_by_space=True)
+    if match:
+        return match.name
+    
+    return guess_manufacturer(model_text)
+
+def guess_manufacturer(model_text):
+    """Guess an unknown manufacturer from the capitalized words starting model text."""
+    if not model_text or not isinstance(model_text, str):
+        return ""
+    
+    for pattern in MANUFACTURER_PATTERNS:
+        match = pattern.search(model_text)
         if match:
             potential_manufacturer = match.group(1).strip()
             if len(potential_manufacturer) > 2 and len(potential_manufacturer) < 20:
@@ -119,10 +122,17 @@ def process_equipment_data(venue_name, equipment_type, csv_path):
                 item['quantity'] = ""
             
             # Try to extract manufacturer
-            item['manufacturer'] = extract_manufacturer(item['model'])
-            if item['manufacturer']:
-                # Remove manufacturer from model name to avoid duplication
-                item['model'] = re.sub(r'^' + re.escape(item['manufacturer']) + r'\s+', '', item['model'], flags=re.IGNORECASE)
+            known = get_manufacturer_catalog().match_prefix(item['model'], followed_by_space=True)
+            if known:
+                # Remove the manufacturer as spelled in the model text (possibly an alias)
+                item['manufacturer'] = known.name
+                item['model'] = item['model'][known.end:].lstrip()
+            else:
+                # Not a known manufacturer, so only the patterns are left to try
+                item['manufacturer'] = guess_manufacturer(item['model'])
+                if item['manufacturer']:
+                    # Remove manufacturer from model name to avoid duplication
+                    item['model'] = re.sub(r'^' + re.escape(item['manufacturer']) + r'\s+', '', item['model'], flags=re.IGNORECASE)
             
             # Add equipment type
             item['equipment_type'] = equipment_type